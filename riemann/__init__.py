@@ -1,27 +1,96 @@
+import sys
+import types
+import contextlib
+import contextvars
+
 from riemann import networks
 
-network = networks.get_network('bitcoin_main')
+from typing import Iterator, Optional, Type, Union
+
+# The network used outside of any network_context
+_selected_network = networks.get_network('bitcoin_main')
+
+# The network_context override for the current thread or asyncio task
+_context_network: 'contextvars.ContextVar[Optional[Type[networks.Network]]]' \
+    = contextvars.ContextVar('riemann_network', default=None)
 
 
 def select_network(name: str):
     '''
-    Set the library to use a supported network
+    Set the library to use a supported network. This applies to every thread
+    and asyncio task, except inside a network_context.
 
     Examples:
 
     - bitcon_main
     - litecoin_test
     - zcash_sapling_main
+
+    Clears the address caches, if enabled.
+    '''
+    global _selected_network
+    _selected_network = networks.get_network(name)
+    # Imported here, as addresses imports riemann
+    from riemann.encoding import addresses
+    addresses.clear_cache()
+
+
+@contextlib.contextmanager
+def network_context(
+        network: Union[str, Type[networks.Network]]
+) -> Iterator[Type[networks.Network]]:
+    '''
+    Use a supported network for the duration of the block. Unlike
+    select_network, this only affects the current thread or asyncio task, so
+    workers can use different networks concurrently. Contexts may be nested.
+    Accepts a network name or a network class.
+
+    Example:
+
+        with riemann.network_context('litecoin_main'):
+            address = addresses.make_p2wpkh_address(pubkey)
     '''
-    global network
-    network = networks.get_network(name)
+    if isinstance(network, str):
+        network = networks.get_network(network)
+    token = _context_network.set(network)
+    try:
+        yield _context_network.get()
+    finally:
+        _context_network.reset(token)
 
 
-def get_current_network() -> networks.Network:
+def get_current_network() -> Type[networks.Network]:
     '''Return the current network as a class'''
-    return network
+    return _context_network.get() or _selected_network
 
 
 def get_current_network_name() -> str:
     '''Return the name of the current network'''
+    return get_network_name(get_current_network())
+
+
+def get_network_name(network: Type[networks.Network]) -> str:
+    '''Return the name of a network class, e.g. bitcoin_main'''
     return '{}_{}'.format(network.NETWORK_NAME, network.SUBNET_NAME)
+
+
+class _RiemannModule(types.ModuleType):
+    '''
+    The riemann module, with riemann.network as a read-only property.
+    Assigning to it would shadow the current network without selecting it.
+    '''
+
+    @property
+    def network(self) -> Type[networks.Network]:
+        # Resolved on each access, so it respects the network_context of the
+        # calling thread or task
+        return get_current_network()
+
+    @network.setter
+    def network(self, value):
+        raise AttributeError(
+            'riemann.network is read-only. Use riemann.select_network or '
+            'riemann.network_context to change the network.')
+
+
+sys.modules[__name__].__class__ = _RiemannModule
@@ -0,0 +1,24 @@
+'''
+Benchmarks for riemann's hot paths. Each module exposes a `run` function
+returning a dict of results keyed by benchmark name.
+
+Run everything and emit JSON with:
+    python -m riemann.benchmarks
+'''
+import timeit
+
+from typing import Callable, Optional
+
+
+def seconds_per_call(fn: Callable[[], object],
+                     number: Optional[int] = None,
+                     repeat: int = 3) -> float:
+    '''
+    Times `repeat` batches of `number` calls to fn, and returns the mean
+    wall-clock time per call of the fastest batch. If number is None, it is
+    chosen so that a batch takes at least 0.2 seconds.
+    '''
+    timer = timeit.Timer(fn)
+    if number is None:
+        number = timer.autorange()[0]
+    return min(timer.repeat(repeat=repeat, number=number)) / number
@@ -0,0 +1,95 @@
+'''
+Runs the benchmark suite and emits the results as JSON.
+
+Run with:
+    python -m riemann.benchmarks [--quick] [--output FILE] [SUITE ...]
+
+Timing results are mean seconds per call, or per address for `addresses`.
+BLAKE-256 results are MB/s. Memory results are bytes per object, except
+`memory.mempool_mib`. Coin selection results are seconds per selection.
+'''
+import sys
+import json
+import argparse
+import datetime
+import platform
+
+from riemann import blake256 as blake256_module
+from riemann.benchmarks import (
+    addresses, blake256, coin_selection, construction, encoding, memory,
+    parsing, sighash)
+
+from typing import Any, Dict, List, Optional
+
+SUITES = {
+    'parsing': parsing.run,
+    'sighash': sighash.run,
+    'encoding': encoding.run,
+    'blake256': blake256.run,
+    'construction': construction.run,
+    'memory': memory.run,
+    'addresses': addresses.run,
+    'coin_selection': coin_selection.run,
+}
+
+# Smaller workloads for smoke-testing the suite, e.g. in CI
+QUICK_ARGS: Dict[str, Dict[str, int]] = {
+    'parsing': {'number': 100},
+    'sighash': {'number': 100},
+    'encoding': {'number': 100, 'batch': 1_000},
+    'blake256': {'number': 5},
+    'construction': {'count': 10_000},
+    'memory': {'copies': 100},
+    'addresses': {'count': 1_000},
+    'coin_selection': {'count': 1_000},
+}
+
+
+def run(suites: List[str], quick: bool = False) -> Dict[str, Any]:
+    '''
+    Runs the named suites, and returns the results with metadata describing
+    the environment they were measured in
+    '''
+    results: Dict[str, float] = {}
+    for name in suites:
+        results.update(SUITES[name](**(QUICK_ARGS[name] if quick else {})))
+    return {
+        'timestamp': datetime.datetime.utcnow().isoformat() + 'Z',
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'blake256_backend': blake256_module.BACKEND,
+        'quick': quick,
+        'results': results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m riemann.benchmarks',
+        description='Run riemann benchmarks and emit JSON results.')
+    parser.add_argument(
+        'suites', nargs='*', metavar='SUITE',
+        help='suites to run: {}. Default: all'.format(', '.join(SUITES)))
+    parser.add_argument(
+        '--quick', action='store_true',
+        help='use small workloads to check the suite runs')
+    parser.add_argument(
+        '--output', metavar='FILE',
+        help='write the JSON to FILE instead of stdout')
+    args = parser.parse_args(argv)
+    unknown = [s for s in args.suites if s not in SUITES]
+    if unknown:
+        parser.error('unknown suite(s): {}'.format(', '.join(unknown)))
+
+    report = run(args.suites or list(SUITES), args.quick)
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write('\n')
+    else:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
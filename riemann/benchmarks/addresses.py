@@ -0,0 +1,48 @@
+'''
+Times batch address derivation against a per-call loop.
+
+Run with:
+    python -m riemann.benchmarks.addresses
+'''
+import os
+import riemann
+from riemann import utils
+from riemann.encoding import addresses
+from riemann.benchmarks import seconds_per_call
+
+from typing import Dict
+
+# The number of addresses derived by each benchmark
+COUNT = 20_000
+
+
+def run(count: int = COUNT) -> Dict[str, float]:
+    '''
+    Returns the mean seconds per derived address, keyed by benchmark name
+    '''
+    # Any 33 bytes hash like a compressed pubkey
+    pubkeys = [b'\x02' + utils.sha256(i.to_bytes(4, 'big'))
+               for i in range(count)]
+    processes = os.cpu_count() or 1
+
+    results = {}
+    with riemann.network_context('bitcoin_main'):
+        for kind, witness in [('p2pkh', False), ('p2wpkh', True)]:
+            results['addresses.{}_loop'.format(kind)] = seconds_per_call(
+                lambda: [addresses.make_pkh_address(p, witness=witness)
+                         for p in pubkeys],
+                1) / count
+            results['addresses.{}_batch'.format(kind)] = seconds_per_call(
+                lambda: addresses.make_pkh_addresses(
+                    pubkeys, witness=witness),
+                1) / count
+            results['addresses.{}_pool'.format(kind)] = seconds_per_call(
+                lambda: addresses.make_pkh_addresses(
+                    pubkeys, witness=witness, processes=processes),
+                1) / count
+    return results
+
+
+if __name__ == '__main__':
+    for name, value in run().items():
+        print('{:<32} {:>12.3f} us'.format(name, value * 1e6))
@@ -0,0 +1,37 @@
+'''
+Measures BLAKE-256 throughput for each available backend.
+
+Run with:
+    python -m riemann.benchmarks.blake256
+'''
+from riemann import blake256
+from riemann.benchmarks import seconds_per_call
+
+from typing import Dict, Optional
+
+# Message sizes in bytes: a tx prefix, and a large tx
+SIZES = [256, 65536]
+
+
+def run(number: Optional[int] = None) -> Dict[str, float]:
+    '''
+    Returns the throughput in MB/s, keyed by benchmark name
+    '''
+    backends = {'python': blake256.python_blake_hash}
+    if blake256.native_blake_hash is not None:
+        backends['native'] = blake256.native_blake_hash
+
+    results = {}
+    for name, blake_hash in backends.items():
+        for size in SIZES:
+            data = bytes(size)
+            seconds = seconds_per_call(lambda: blake_hash(data), number)
+            key = 'blake256.{}_{}_mb_per_s'.format(name, size)
+            results[key] = size / seconds / 1e6
+    return results
+
+
+if __name__ == '__main__':
+    print('backend: {}'.format(blake256.BACKEND))
+    for name, value in run().items():
+        print('{:<40} {:>12.2f} MB/s'.format(name, value))
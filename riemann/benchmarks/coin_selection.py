@@ -0,0 +1,77 @@
+'''
+Times coin selection from synthetic UTXO sets.
+
+Run with:
+    python -m riemann.benchmarks.coin_selection
+'''
+import random
+from riemann import tx, utils
+from riemann.tx import coin_selection
+from riemann.benchmarks import seconds_per_call
+
+from typing import Dict, List, Optional
+
+# The number of UTXOs in the wallet
+COUNT = 100_000
+
+# The feerate, in satoshi per vbyte
+FEERATE = 10
+
+OUTPUT_SCRIPT = b'\x00\x14' + b'\x22' * 20
+CHANGE_SCRIPT = b'\x00\x14' + b'\x33' * 20
+
+
+def make_utxos(count: int, seed: int = 0) -> List[coin_selection.Utxo]:
+    '''
+    A wallet of mixed input types, with log-uniform values from 1_000 to
+    10_000_000 satoshi
+    '''
+    rng = random.Random(seed)
+    input_types = list(tx.INPUT_SIZES)
+    return [
+        coin_selection.Utxo(
+            tx.Outpoint(utils.sha256(i.to_bytes(4, 'big')), b'\x00' * 4),
+            int(10 ** rng.uniform(3, 7)),
+            rng.choice(input_types))
+        for i in range(count)]
+
+
+def run(count: int = COUNT) -> Dict[str, float]:
+    '''
+    Returns the mean seconds per selection, keyed by benchmark name
+    '''
+    utxos = make_utxos(count)
+    outputs = {
+        # Met by one or a few UTXOs
+        'small': [tx.TxOut(utils.i2le_padded(500_000, 8), OUTPUT_SCRIPT)],
+        # Needs many UTXOs
+        'large': [tx.TxOut(utils.i2le_padded(50_000_000, 8), OUTPUT_SCRIPT)],
+    }
+
+    results = {}
+    for size, outs in outputs.items():
+        for strategy in coin_selection.STRATEGIES:
+            results['coin_selection.{}_{}'.format(strategy, size)] = \
+                seconds_per_call(
+                    lambda: _select(utxos, outs, strategy), 1)
+        results['coin_selection.default_{}'.format(size)] = \
+            seconds_per_call(lambda: _select(utxos, outs, None), 1)
+    return results
+
+
+def _select(
+        utxos: List[coin_selection.Utxo],
+        outputs: List[tx.TxOut],
+        strategy: Optional[str]) -> None:
+    try:
+        coin_selection.select_coins(
+            utxos, outputs, FEERATE, CHANGE_SCRIPT, strategy,
+            rng=random.Random(0))
+    except ValueError:
+        # No changeless solution, or none within the weight limit
+        pass
+
+
+if __name__ == '__main__':
+    for name, value in run().items():
+        print('{:<40} {:>12.3f} ms'.format(name, value * 1e3))
@@ -0,0 +1,42 @@
+'''
+Times construction of transaction components.
+
+Run with:
+    python -m riemann.benchmarks.construction
+'''
+from riemann import tx
+from riemann.tests import helpers
+from riemann.benchmarks import seconds_per_call
+
+from typing import Dict
+
+# The number of objects built by each benchmark
+COUNT = 1_000_000
+
+
+def run(count: int = COUNT) -> Dict[str, float]:
+    '''
+    Returns the mean seconds per constructed object, keyed by benchmark name
+    '''
+    value = helpers.P2PKH1['ser']['outs'][0]['value']
+    output_script = helpers.P2PKH1['ser']['outs'][0]['pk_script']
+    outpoint = tx.Outpoint(
+        helpers.P2PKH1['ser']['ins'][0]['hash'],
+        helpers.P2PKH1['ser']['ins'][0]['index'])
+    stack_script = helpers.P2PKH1['ser']['ins'][0]['stack_script']
+    sequence = helpers.P2PKH1['ser']['ins'][0]['sequence']
+
+    return {
+        'construction.tx_out': seconds_per_call(
+            lambda: tx.TxOut(value, output_script), count, repeat=1),
+        'construction.tx_in': seconds_per_call(
+            lambda: tx.TxIn(outpoint, stack_script, b'', sequence),
+            count // 10, repeat=1),
+        'construction.var_int': seconds_per_call(
+            lambda: tx.VarInt(0x1234), count // 10, repeat=1),
+    }
+
+
+if __name__ == '__main__':
+    for name, value in run().items():
+        print('{:<32} {:>12.3f} us'.format(name, value * 1e6))
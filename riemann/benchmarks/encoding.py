@@ -0,0 +1,100 @@
+'''
+Times address encodings and script serialization.
+
+Run with:
+    python -m riemann.benchmarks.encoding
+'''
+import riemann
+from riemann import utils
+from riemann.tests import helpers
+from riemann.script import classify, examples, serialization, templates
+from riemann.encoding import base58, bech32, cashaddr
+from riemann.benchmarks import seconds_per_call
+
+from typing import Callable, Dict, List, Optional
+
+# The number of addresses encoded and decoded by each batch benchmark
+BATCH = 1_000_000
+
+
+def _encode_decode(prefix: str,
+                   encode: Callable,
+                   decode: Callable,
+                   encoded: str,
+                   number: Optional[int]) -> Dict[str, float]:
+    decoded = decode(encoded)
+    return {
+        '{}_encode'.format(prefix): seconds_per_call(
+            lambda: encode(decoded), number),
+        '{}_decode'.format(prefix): seconds_per_call(
+            lambda: decode(encoded), number),
+    }
+
+
+def _encode_decode_many(prefix: str,
+                        encode_many: Callable,
+                        decode_many: Callable,
+                        datas: List[bytes]) -> Dict[str, float]:
+    encoded = encode_many(datas)
+    return {
+        '{}_encode_many'.format(prefix): seconds_per_call(
+            lambda: encode_many(datas), 1, repeat=1) / len(datas),
+        '{}_decode_many'.format(prefix): seconds_per_call(
+            lambda: decode_many(encoded), 1, repeat=1) / len(datas),
+    }
+
+
+def run(number: Optional[int] = None,
+        batch: int = BATCH) -> Dict[str, float]:
+    '''
+    Returns the mean seconds per call, keyed by benchmark name. The batch
+    benchmarks return the mean seconds per address.
+    '''
+    hashes = [utils.sha256(i.to_bytes(4, 'big'))[:20] for i in range(batch)]
+
+    results = {}
+    with riemann.network_context('bitcoin_main'):
+        results.update(_encode_decode(
+            'encoding.base58', base58.encode, base58.decode,
+            helpers.ADDR[0]['p2pkh'], number))
+        results.update(_encode_decode(
+            'encoding.bech32', bech32.encode, bech32.decode,
+            helpers.P2WPKH_ADDR['address'], number))
+        results.update(_encode_decode_many(
+            'encoding.base58', base58.encode_many, base58.decode_many,
+            [b'\x00' + h for h in hashes]))
+        results.update(_encode_decode_many(
+            'encoding.bech32', bech32.encode_many, bech32.decode_many,
+            [b'\x00\x14' + h for h in hashes]))
+
+    with riemann.network_context('bitcoin_cash_main'):
+        results.update(_encode_decode(
+            'encoding.cashaddr', cashaddr.encode, cashaddr.decode,
+            helpers.CASHADDR['p2pkh'], number))
+        results.update(_encode_decode_many(
+            'encoding.cashaddr', cashaddr.encode_many, cashaddr.decode_many,
+            [b'\x00' + h for h in hashes]))
+
+    script = helpers.MSIG_2_2['redeem_script']
+    serialized = helpers.MSIG_2_2['ser_script']
+    results['encoding.script_serialize'] = seconds_per_call(
+        lambda: serialization.serialize(script), number)
+    results['encoding.script_deserialize'] = seconds_per_call(
+        lambda: serialization.deserialize(serialized), number)
+    results['encoding.script_round_trip'] = seconds_per_call(
+        lambda: serialization.serialize(
+            serialization.deserialize(serialized)),
+        number)
+
+    pks = [pk['pk'] for pk in helpers.PK['ser']]
+    template = templates.compile_template(examples.msig_two_two)
+    results['encoding.script_template_fill'] = seconds_per_call(
+        lambda: template.fill(pk0=pks[0], pk1=pks[1]), number)
+    results['encoding.classify_output_script'] = seconds_per_call(
+        lambda: classify.classify_output_script(serialized), number)
+    return results
+
+
+if __name__ == '__main__':
+    for name, value in run().items():
+        print('{:<40} {:>12.3f} us'.format(name, value * 1e6))
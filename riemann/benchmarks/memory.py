@@ -0,0 +1,72 @@
+'''
+Measures the memory held by parsed transactions and their components.
+
+Run with:
+    python -m riemann.benchmarks.memory
+'''
+import gc
+import tracemalloc
+
+from riemann import tx
+from riemann.tests import helpers
+
+from typing import Callable, Dict, List, Sequence
+
+FIXTURES = [
+    helpers.P2PKH1['ser']['tx']['signed'],
+    helpers.P2SH['ser']['tx']['signed'],
+    helpers.P2WPKH['ser']['tx']['signed'],
+    helpers.P2WSH['ser']['tx']['signed']]
+
+# How many transactions a mempool-sized workload holds
+MEMPOOL_SIZE = 300_000
+
+
+def bytes_per_object(make: Callable[[bytes], object],
+                     raw: Sequence[bytes],
+                     copies: int = 1000) -> float:
+    '''
+    Parses `copies` copies of each serialized object and returns the mean
+    number of bytes allocated and still held per parsed object. The input
+    bytestrings are allocated beforehand, so they are not counted.
+    '''
+    raw = [bytes(r) for _ in range(copies) for r in raw]
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        parsed: List[object] = [make(r) for r in raw]
+        held = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return held / len(parsed)
+
+
+def run(copies: int = 1000) -> Dict[str, float]:
+    '''
+    Returns the mean bytes held per parsed object, keyed by benchmark name
+    '''
+    tx_ins = [t.tx_ins[0].to_bytes()
+              for t in map(tx.Tx.from_bytes, FIXTURES)]
+    tx_outs = [t.tx_outs[0].to_bytes()
+               for t in map(tx.Tx.from_bytes, FIXTURES)]
+    outpoints = [i[:36] for i in tx_ins]
+
+    per_tx = bytes_per_object(tx.Tx.from_bytes, FIXTURES, copies)
+    return {
+        'memory.outpoint_bytes': bytes_per_object(
+            tx.Outpoint.from_bytes, outpoints, copies),
+        'memory.tx_in_bytes': bytes_per_object(
+            tx.TxIn.from_bytes, tx_ins, copies),
+        'memory.tx_out_bytes': bytes_per_object(
+            tx.TxOut.from_bytes, tx_outs, copies),
+        'memory.tx_bytes': per_tx,
+        'memory.serialized_tx_bytes': (
+            sum(len(f) for f in FIXTURES) / len(FIXTURES)),
+        'memory.mempool_mib': per_tx * MEMPOOL_SIZE / 2 ** 20,
+    }
+
+
+if __name__ == '__main__':
+    for name, value in run().items():
+        print('{:<32} {:>12.1f}'.format(name, value))
@@ -0,0 +1,36 @@
+'''
+Times transaction parsing and serialization.
+
+Run with:
+    python -m riemann.benchmarks.parsing
+'''
+from riemann import tx
+from riemann.tests import helpers
+from riemann.benchmarks import seconds_per_call
+
+from typing import Dict, Optional
+
+FIXTURES = {
+    'p2pkh': helpers.P2PKH1['ser']['tx']['signed'].hex(),
+    'p2sh': helpers.P2SH['ser']['tx']['signed'].hex(),
+    'p2wpkh': helpers.P2WPKH['ser']['tx']['signed'].hex(),
+    'p2wsh': helpers.P2WSH['ser']['tx']['signed'].hex()}
+
+
+def run(number: Optional[int] = None) -> Dict[str, float]:
+    '''
+    Returns the mean seconds per call, keyed by benchmark name
+    '''
+    results = {}
+    for name, hex_tx in FIXTURES.items():
+        t = tx.Tx.from_hex(hex_tx)
+        results['parsing.from_hex.{}'.format(name)] = seconds_per_call(
+            lambda: tx.Tx.from_hex(hex_tx), number)
+        results['parsing.to_bytes.{}'.format(name)] = seconds_per_call(
+            t.to_bytes, number)
+    return results
+
+
+if __name__ == '__main__':
+    for name, value in run().items():
+        print('{:<40} {:>12.3f} us'.format(name, value * 1e6))
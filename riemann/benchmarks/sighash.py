@@ -0,0 +1,102 @@
+'''
+Times signature hash computation for each supported digest algorithm.
+
+Run with:
+    python -m riemann.benchmarks.sighash
+'''
+import riemann
+from riemann import tx, utils
+from riemann.tests import helpers
+from riemann.tests.tx.helpers import decred_helpers, sapling_helpers
+from riemann.benchmarks import seconds_per_call
+
+from typing import Dict, Optional
+
+
+def _decred_tx() -> tx.DecredTx:
+    # DecredTx can't be parsed yet, so assemble it from the fixture's parts
+    ser = decred_helpers.DCR['ser']
+    outpoint = tx.DecredOutpoint(
+        ser['ins'][0]['hash'], ser['ins'][0]['index'], ser['ins'][0]['tree'])
+    witness = ser['witnesses'][0]
+    return tx.DecredTx(
+        version=ser['version'],
+        tx_ins=[tx.DecredTxIn(outpoint, ser['ins'][0]['sequence'])],
+        tx_outs=[tx.DecredTxOut(ser['outs'][0]['value'],
+                                ser['outs'][0]['version'],
+                                ser['outs'][0]['pk_script'])],
+        lock_time=ser['locktime'],
+        expiry=ser['expiry'],
+        tx_witnesses=[tx.DecredInputWitness(
+            value=witness['value'],
+            height=witness['height'],
+            index=witness['index'],
+            stack_script=witness['stack_script'],
+            redeem_script=witness['redeem_script'])])
+
+
+def run(number: Optional[int] = None) -> Dict[str, float]:
+    '''
+    Returns the mean seconds per call, keyed by benchmark name.
+
+    The `cold` variants parse a fresh Tx for every call, so they include the
+    intermediate hashes a Tx caches after its first sighash.
+    '''
+    results = {}
+
+    legacy = helpers.P2PKH1['ser']['tx']['signed']
+    legacy_script = helpers.P2PKH1['ser']['ins'][0]['pk_script']
+    parsed = tx.Tx.from_bytes(legacy)
+    # Parsed txs carry an empty witness tuple, so rebuild without witnesses
+    t = tx.Tx(parsed.version, None, parsed.tx_ins, parsed.tx_outs, None,
+              parsed.lock_time)
+    results['sighash.legacy_all'] = seconds_per_call(
+        lambda: t.sighash_all(0, legacy_script), number)
+
+    witness = helpers.P2WPKH['ser']['tx']['signed']
+    witness_script = helpers.P2WPKH['ser']['ins'][0]['pk_script']
+    witness_value = helpers.P2WPKH['ser']['ins'][0]['value']
+    w = tx.Tx.from_bytes(witness)
+    results['sighash.witness_all'] = seconds_per_call(
+        lambda: w.sighash_all(
+            0, witness_script, prevout_value=witness_value),
+        number)
+    results['sighash.witness_all_cold'] = seconds_per_call(
+        lambda: tx.Tx.from_bytes(witness).sighash_all(
+            0, witness_script, prevout_value=witness_value),
+        number)
+
+    with riemann.network_context('bitcoin_cash_main'):
+        forkid_value = helpers.P2PKH1['ser']['ins'][0]['value']
+        results['sighash.forkid_all'] = seconds_per_call(
+            lambda: t.sighash_all(
+                0, legacy_script, prevout_value=forkid_value),
+            number)
+
+    with riemann.network_context('zcash_sapling_main'):
+        case = sapling_helpers.SIGHASH[0]
+        s = tx.SaplingTx.from_hex(case['hex'])
+        script_code = bytes.fromhex(case['script_code'])
+        amount = bytes.fromhex(case['amount'])
+        results['sighash.sapling'] = seconds_per_call(
+            lambda: s.sighash(
+                sighash_type=case['sighash_type'],
+                index=case['index'],
+                joinsplit=case['joinsplit'],
+                script_code=script_code,
+                anyone_can_pay=case['anyone_can_pay'],
+                prevout_value=amount),
+            number)
+
+    with riemann.network_context('decred_main'):
+        d = _decred_tx()
+        # DecredTx.prefix_hash is memoized, so hash the prefix directly
+        results['sighash.decred_prefix_hash'] = seconds_per_call(
+            lambda: utils.blake256(d.prefix()), number)
+
+    return results
+
+
+if __name__ == '__main__':
+    for name, value in run().items():
+        print('{:<40} {:>12.3f} us'.format(name, value * 1e6))
@@ -81,6 +81,7 @@
 #                subsequent calls to final(), digest() or
 #                hexdigest() simply return the stored value.
 
+import os
 import struct
 from binascii import hexlify
 
@@ -535,5 +536,565 @@ class BLAKE(object):
 #---------------------------------------------------------------
 
 
-def blake_hash(data):
-    return BLAKE(256).digest(data)
+# A BLAKE-256-only code path. The BLAKE class above handles every digest
+# size and incremental updates, so its compression function looks up word
+# sizes, rotations and the message schedule on every G call.
+#
+# Here the 16-word working state is held in four Python ints, one per row
+# of the 4x4 state matrix, each packing its four 32-bit words into 64-bit
+# lanes. One G step then runs on all four columns (or diagonals) at once,
+# using a quarter of the arithmetic. The 64-bit lanes leave room for the
+# carries and shifts to stay within each lane until it is masked. The 14
+# rounds are unrolled into straight-line code over local variables, with
+# the SIGMA permutation and the constants folded in as literals. The code
+# is generated by tools/gen_blake256.py.
+
+_MASK32 = 0xFFFFFFFF
+
+
+def _lanes(words):
+    """ pack four 32-bit words into the 64-bit lanes of one int """
+    return sum(w << (64 * i) for i, w in enumerate(words))
+
+
+_unpack_block = struct.Struct('>16L').unpack_from
+_pack_digest = struct.Struct('>8L').pack
+
+
+# Generated by tools/gen_blake256.py. Edit the generator, not this code.
+# BEGIN GENERATED _compress256
+def _compress256(h, block, offset, t, unpack=_unpack_block):
+    """ compresses the 64-byte block at offset with packed chain
+        value h (the top two rows of the state) and bit counter t,
+        and returns the new chain value
+    """
+    m0, m1, m2, m3, m4, m5, m6, m7, m8, m9, m10, m11, m12, m13, m14, m15 = unpack(block, offset)
+    m0_1 = m0 << 64
+    m0_2 = m0 << 128
+    m0_3 = m0 << 192
+    m1_1 = m1 << 64
+    m1_2 = m1 << 128
+    m1_3 = m1 << 192
+    m2_1 = m2 << 64
+    m2_2 = m2 << 128
+    m2_3 = m2 << 192
+    m3_1 = m3 << 64
+    m3_2 = m3 << 128
+    m3_3 = m3 << 192
+    m4_1 = m4 << 64
+    m4_2 = m4 << 128
+    m4_3 = m4 << 192
+    m5_1 = m5 << 64
+    m5_2 = m5 << 128
+    m5_3 = m5 << 192
+    m6_1 = m6 << 64
+    m6_2 = m6 << 128
+    m6_3 = m6 << 192
+    m7_1 = m7 << 64
+    m7_2 = m7 << 128
+    m7_3 = m7 << 192
+    m8_1 = m8 << 64
+    m8_2 = m8 << 128
+    m8_3 = m8 << 192
+    m9_1 = m9 << 64
+    m9_2 = m9 << 128
+    m9_3 = m9 << 192
+    m10_1 = m10 << 64
+    m10_2 = m10 << 128
+    m10_3 = m10 << 192
+    m11_1 = m11 << 64
+    m11_2 = m11 << 128
+    m11_3 = m11 << 192
+    m12_1 = m12 << 64
+    m12_2 = m12 << 128
+    m12_3 = m12 << 192
+    m13_1 = m13 << 64
+    m13_2 = m13 << 128
+    m13_3 = m13 << 192
+    m14_1 = m14 << 64
+    m14_2 = m14 << 128
+    m14_3 = m14 << 192
+    m15_1 = m15 << 64
+    m15_2 = m15 << 128
+    m15_3 = m15 << 192
+    hA, hB = h
+    A = hA
+    B = hB
+    C = 0x37073440000000013198A2E0000000085A308D300000000243F6A88
+    lo = t & 0xFFFFFFFF
+    hi = t >> 32
+    D = 0xEC4E6C8900000000082EFA9800000000299F31D000000000A4093822 ^ (lo | lo << 64 | hi << 128 | hi << 192)
+    A = (A + B + ((m0 | m2_1 | m4_2 | m6_3) ^ 0xEC4E6C8900000000299F31D000000000037073440000000085A308D3)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m1 | m3_1 | m5_2 | m7_3) ^ 0x82EFA9800000000A40938220000000013198A2E00000000243F6A88)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 64) | ((B & 0xFFFFFFFF) << 192)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 192) | ((D & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    A = (A + B + ((m8 | m10_1 | m12_2 | m14_3) ^ 0xB547091700000000C97C50DD0000000034E90C6C0000000038D01377)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m9 | m11_1 | m13_2 | m15_3) ^ 0x3F84D5B500000000C0AC29B700000000BE5466CF00000000452821E6)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 192) | ((B & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 64) | ((D & 0xFFFFFFFF) << 192)
+    A = (A + B + ((m14 | m4_1 | m9_2 | m13_3) ^ 0x82EFA9800000000B547091700000000452821E600000000BE5466CF)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m10 | m8_1 | m15_2 | m6_3) ^ 0xC97C50DD0000000038D0137700000000A4093822000000003F84D5B5)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 64) | ((B & 0xFFFFFFFF) << 192)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 192) | ((D & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    A = (A + B + ((m1 | m0_1 | m11_2 | m5_3) ^ 0x370734400000000EC4E6C890000000013198A2E00000000C0AC29B7)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m12 | m2_1 | m7_2 | m3_3) ^ 0x299F31D00000000034E90C6C00000000243F6A880000000085A308D3)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 192) | ((B & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 64) | ((D & 0xFFFFFFFF) << 192)
+    A = (A + B + ((m11 | m12_1 | m5_2 | m15_3) ^ 0xC97C50DD0000000013198A2E00000000243F6A8800000000452821E6)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m8 | m0_1 | m2_2 | m13_3) ^ 0xB547091700000000299F31D000000000C0AC29B70000000034E90C6C)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 64) | ((B & 0xFFFFFFFF) << 192)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 192) | ((D & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    A = (A + B + ((m10 | m3_1 | m7_2 | m9_3) ^ 0xA40938220000000085A308D300000000082EFA98000000003F84D5B5)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m14 | m6_1 | m1_2 | m4_3) ^ 0x38D0137700000000EC4E6C89000000000370734400000000BE5466CF)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 192) | ((B & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 64) | ((D & 0xFFFFFFFF) << 192)
+    A = (A + B + ((m7 | m3_1 | m13_2 | m11_3) ^ 0x3F84D5B500000000C0AC29B70000000085A308D30000000038D01377)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m9 | m1_1 | m12_2 | m14_3) ^ 0x34E90C6C00000000C97C50DD000000000370734400000000EC4E6C89)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 64) | ((B & 0xFFFFFFFF) << 192)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 192) | ((D & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    A = (A + B + ((m2 | m5_1 | m4_2 | m15_3) ^ 0x452821E600000000243F6A8800000000BE5466CF00000000082EFA98)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m6 | m10_1 | m0_2 | m8_3) ^ 0xB547091700000000A409382200000000299F31D00000000013198A2E)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 192) | ((B & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 64) | ((D & 0xFFFFFFFF) << 192)
+    A = (A + B + ((m9 | m5_1 | m2_2 | m10_3) ^ 0xB547091700000000A409382200000000EC4E6C8900000000243F6A88)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m0 | m7_1 | m4_2 | m15_3) ^ 0xBE5466CF0000000013198A2E00000000299F31D00000000038D01377)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 64) | ((B & 0xFFFFFFFF) << 192)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 192) | ((D & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    A = (A + B + ((m14 | m11_1 | m6_2 | m3_3) ^ 0xC97C50DD00000000452821E600000000C0AC29B70000000085A308D3)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m1 | m12_1 | m8_2 | m13_3) ^ 0x370734400000000082EFA980000000034E90C6C000000003F84D5B5)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 192) | ((B & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 64) | ((D & 0xFFFFFFFF) << 192)
+    A = (A + B + ((m2 | m6_1 | m0_2 | m8_3) ^ 0x37073440000000034E90C6C00000000BE5466CF00000000C0AC29B7)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m12 | m10_1 | m11_2 | m3_3) ^ 0x452821E600000000243F6A8800000000082EFA980000000013198A2E)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 64) | ((B & 0xFFFFFFFF) << 192)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 192) | ((D & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    A = (A + B + ((m4 | m7_1 | m15_2 | m1_3) ^ 0x38D01377000000003F84D5B500000000299F31D000000000C97C50DD)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m13 | m5_1 | m14_2 | m9_3) ^ 0x85A308D300000000B547091700000000EC4E6C8900000000A4093822)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 192) | ((B & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 64) | ((D & 0xFFFFFFFF) << 192)
+    A = (A + B + ((m12 | m1_1 | m14_2 | m4_3) ^ 0xBE5466CF00000000C97C50DD00000000B547091700000000299F31D0)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m5 | m15_1 | m13_2 | m10_3) ^ 0xA4093822000000003F84D5B50000000085A308D300000000C0AC29B7)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 64) | ((B & 0xFFFFFFFF) << 192)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 192) | ((D & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    A = (A + B + ((m0 | m6_1 | m9_2 | m8_3) ^ 0x34E90C6C0000000013198A2E000000000370734400000000EC4E6C89)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m7 | m3_1 | m2_2 | m11_3) ^ 0x452821E60000000038D0137700000000082EFA9800000000243F6A88)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 192) | ((B & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 64) | ((D & 0xFFFFFFFF) << 192)
+    A = (A + B + ((m13 | m7_1 | m12_2 | m3_3) ^ 0x38D013770000000085A308D3000000003F84D5B50000000034E90C6C)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m11 | m14_1 | m1_2 | m9_3) ^ 0x370734400000000C0AC29B700000000EC4E6C8900000000C97C50DD)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 64) | ((B & 0xFFFFFFFF) << 192)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 192) | ((D & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    A = (A + B + ((m5 | m15_1 | m8_2 | m2_3) ^ 0xBE5466CF00000000082EFA9800000000A409382200000000243F6A88)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m0 | m4_1 | m6_2 | m10_3) ^ 0x13198A2E00000000452821E600000000B547091700000000299F31D0)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 192) | ((B & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 64) | ((D & 0xFFFFFFFF) << 192)
+    A = (A + B + ((m6 | m14_1 | m11_2 | m0_3) ^ 0x452821E600000000037073440000000038D0137700000000B5470917)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m15 | m9_1 | m3_2 | m8_3) ^ 0x243F6A880000000034E90C6C000000003F84D5B500000000082EFA98)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 64) | ((B & 0xFFFFFFFF) << 192)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 192) | ((D & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    A = (A + B + ((m12 | m13_1 | m1_2 | m10_3) ^ 0x299F31D000000000A409382200000000EC4E6C890000000013198A2E)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m2 | m7_1 | m4_2 | m5_3) ^ 0xBE5466CF0000000085A308D300000000C97C50DD00000000C0AC29B7)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 192) | ((B & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 64) | ((D & 0xFFFFFFFF) << 192)
+    A = (A + B + ((m10 | m8_1 | m7_2 | m1_3) ^ 0x299F31D000000000082EFA9800000000A40938220000000013198A2E)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m2 | m4_1 | m6_2 | m5_3) ^ 0x85A308D300000000EC4E6C8900000000452821E600000000BE5466CF)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 64) | ((B & 0xFFFFFFFF) << 192)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 192) | ((D & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    A = (A + B + ((m15 | m9_1 | m3_2 | m13_3) ^ 0x243F6A8800000000C0AC29B7000000003F84D5B50000000034E90C6C)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m11 | m14_1 | m12_2 | m0_3) ^ 0xC97C50DD00000000037073440000000038D0137700000000B5470917)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 192) | ((B & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 64) | ((D & 0xFFFFFFFF) << 192)
+    A = (A + B + ((m0 | m2_1 | m4_2 | m6_3) ^ 0xEC4E6C8900000000299F31D000000000037073440000000085A308D3)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m1 | m3_1 | m5_2 | m7_3) ^ 0x82EFA9800000000A40938220000000013198A2E00000000243F6A88)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 64) | ((B & 0xFFFFFFFF) << 192)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 192) | ((D & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    A = (A + B + ((m8 | m10_1 | m12_2 | m14_3) ^ 0xB547091700000000C97C50DD0000000034E90C6C0000000038D01377)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m9 | m11_1 | m13_2 | m15_3) ^ 0x3F84D5B500000000C0AC29B700000000BE5466CF00000000452821E6)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 192) | ((B & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 64) | ((D & 0xFFFFFFFF) << 192)
+    A = (A + B + ((m14 | m4_1 | m9_2 | m13_3) ^ 0x82EFA9800000000B547091700000000452821E600000000BE5466CF)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m10 | m8_1 | m15_2 | m6_3) ^ 0xC97C50DD0000000038D0137700000000A4093822000000003F84D5B5)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 64) | ((B & 0xFFFFFFFF) << 192)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 192) | ((D & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    A = (A + B + ((m1 | m0_1 | m11_2 | m5_3) ^ 0x370734400000000EC4E6C890000000013198A2E00000000C0AC29B7)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m12 | m2_1 | m7_2 | m3_3) ^ 0x299F31D00000000034E90C6C00000000243F6A880000000085A308D3)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 192) | ((B & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 64) | ((D & 0xFFFFFFFF) << 192)
+    A = (A + B + ((m11 | m12_1 | m5_2 | m15_3) ^ 0xC97C50DD0000000013198A2E00000000243F6A8800000000452821E6)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m8 | m0_1 | m2_2 | m13_3) ^ 0xB547091700000000299F31D000000000C0AC29B70000000034E90C6C)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 64) | ((B & 0xFFFFFFFF) << 192)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 192) | ((D & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    A = (A + B + ((m10 | m3_1 | m7_2 | m9_3) ^ 0xA40938220000000085A308D300000000082EFA98000000003F84D5B5)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m14 | m6_1 | m1_2 | m4_3) ^ 0x38D0137700000000EC4E6C89000000000370734400000000BE5466CF)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 192) | ((B & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 64) | ((D & 0xFFFFFFFF) << 192)
+    A = (A + B + ((m7 | m3_1 | m13_2 | m11_3) ^ 0x3F84D5B500000000C0AC29B70000000085A308D30000000038D01377)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m9 | m1_1 | m12_2 | m14_3) ^ 0x34E90C6C00000000C97C50DD000000000370734400000000EC4E6C89)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 64) | ((B & 0xFFFFFFFF) << 192)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 192) | ((D & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    A = (A + B + ((m2 | m5_1 | m4_2 | m15_3) ^ 0x452821E600000000243F6A8800000000BE5466CF00000000082EFA98)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 16) | (D << 16)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 12) | (B << 20)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    A = (A + B + ((m6 | m10_1 | m0_2 | m8_3) ^ 0xB547091700000000A409382200000000299F31D00000000013198A2E)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    D ^= A
+    D = ((D >> 8) | (D << 24)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    C = (C + D) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B ^= C
+    B = ((B >> 7) | (B << 25)) & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF00000000FFFFFFFF
+    B = (B >> 192) | ((B & 0xFFFFFFFF00000000FFFFFFFF00000000FFFFFFFF) << 64)
+    C = (C >> 128) | ((C & 0xFFFFFFFF00000000FFFFFFFF) << 128)
+    D = (D >> 64) | ((D & 0xFFFFFFFF) << 192)
+    return hA ^ A ^ C, hB ^ B ^ D
+# END GENERATED _compress256
+
+_IV256 = (_lanes(BLAKE.IV32[0:4]), _lanes(BLAKE.IV32[4:8]))
+
+
+def python_blake_hash(data):
+    """ BLAKE-256 digest using the pure-Python implementation.
+        data: a bytes-like object, or a str which is hashed as UTF-8
+    """
+    if isinstance(data, str):
+        data = data.encode('UTF-8')
+    compress = _compress256
+    length = len(data)
+    full = length >> 6
+    rem = length & 63
+    bits = length << 3
+
+    # Compress whole blocks in place, without copying or buffering
+    h = _IV256
+    for i in range(full):
+        h = compress(h, data, i << 6, (i + 1) << 9)
+
+    # Pad with a 1 bit, zeros, a 1 bit, and the 64-bit message length.
+    # A block holding only padding is compressed with a counter of 0.
+    msglen = bits.to_bytes(8, 'big')
+    tail = bytes(data[full << 6:])
+    if rem < 55:
+        block = tail + b'\x80' + bytes(54 - rem) + b'\x01' + msglen
+        h = compress(h, block, 0, bits if rem else 0)
+    elif rem == 55:
+        h = compress(h, tail + b'\x81' + msglen, 0, bits)
+    else:
+        h = compress(h, tail + b'\x80' + bytes(63 - rem), 0, bits)
+        h = compress(h, bytes(55) + b'\x01' + msglen, 0, 0)
+
+    return _pack_digest(*[(row >> (64 * i)) & _MASK32
+                          for row in h for i in range(4)])
+
+
+# The optional C extension built by setup.py. Set RIEMANN_BLAKE256=python to
+# use the pure-Python implementation even when the extension is available.
+try:
+    from riemann._blake256 import blake_hash as native_blake_hash
+except ImportError:
+    native_blake_hash = None
+
+if (native_blake_hash is not None
+        and os.environ.get('RIEMANN_BLAKE256') != 'python'):
+    BACKEND = 'native'
+    blake_hash = native_blake_hash
+else:
+    BACKEND = 'python'
+    blake_hash = python_blake_hash
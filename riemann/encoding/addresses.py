@@ -1,12 +1,17 @@
+import functools
 import riemann
-from riemann import utils
+from riemann import networks, utils
 from riemann.script import serialization as script_ser
 
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, \
+    Tuple, Type
+
 
 def _hash_to_sh_address(
         script_hash: bytes,
         witness: bool = False,
-        cashaddr: bool = True) -> str:
+        cashaddr: bool = True,
+        network: Optional[Type[networks.Network]] = None) -> str:
     '''
     Turns a script hash into a SH address. Prefers Cashaddrs to legacy
     addresses whenever supported.
@@ -16,28 +21,31 @@ def _hash_to_sh_address(
         witness:      Pass True to generate a witness address if supported.
                       Default False.
         cashaddr:     Pass False to prefer legacy to cashaddr. Default True
+        network:      The network to use. Default the current network
     Returns:
         The encoded address
     '''
+    network = network or riemann.get_current_network()
     addr_bytes = bytearray()
-    if riemann.network.CASHADDR_P2SH is not None and cashaddr:
-        addr_bytes.extend(riemann.network.CASHADDR_P2SH)
+    if network.CASHADDR_P2SH is not None and cashaddr:
+        addr_bytes.extend(network.CASHADDR_P2SH)
         addr_bytes.extend(script_hash)
-        return riemann.network.CASHADDR_ENCODER.encode(addr_bytes)
+        return network.CASHADDR_ENCODER.encode(addr_bytes, network=network)
     if witness:
-        addr_bytes.extend(riemann.network.P2WSH_PREFIX)
+        addr_bytes.extend(network.P2WSH_PREFIX)
         addr_bytes.extend(script_hash)
-        return riemann.network.SEGWIT_ENCODER.encode(addr_bytes)
+        return network.SEGWIT_ENCODER.encode(addr_bytes, network=network)
     else:
-        addr_bytes.extend(riemann.network.P2SH_PREFIX)
+        addr_bytes.extend(network.P2SH_PREFIX)
         addr_bytes.extend(script_hash)
-        return riemann.network.LEGACY_ENCODER.encode(addr_bytes)
+        return network.LEGACY_ENCODER.encode(addr_bytes, network=network)
 
 
 def _ser_script_to_sh_address(
         script_bytes: bytes,
         witness: bool = False,
-        cashaddr: bool = True) -> str:
+        cashaddr: bool = True,
+        network: Optional[Type[networks.Network]] = None) -> str:
     '''
     Turns a serialized script into a SH address. Prefers Cashaddrs to legacy
     addresses whenever supported.
@@ -47,24 +55,28 @@ def _ser_script_to_sh_address(
         witness:      Pass True to generate a witness address if supported.
                       Default False.
         cashaddr:     Pass False to prefer legacy to cashaddr. Default True
+        network:      The network to use. Default the current network
 
     Returns:
         The encoded address
     '''
+    network = network or riemann.get_current_network()
     if witness:
         script_hash = utils.sha256(script_bytes)
     else:
-        script_hash = utils.hash160(script_bytes)
+        script_hash = network.HASH160(script_bytes)
     return _hash_to_sh_address(
         script_hash=script_hash,
         witness=witness,
-        cashaddr=cashaddr)
+        cashaddr=cashaddr,
+        network=network)
 
 
 def make_sh_address(
         script_string: str,
         witness: bool = False,
-        cashaddr: bool = True) -> str:
+        cashaddr: bool = True,
+        network: Optional[Type[networks.Network]] = None) -> str:
     '''
     Turns a human-readable script into an address. Prefers Cashaddrs to legacy
     addresses whenever supported.
@@ -75,61 +87,77 @@ def make_sh_address(
                        Default False.
         cashaddr:      Pass False to prefer legacy to cashaddr. Default True
 
+        network:       The network to use. Default the current network
     Returns:
         The encoded address
     '''
-    script_bytes = script_ser.serialize(script_string)
+    network = network or riemann.get_current_network()
+    script_bytes = script_ser.serialize(script_string, network)
 
     return _ser_script_to_sh_address(
         script_bytes=script_bytes,
         witness=witness,
-        cashaddr=cashaddr)
+        cashaddr=cashaddr,
+        network=network)
 
 
-def make_p2wsh_address(script_string: str) -> str:
+def make_p2wsh_address(
+        script_string: str,
+        network: Optional[Type[networks.Network]] = None) -> str:
     '''
     Turns a human-readable script into a p2wsh address
 
     Args:
         script_string: The human-readable script
+        network:       The network to use. Default the current network
     Returns:
         The encoded address
     '''
     return make_sh_address(script_string=script_string,
-                           witness=True)
+                           witness=True,
+                           network=network)
 
 
-def make_p2sh_address(script_string: str) -> str:
+def make_p2sh_address(
+        script_string: str,
+        network: Optional[Type[networks.Network]] = None) -> str:
     '''
     Turns a human-readable script into a p2sh address, cashaddr if possible
 
     Args:
         script_string: The human-readable script
+        network:       The network to use. Default the current network
     Returns:
         The encoded address
     '''
     return make_sh_address(script_string=script_string,
-                           witness=False)
+                           witness=False,
+                           network=network)
 
 
-def make_legacy_p2sh_address(script_string: str) -> str:
+def make_legacy_p2sh_address(
+        script_string: str,
+        network: Optional[Type[networks.Network]] = None) -> str:
     '''
     Turns a human-readable script into a non-cashaddr p2sh address
 
     Args:
         script_string: The human-readable script
+        network:       The network to use. Default the current network
     Returns:
         The encoded address
     '''
     return make_sh_address(script_string=script_string,
                            witness=False,
-                           cashaddr=False)
+                           cashaddr=False,
+                           network=network)
 
 
 def _make_pkh_address(
         pubkey_hash: bytes,
         witness: bool = False,
-        cashaddr: bool = True) -> str:
+        cashaddr: bool = True,
+        network: Optional[Type[networks.Network]] = None) -> str:
     '''
     Turns a 20-byte public key has into an address
 
@@ -138,28 +166,35 @@ def _make_pkh_address(
         witness:      Pass True to generate a witness address if supported.
                       Default False.
         cashaddr:     Pass False to prefer legacy to cashaddr. Default True
+        network:      The network to use. Default the current network
     Returns:
         The encoded address
     '''
-    addr_bytes = bytearray()
-    if riemann.network.CASHADDR_P2PKH is not None and cashaddr:
-        addr_bytes.extend(riemann.network.CASHADDR_P2PKH)
-        addr_bytes.extend(pubkey_hash)
-        return riemann.network.CASHADDR_ENCODER.encode(addr_bytes)
+    network = network or riemann.get_current_network()
+    prefix, encoder = _pkh_encoding(witness, cashaddr, network)
+    return encoder.encode(prefix + pubkey_hash, network=network)
+
+
+def _pkh_encoding(
+        witness: bool,
+        cashaddr: bool,
+        network: Type[networks.Network]) -> Tuple[bytes, Any]:
+    '''
+    Returns the address prefix and encoder module for a PKH address. Prefers
+    Cashaddrs to legacy addresses whenever supported.
+    '''
+    if network.CASHADDR_P2PKH is not None and cashaddr:
+        return bytes(network.CASHADDR_P2PKH), network.CASHADDR_ENCODER
     if witness:
-        addr_bytes.extend(riemann.network.P2WPKH_PREFIX)
-        addr_bytes.extend(pubkey_hash)
-        return riemann.network.SEGWIT_ENCODER.encode(addr_bytes)
-    else:
-        addr_bytes.extend(riemann.network.P2PKH_PREFIX)
-        addr_bytes.extend(pubkey_hash)
-        return riemann.network.LEGACY_ENCODER.encode(addr_bytes)
+        return bytes(network.P2WPKH_PREFIX), network.SEGWIT_ENCODER
+    return bytes(network.P2PKH_PREFIX), network.LEGACY_ENCODER
 
 
 def make_pkh_address(
         pubkey: bytes,
         witness: bool = False,
-        cashaddr: bool = True) -> str:
+        cashaddr: bool = True,
+        network: Optional[Type[networks.Network]] = None) -> str:
     '''
     Turns a pubkey into an address. Prefers Cashaddrs to legacy addresses
     whenever supported.
@@ -169,214 +204,385 @@ def make_pkh_address(
         witness:      Pass True to generate a witness address if supported.
                       Default False.
         cashaddr:     Pass False to prefer legacy to cashaddr. Default True
+        network:      The network to use. Default the current network
     Returns:
         The encoded address
     '''
-    pubkey_hash = utils.hash160(pubkey)
+    network = network or riemann.get_current_network()
+    pubkey_hash = network.HASH160(pubkey)
     return _make_pkh_address(pubkey_hash=pubkey_hash,
                              witness=witness,
-                             cashaddr=cashaddr)
+                             cashaddr=cashaddr,
+                             network=network)
+
+
+def make_pkh_addresses(
+        pubkeys: Iterable[bytes],
+        witness: bool = False,
+        cashaddr: bool = True,
+        network: Optional[Type[networks.Network]] = None,
+        processes: Optional[int] = None) -> List[str]:
+    '''
+    Turns many pubkeys into addresses, in order. Equivalent to calling
+    make_pkh_address on each, but resolves the network and encoder once for
+    the whole batch.
 
+    Args:
+        pubkeys:      The 33 or 65 byte public keys
+        witness:      Pass True to generate witness addresses if supported.
+                      Default False.
+        cashaddr:     Pass False to prefer legacy to cashaddr. Default True
+        network:      The network to use. Default the current network
+        processes:    Pass a number of worker processes to fan a very large
+                      batch out across a process pool. Default None, which
+                      works in the calling process
+    Returns:
+        The encoded addresses
+    '''
+    network = network or riemann.get_current_network()
+    return utils.map_chunks(
+        _make_pkh_addresses, pubkeys, witness, cashaddr, network,
+        processes=processes)
 
-def make_p2wpkh_address(pubkey: bytes) -> str:
+
+def _make_pkh_addresses(
+        pubkeys: Iterable[bytes],
+        witness: bool,
+        cashaddr: bool,
+        network: Type[networks.Network]) -> List[str]:
+    '''
+    Turns many pubkeys into addresses. The worker of make_pkh_addresses
+    '''
+    prefix, encoder = _pkh_encoding(witness, cashaddr, network)
+    hash160 = network.HASH160
+    return encoder.encode_many(
+        [prefix + hash160(pubkey) for pubkey in pubkeys], network=network)
+
+
+def make_p2wpkh_address(
+        pubkey: bytes,
+        network: Optional[Type[networks.Network]] = None) -> str:
     '''
     Turns a pubkey into a p2wpkh address
 
     Args:
         pubkey:       The 33 or 65 byte public key
+        network:      The network to use. Default the current network
     Returns:
         The encoded address
     '''
-    return make_pkh_address(pubkey=pubkey, witness=True)
+    return make_pkh_address(pubkey=pubkey, witness=True, network=network)
 
 
-def make_p2pkh_address(pubkey: bytes) -> str:
+def make_p2pkh_address(
+        pubkey: bytes,
+        network: Optional[Type[networks.Network]] = None) -> str:
     '''
     Turns a pubkey into a p2pkh address, cashaddr if available
 
     Args:
         pubkey:       The 33 or 65 byte public key
+        network:      The network to use. Default the current network
     Returns:
         The encoded address
     '''
-    return make_pkh_address(pubkey=pubkey, witness=False)
+    return make_pkh_address(pubkey=pubkey, witness=False, network=network)
 
 
-def make_legacy_p2pkh_address(pubkey: bytes) -> str:
+def make_legacy_p2pkh_address(
+        pubkey: bytes,
+        network: Optional[Type[networks.Network]] = None) -> str:
     '''
     Turns a pubkey into a legacy p2pkh address
 
     Args:
         pubkey:       The 33 or 65 byte public key
+        network:      The network to use. Default the current network
     Returns:
         The encoded address
     '''
-    return make_pkh_address(pubkey=pubkey, witness=False, cashaddr=False)
+    return make_pkh_address(
+        pubkey=pubkey, witness=False, cashaddr=False, network=network)
 
 
-def parse(address: str) -> bytes:
+class AddressInfo(NamedTuple):
     '''
-    Decode an address to the underlying raw bytes
+    The result of classifying an address.
+
+    Attributes:
+        address: the address that was classified
+        type: 'p2pkh', 'p2sh', 'p2wpkh', 'p2wsh', or 'witness_unknown' for
+              witness programs of other versions or lengths
+        hash: the 20 or 32 byte hash, or witness program, the address encodes
+        network: the network class the address was classified against
+        witness_version: the witness version of segwit addresses, else None
+    '''
+    address: str
+    type: str
+    hash: bytes
+    network: Type[networks.Network]
+    witness_version: Optional[int]
 
-    Args:
-        address: The address to parse
-    Returns:
-        The raw bytestring encoded by the address
+
+def _decode_address(
+        address: str,
+        network: Type[networks.Network]) -> Tuple[Any, bytes]:
     '''
-    try:
-        return bytearray(riemann.network.LEGACY_ENCODER.decode(address))
-    except ValueError:
-        pass
+    Picks the network's decoder for an address from its cashaddr prefix or
+    bech32 HRP, falling back to legacy, and decodes it.
 
+    Returns:
+        The encoder module used and the raw bytestring encoded by the address
+    '''
+    if (network.CASHADDR_PREFIX is not None
+            and address.startswith(network.CASHADDR_PREFIX + ':')):
+        encoder = network.CASHADDR_ENCODER
+    elif (network.BECH32_HRP is not None
+            and address[:len(network.BECH32_HRP) + 1].lower()
+            == network.BECH32_HRP + '1'):
+        encoder = network.SEGWIT_ENCODER
+    else:
+        encoder = network.LEGACY_ENCODER
     try:
-        return bytearray(riemann.network.SEGWIT_ENCODER.decode(address))
+        return encoder, bytes(encoder.decode(address, network=network))
     except Exception:
-        pass
+        raise ValueError(
+            'Unsupported address format. Got: {}'.format(address))
 
-    try:
-        return bytearray(riemann.network.CASHADDR_ENCODER.decode(address))
-    except Exception:
-        pass
 
-    raise ValueError(
-        'Unsupported address format. Got: {}'.format(address))
+# The opt-in LRU caches used by to_output_script and from_output_script.
+# None while caching is disabled
+_to_output_script_cache: Optional[Callable[..., bytes]] = None
+_from_output_script_cache: Optional[Callable[..., str]] = None
 
 
-def to_output_script(address: str) -> bytes:
+def enable_cache(maxsize: int = 4096) -> None:
     '''
-    Convert an address into its associated output script.
+    Cache the results of to_output_script and from_output_script, keeping
+    up to maxsize entries each. Useful when repeatedly paying to the same
+    addresses. Entries are keyed by network, and are cleared whenever
+    select_network is called. Replaces any existing caches.
 
     Args:
-        address: The address to parse
-    Returns:
-        The output script that corresponds to the address, suitable for
-        inclusion in a TxOut
+        maxsize: The number of entries to keep in each cache
     '''
-    parsed = parse(address)
-    parsed_hash = b''
+    global _to_output_script_cache, _from_output_script_cache
+    _to_output_script_cache = functools.lru_cache(maxsize)(_to_output_script)
+    _from_output_script_cache = \
+        functools.lru_cache(maxsize)(_from_output_script)
 
-    try:
-        if (parsed.find(riemann.network.P2WPKH_PREFIX) == 0
-                and len(parsed) == 22):
-            return parsed
-    except TypeError:
-        pass
 
-    try:
-        if (parsed.find(riemann.network.P2WSH_PREFIX) == 0
-                and len(parsed) == 34):
-            return parsed
-    except TypeError:
-        pass
+def disable_cache() -> None:
+    '''Stop caching, and discard the caches'''
+    global _to_output_script_cache, _from_output_script_cache
+    _to_output_script_cache = None
+    _from_output_script_cache = None
 
-    try:
-        if (parsed.find(riemann.network.CASHADDR_P2SH) == 0
-                and len(parsed) == len(riemann.network.CASHADDR_P2SH) + 20):
-            prefix = b'\xa9\x14'  # OP_HASH160 PUSH14
-            parsed_hash = parsed[len(riemann.network.P2SH_PREFIX):]
-            suffix = b'\x87'  # OP_EQUAL
-    except TypeError:
-        pass
 
-    try:
-        if (parsed.find(riemann.network.CASHADDR_P2PKH) == 0
-                and len(parsed) == len(riemann.network.CASHADDR_P2PKH) + 20):
-            prefix = b'\x76\xa9\x14'  # OP_DUP OP_HASH160 PUSH14
-            parsed_hash = parsed[len(riemann.network.P2PKH_PREFIX):]
-            suffix = b'\x88\xac'  # OP_EQUALVERIFY OP_CHECKSIG
-    except TypeError:
-        pass
+def clear_cache() -> None:
+    '''Empty the caches, if caching is enabled'''
+    if _to_output_script_cache is not None:
+        _to_output_script_cache.cache_clear()  # type: ignore
+    if _from_output_script_cache is not None:
+        _from_output_script_cache.cache_clear()  # type: ignore
 
-    if (parsed.find(riemann.network.P2PKH_PREFIX) == 0
-            and len(parsed) == len(riemann.network.P2PKH_PREFIX) + 20):
-        prefix = b'\x76\xa9\x14'  # OP_DUP OP_HASH160 PUSH14
-        parsed_hash = parsed[len(riemann.network.P2PKH_PREFIX):]
-        suffix = b'\x88\xac'  # OP_EQUALVERIFY OP_CHECKSIG
 
-    if (parsed.find(riemann.network.P2SH_PREFIX) == 0
-            and len(parsed) == len(riemann.network.P2SH_PREFIX) + 20):
-        prefix = b'\xa9\x14'  # OP_HASH160 PUSH14
-        parsed_hash = parsed[len(riemann.network.P2SH_PREFIX):]
-        suffix = b'\x87'  # OP_EQUAL
+def cache_info() -> Dict[str, Any]:
+    '''
+    Returns:
+        The hits, misses, maxsize and currsize of each cache, keyed by
+        function name. Empty if caching is disabled
+    '''
+    if _to_output_script_cache is None or _from_output_script_cache is None:
+        return {}
+    return {
+        'to_output_script':
+            _to_output_script_cache.cache_info(),  # type: ignore
+        'from_output_script':
+            _from_output_script_cache.cache_info()  # type: ignore
+    }
+
+
+def classify(
+        address: str,
+        network: Optional[Type[networks.Network]] = None) -> AddressInfo:
+    '''
+    Decode an address once and determine its type and hash. Cheaper than
+    trying each of the network's decoders in turn.
 
-    if parsed_hash == b'':
-        raise ValueError('Cannot parse output script from address.')
+    Args:
+        address: The address to classify
+        network: The network to use. Default the current network
+    Returns:
+        An AddressInfo describing the address
+    '''
+    network = network or riemann.get_current_network()
+    info = _classify(address, network)
+    if info is None:
+        raise ValueError(
+            'Unknown address type. Got: {}'.format(address))
+    return info
 
-    output_script = prefix + parsed_hash + suffix
-    return output_script
 
+def _classify(
+        address: str,
+        network: Type[networks.Network]) -> Optional[AddressInfo]:
+    '''
+    Classifies an address. Errors if it can't be decoded, and returns None
+    if it decodes to an unknown type.
+    '''
+    encoder, raw = _decode_address(address, network)
+
+    if encoder is network.CASHADDR_ENCODER:
+        version = len(network.CASHADDR_P2SH)
+        if len(raw) != version + 20:
+            return None
+        if raw.startswith(network.CASHADDR_P2SH):
+            return AddressInfo(address, 'p2sh', raw[version:], network, None)
+        if raw.startswith(network.CASHADDR_P2PKH):
+            return AddressInfo(address, 'p2pkh', raw[version:], network, None)
+        return None
+
+    if encoder is network.SEGWIT_ENCODER:
+        if len(raw) == 22 and raw.startswith(network.P2WPKH_PREFIX):
+            return AddressInfo(address, 'p2wpkh', raw[2:], network, 0)
+        if len(raw) == 34 and raw.startswith(network.P2WSH_PREFIX):
+            return AddressInfo(address, 'p2wsh', raw[2:], network, 0)
+        if encoder is not network.LEGACY_ENCODER:
+            return AddressInfo(
+                address, 'witness_unknown', raw[2:], network, raw[0])
+
+    if (len(raw) == len(network.P2PKH_PREFIX) + 20
+            and raw.startswith(network.P2PKH_PREFIX)):
+        return AddressInfo(
+            address, 'p2pkh', raw[len(network.P2PKH_PREFIX):], network, None)
+    if (len(raw) == len(network.P2SH_PREFIX) + 20
+            and raw.startswith(network.P2SH_PREFIX)):
+        return AddressInfo(
+            address, 'p2sh', raw[len(network.P2SH_PREFIX):], network, None)
+    return None
+
+
+def parse(
+        address: str,
+        network: Optional[Type[networks.Network]] = None) -> bytes:
+    '''
+    Decode an address to the underlying raw bytes
 
-def from_output_script(output_script: bytes, cashaddr: bool = True) -> str:
+    Args:
+        address: The address to parse
+        network: The network to use. Default the current network
+    Returns:
+        The raw bytestring encoded by the address
+    '''
+    network = network or riemann.get_current_network()
+    return bytearray(_decode_address(address, network)[1])
+
+
+def to_output_script(
+        address: str,
+        network: Optional[Type[networks.Network]] = None) -> bytes:
+    '''
+    Convert an address into its associated output script.
+
+    Args:
+        address: The address to parse
+        network: The network to use. Default the current network
+    Returns:
+        The output script that corresponds to the address, suitable for
+        inclusion in a TxOut
+    '''
+    network = network or riemann.get_current_network()
+    if _to_output_script_cache is not None:
+        return _to_output_script_cache(address, network)
+    return _to_output_script(address, network)
+
+
+def _to_output_script(
+        address: str,
+        network: Type[networks.Network]) -> bytes:
+    info = _classify(address, network)
+    if info is None or info.type == 'witness_unknown':
+        raise ValueError('Cannot parse output script from address.')
+    if info.type == 'p2pkh':
+        # OP_DUP OP_HASH160 PUSH14 {hash} OP_EQUALVERIFY OP_CHECKSIG
+        return b'\x76\xa9\x14' + info.hash + b'\x88\xac'
+    if info.type == 'p2sh':
+        # OP_HASH160 PUSH14 {hash} OP_EQUAL
+        return b'\xa9\x14' + info.hash + b'\x87'
+    # Witness programs are version, length, program
+    return bytes([info.witness_version, len(info.hash)]) + info.hash
+
+
+def from_output_script(
+        output_script: bytes,
+        cashaddr: bool = True,
+        network: Optional[Type[networks.Network]] = None) -> str:
     '''
     Convert an output script (the on-chain format) to an address
 
     Args:
         output_script: The output script to encode as an address
         cashaddr: Pass False to prefer legacy to cashaddr. Default True.
+        network:       The network to use. Default the current network
     '''
+    network = network or riemann.get_current_network()
+    if _from_output_script_cache is not None:
+        # bytearrays are unhashable, so key the cache on bytes
+        return _from_output_script_cache(
+            bytes(output_script), cashaddr, network)
+    return _from_output_script(output_script, cashaddr, network)
+
+
+def _from_output_script(
+        output_script: bytes,
+        cashaddr: bool,
+        network: Type[networks.Network]) -> str:
     try:
-        if (len(output_script) == len(riemann.network.P2WSH_PREFIX) + 32
-                and output_script.find(riemann.network.P2WSH_PREFIX) == 0):
+        if (len(output_script) == len(network.P2WSH_PREFIX) + 32
+                and output_script.find(network.P2WSH_PREFIX) == 0):
             # Script hash is the last 32 bytes
             return _hash_to_sh_address(
-                output_script[-32:], witness=True, cashaddr=cashaddr)
+                output_script[-32:], witness=True, cashaddr=cashaddr,
+                network=network)
     except TypeError:
         pass
     try:
-        if (len(output_script) == len(riemann.network.P2WPKH_PREFIX) + 20
-                and output_script.find(riemann.network.P2WPKH_PREFIX) == 0):
+        if (len(output_script) == len(network.P2WPKH_PREFIX) + 20
+                and output_script.find(network.P2WPKH_PREFIX) == 0):
             # PKH is the last 20 bytes
             return _make_pkh_address(
-                output_script[-20:], witness=True, cashaddr=cashaddr)
+                output_script[-20:], witness=True, cashaddr=cashaddr,
+                network=network)
     except TypeError:
         pass
 
     if len(output_script) == 25 and output_script.find(b'\x76\xa9\x14') == 0:
         return _make_pkh_address(
-            output_script[3:23], witness=False, cashaddr=cashaddr)
+            output_script[3:23], witness=False, cashaddr=cashaddr,
+            network=network)
 
     elif len(output_script) == 23 and output_script.find(b'\xa9\x14') == 0:
         return _hash_to_sh_address(
-            output_script[2:22], witness=False, cashaddr=cashaddr)
+            output_script[2:22], witness=False, cashaddr=cashaddr,
+            network=network)
 
     raise ValueError('Cannot parse address from script.')
 
 
-def parse_hash(address: str) -> bytes:
+def parse_hash(
+        address: str,
+        network: Optional[Type[networks.Network]] = None) -> bytes:
     '''
     Extract the pubkey or script hash encoded in an address
 
     Args:
         address: The address to parse
+        network: The network to use. Default the current network
     Returns:
         The 20 or 32 byte hash represented by the address
     '''
-    raw = parse(address)
-
-    # Cash addresses
-    try:
-        if address.find(riemann.network.CASHADDR_PREFIX) == 0:
-            if raw.find(riemann.network.CASHADDR_P2SH) == 0:
-                return raw[len(riemann.network.CASHADDR_P2SH):]
-            if raw.find(riemann.network.CASHADDR_P2PKH) == 0:
-                return raw[len(riemann.network.CASHADDR_P2PKH):]
-    except TypeError:
-        pass
-
-    # Segwit addresses
-    try:
-        if address.find(riemann.network.BECH32_HRP) == 0:
-            if raw.find(riemann.network.P2WSH_PREFIX) == 0:
-                return raw[len(riemann.network.P2WSH_PREFIX):]
-            if raw.find(riemann.network.P2WPKH_PREFIX) == 0:
-                return raw[len(riemann.network.P2WPKH_PREFIX):]
-    except TypeError:
-        pass
-
-    # Legacy Addresses
-    if raw.find(riemann.network.P2SH_PREFIX) == 0:
-        return raw[len(riemann.network.P2SH_PREFIX):]
-    if raw.find(riemann.network.P2PKH_PREFIX) == 0:
-        return raw[len(riemann.network.P2PKH_PREFIX):]
-
-    raise ValueError('Could not parse hash, unknown error')
+    info = _classify(address, network or riemann.get_current_network())
+    if info is None:
+        raise ValueError('Could not parse hash, unknown error')
+    return info.hash
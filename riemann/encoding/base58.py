@@ -22,40 +22,126 @@
 
 '''Implementation of Base58 encoding with checksum'''
 
+import riemann
 from riemann import utils
-from typing import Callable, Tuple
+from typing import Callable, Iterable, List, Optional, Tuple, Type
 
 BASE58_ALPHABET = b'123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
 BASE58_BASE = len(BASE58_ALPHABET)
 BASE58_LOOKUP = dict((c, i) for i, c in enumerate(BASE58_ALPHABET))
 
+# encode peels 10 digits at a time off the integer, then writes them 2 at a
+# time from a table of every 2-digit string
+_CHUNK_BASE = BASE58_BASE ** 10
+_PAIR_BASE = BASE58_BASE ** 2
+_PAIRS = [bytes([BASE58_ALPHABET[i // BASE58_BASE],
+                 BASE58_ALPHABET[i % BASE58_BASE]])
+          for i in range(_PAIR_BASE)]
 
-def encode(data: bytes, checksum: bool = True) -> str:
-    '''Convert binary to base58 using BASE58_ALPHABET.'''
+# Translates base58 characters to their digit values
+_DIGITS = bytes.maketrans(BASE58_ALPHABET, bytes(range(BASE58_BASE)))
 
-    if checksum:
-        data = data + utils.hash256(data)[:4]
-    v, prefix = to_long(256, lambda x: x, data)
-    data = from_long(v, prefix, BASE58_BASE, lambda v: BASE58_ALPHABET[v])
-    return data.decode("utf8")
 
+def encode(
+        data: bytes,
+        checksum: bool = True,
+        network: Optional[Type['riemann.networks.Network']] = None) -> str:
+    '''
+    Convert binary to base58 using BASE58_ALPHABET. The checksum uses the
+    hash256 of network, or of the current network if network is None.
+    '''
 
-def decode(s: str, checksum: bool = True) -> bytes:
-    '''Convert base58 to binary using BASE58_ALPHABET.'''
-    v, prefix = to_long(
-        BASE58_BASE, lambda c: BASE58_LOOKUP[c], s.encode("utf8"))
+    if checksum:
+        data = data + utils.hash256(data, network)[:4]
+    return _encode(data)
 
-    data = from_long(v, prefix, 256, lambda x: x)
+
+def decode(
+        s: str,
+        checksum: bool = True,
+        network: Optional[Type['riemann.networks.Network']] = None) -> bytes:
+    '''
+    Convert base58 to binary using BASE58_ALPHABET. The checksum uses the
+    hash256 of network, or of the current network if network is None.
+    '''
+    data = _decode(s)
 
     if checksum:
         data, the_hash = data[:-4], data[-4:]
-        if utils.hash256(data)[:4] == the_hash:
+        if utils.hash256(data, network)[:4] == the_hash:
             return data
         raise ValueError("hashed base58 has bad checksum %s" % s)
 
     return data
 
 
+def encode_many(
+        datas: Iterable[bytes],
+        checksum: bool = True,
+        network: Optional[Type['riemann.networks.Network']] = None
+) -> List[str]:
+    '''
+    Convert many bytestrings to base58, in order. Equivalent to calling
+    encode on each, but resolves the network once for the whole batch.
+    '''
+    if not checksum:
+        return [_encode(data) for data in datas]
+    hash256 = (network or riemann.get_current_network()).HASH256
+    return [_encode(data + hash256(data)[:4]) for data in datas]
+
+
+def decode_many(
+        strings: Iterable[str],
+        checksum: bool = True,
+        network: Optional[Type['riemann.networks.Network']] = None
+) -> List[bytes]:
+    '''
+    Convert many base58 strings to binary, in order. Equivalent to calling
+    decode on each, but resolves the network once for the whole batch.
+    '''
+    network = network or riemann.get_current_network()
+    return [decode(s, checksum, network) for s in strings]
+
+
+def _encode(data: bytes) -> str:
+    '''
+    Convert binary to base58. Equivalent to from_long(to_long(data)), but
+    does its arithmetic on machine-sized chunks of the number.
+    '''
+    n = int.from_bytes(data, 'big')
+    pairs = _PAIRS
+    chunks = []
+    while n:
+        n, chunk = divmod(n, _CHUNK_BASE)
+        chunk, a = divmod(chunk, _PAIR_BASE)
+        chunk, b = divmod(chunk, _PAIR_BASE)
+        chunk, c = divmod(chunk, _PAIR_BASE)
+        e, d = divmod(chunk, _PAIR_BASE)
+        chunks.extend((pairs[a], pairs[b], pairs[c], pairs[d], pairs[e]))
+    chunks.reverse()
+    # Leading zero bytes are written as leading 1s. The padding of the top
+    # chunk is stripped first.
+    zeros = len(data) - len(data.lstrip(b'\x00'))
+    return (b'1' * zeros + b''.join(chunks).lstrip(b'1')).decode('ascii')
+
+
+def _decode(s: str) -> bytes:
+    '''
+    Convert base58 to binary. Equivalent to from_long(to_long(s)), but
+    translates the characters to digits in one pass.
+    '''
+    encoded = s.encode('utf8')
+    invalid = encoded.translate(None, BASE58_ALPHABET)
+    if invalid:
+        raise ValueError(
+            f"bad character {invalid[0]!r} in string {encoded!r}")
+    n = 0
+    for digit in encoded.translate(_DIGITS):
+        n = n * BASE58_BASE + digit
+    zeros = len(encoded) - len(encoded.lstrip(b'1'))
+    return b'\x00' * zeros + n.to_bytes((n.bit_length() + 7) // 8, 'big')
+
+
 def encode_with_checksum(data: bytes) -> str:
     '''
     A "hashed_base58" structure is a base58 integer (which looks like a string)
@@ -22,30 +22,86 @@
 
 '''Reference implementation for Bech32 and segwit addresses.'''
 
+import functools
 import riemann
 
+from typing import Iterable, List, Optional, Type
 
-CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
 
+CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
 
-def encode(data: bytes) -> str:
-    '''Convert bytes to bech32'''
-    if riemann.network.BECH32_HRP is None:
+# Maps characters to their 5-bit values, and all other bytes to 0xff
+_DECODE_TABLE = bytes(CHARSET.find(chr(i)) & 0xff for i in range(256))
+
+_GENERATOR = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
+
+# The XOR of the generator terms selected by each 5-bit value of the top of
+# the checksum
+_GENERATOR_TABLE = [0] * 32
+for _top in range(32):
+    for _i in range(5):
+        if (_top >> _i) & 1:
+            _GENERATOR_TABLE[_top] ^= _GENERATOR[_i]
+
+
+def encode(
+        data: bytes,
+        network: Optional[Type['riemann.networks.Network']] = None) -> str:
+    '''
+    Convert bytes to bech32. Uses the HRP of network, or of the current
+    network if network is None
+    '''
+    hrp = _network_hrp(network or riemann.get_current_network())
+    return segwit_encode(hrp, data[0], data[2:])
+
+
+def decode(
+        bech: str,
+        network: Optional[Type['riemann.networks.Network']] = None) -> bytes:
+    '''
+    Convert bech32 to bytes. Uses the HRP of network, or of the current
+    network if network is None
+    '''
+    hrp = _network_hrp(network or riemann.get_current_network())
+    return _segwit_decode_bytes(hrp, bech)
+
+
+def encode_many(
+        datas: Iterable[bytes],
+        network: Optional[Type['riemann.networks.Network']] = None
+) -> List[str]:
+    '''
+    Convert many bytestrings to bech32, in order. Equivalent to calling
+    encode on each, but resolves the network once for the whole batch
+    '''
+    hrp = _network_hrp(network or riemann.get_current_network())
+    return [segwit_encode(hrp, data[0], data[2:]) for data in datas]
+
+
+def decode_many(
+        bechs: Iterable[str],
+        network: Optional[Type['riemann.networks.Network']] = None
+) -> List[bytes]:
+    '''
+    Convert many bech32 strings to bytes, in order. Equivalent to calling
+    decode on each, but resolves the network once for the whole batch
+    '''
+    hrp = _network_hrp(network or riemann.get_current_network())
+    return [_segwit_decode_bytes(hrp, bech) for bech in bechs]
+
+
+def _network_hrp(network: Type['riemann.networks.Network']) -> str:
+    '''Returns the network's HRP, or errors if it does not support bech32'''
+    if network.BECH32_HRP is None:
         raise ValueError(
             'Network ({}) does not support bech32 encoding.'
-            .format(riemann.get_current_network_name()))
-    return segwit_encode(riemann.network.BECH32_HRP, data[0], data[2:])
-
+            .format(riemann.get_network_name(network)))
+    return network.BECH32_HRP
 
-def decode(bech: str) -> bytes:
-    '''Convert bech32 to bytes'''
-    if riemann.network.BECH32_HRP is None:
-        raise ValueError(
-            'Network ({}) does not support bech32 encoding.'
-            .format(riemann.get_current_network_name()))
 
-    (version_prefix, hash_int_array) = \
-        segwit_decode(riemann.network.BECH32_HRP, bech)
+def _segwit_decode_bytes(hrp: str, bech: str) -> bytes:
+    '''Decode a segwit address to its version, length, and program'''
+    (version_prefix, hash_int_array) = segwit_decode(hrp, bech)
     ret = bytearray()
     ret.extend([version_prefix])
     ret.extend([len(hash_int_array)])
@@ -84,31 +140,32 @@ def bech32_encode(hrp, data):
 
 def bech32_decode(bech):
     '''Validate a Bech32 string, and determine HRP and data.'''
-    if ((any(ord(x) < 33 or ord(x) > 126 for x in bech))
+    # Every character must be printable ASCII other than space
+    if ((not bech.isascii() or not bech.isprintable() or ' ' in bech)
             or (bech.lower() != bech and bech.upper() != bech)):
         return (None, None)
     bech = bech.lower()
     pos = bech.rfind('1')
     if pos < 1 or pos + 7 > len(bech) or len(bech) > 90:
         return (None, None)
-    if not all(x in CHARSET for x in bech[pos + 1:]):
+    values = bech[pos + 1:].encode().translate(_DECODE_TABLE)
+    if 0xff in values:
         return (None, None)
     hrp = bech[:pos]
-    data = [CHARSET.find(x) for x in bech[pos + 1:]]
+    data = list(values)
     if not bech32_verify_checksum(hrp, data):
         return (None, None)
     return (hrp, data[:-6])
 
 
-def bech32_polymod(values):
-    '''Internal function that computes the Bech32 checksum.'''
-    generator = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
-    chk = 1
+def bech32_polymod(values, chk=1):
+    '''
+    Internal function that computes the Bech32 checksum. Pass chk to
+    continue from the result of an earlier call.
+    '''
+    table = _GENERATOR_TABLE
     for value in values:
-        top = chk >> 25
-        chk = (chk & 0x1ffffff) << 5 ^ value
-        for i in range(5):
-            chk ^= generator[i] if ((top >> i) & 1) else 0
+        chk = (chk & 0x1ffffff) << 5 ^ value ^ table[chk >> 25]
     return chk
 
 
@@ -117,36 +174,47 @@ def bech32_hrp_expand(hrp):
     return [ord(x) >> 5 for x in hrp] + [0] + [ord(x) & 31 for x in hrp]
 
 
+@functools.lru_cache(maxsize=32)
+def _hrp_polymod(hrp):
+    '''The checksum state after the expanded HRP. Shared by each address'''
+    return bech32_polymod(bech32_hrp_expand(hrp))
+
+
 def bech32_verify_checksum(hrp, data):
     '''Verify a checksum given HRP and converted data characters.'''
-    return bech32_polymod(bech32_hrp_expand(hrp) + data) == 1
+    return bech32_polymod(data, _hrp_polymod(hrp)) == 1
 
 
 def bech32_create_checksum(hrp, data):
     '''Compute the checksum values given HRP and data.'''
-    values = bech32_hrp_expand(hrp) + data
-    polymod = bech32_polymod(values + [0, 0, 0, 0, 0, 0]) ^ 1
+    polymod = bech32_polymod(
+        data + [0, 0, 0, 0, 0, 0], _hrp_polymod(hrp)) ^ 1
     return [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
 
 
 def convertbits(data, frombits, tobits, pad=True):
     '''General power-of-2 base conversion.'''
-    acc = 0
-    bits = 0
-    ret = []
-    maxv = (1 << tobits) - 1
-    max_acc = (1 << (frombits + tobits - 1)) - 1
-    for value in data:
-        if value < 0 or (value >> frombits):
-            return None
-        acc = ((acc << frombits) | value) & max_acc
-        bits += frombits
-        while bits >= tobits:
-            bits -= tobits
-            ret.append((acc >> bits) & maxv)
+    if frombits == 8 and isinstance(data, (bytes, bytearray)):
+        acc = int.from_bytes(data, 'big')
+        bits = 8 * len(data)
+    else:
+        acc = 0
+        bits = 0
+        for value in data:
+            if value < 0 or (value >> frombits):
+                return None
+            acc = (acc << frombits) | value
+            bits += frombits
+    excess = bits % tobits
     if pad:
-        if bits:
-            ret.append((acc << (tobits - bits)) & maxv)
-    elif bits >= frombits or ((acc << (tobits - bits)) & maxv):
+        if excess:
+            acc <<= tobits - excess
+            bits += tobits - excess
+    elif excess >= frombits or acc & ((1 << excess) - 1):
         return None
-    return ret
+    else:
+        acc >>= excess
+        bits -= excess
+    maxv = (1 << tobits) - 1
+    return [(acc >> shift) & maxv
+            for shift in range(bits - tobits, -1, -tobits)]
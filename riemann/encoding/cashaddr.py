@@ -21,37 +21,96 @@
 # SOFTWARE.
 
 
+import functools
 import riemann
+from riemann.encoding.bech32 import convertbits  # noqa: F401
 
-CHARSET = 'qpzry9x8gf2tvdw0s3jn54khce6mua7l'
-
+from typing import Iterable, List, Optional, Type
 
-def encode(data: bytes) -> str:
-    '''Convert bytes to cashaddr-bech32'''
-    if riemann.network.CASHADDR_PREFIX is None:
+CHARSET = 'qpzry9x8gf2tvdw0s3jn54khce6mua7l'
+_CHARSET_VALUES = {c: i for i, c in enumerate(CHARSET)}
+
+# The XOR of the generator terms selected by each 5-bit value of the top of
+# the checksum
+_GENERATOR = [0x98f2bc8e61, 0x79b76d99e2, 0xf33e5fb3c4, 0xae2eabe2a8,
+              0x1e4f43e470]
+_GENERATOR_TABLE = [0] * 32
+for _top in range(32):
+    for _i in range(5):
+        if (_top >> _i) & 1:
+            _GENERATOR_TABLE[_top] ^= _GENERATOR[_i]
+
+
+def encode(
+        data: bytes,
+        network: Optional[Type['riemann.networks.Network']] = None) -> str:
+    '''
+    Convert bytes to cashaddr-bech32. Uses the prefix of network, or of
+    the current network if network is None
+    '''
+    prefix = _network_prefix(network or riemann.get_current_network())
+    return _encode(prefix, data)
+
+
+def decode(
+        data: str,
+        network: Optional[Type['riemann.networks.Network']] = None) -> bytes:
+    '''
+    Convert cashaddr-bech32 to bytes. Uses the prefix of network, or of
+    the current network if network is None
+    '''
+    prefix = _network_prefix(network or riemann.get_current_network())
+    return _decode(prefix, data)
+
+
+def encode_many(
+        datas: Iterable[bytes],
+        network: Optional[Type['riemann.networks.Network']] = None
+) -> List[str]:
+    '''
+    Convert many bytestrings to cashaddr-bech32, in order. Equivalent to
+    calling encode on each, but resolves the network once for the whole batch
+    '''
+    prefix = _network_prefix(network or riemann.get_current_network())
+    return [_encode(prefix, data) for data in datas]
+
+
+def decode_many(
+        datas: Iterable[str],
+        network: Optional[Type['riemann.networks.Network']] = None
+) -> List[bytes]:
+    '''
+    Convert many cashaddr-bech32 strings to bytes, in order. Equivalent to
+    calling decode on each, but resolves the network once for the whole batch
+    '''
+    prefix = _network_prefix(network or riemann.get_current_network())
+    return [_decode(prefix, data) for data in datas]
+
+
+def _network_prefix(network: Type['riemann.networks.Network']) -> str:
+    '''Returns the network's prefix, or errors if it has no cashaddrs'''
+    if network.CASHADDR_PREFIX is None:
         raise ValueError('Network {} does not support cashaddresses.'
-                         .format(riemann.get_current_network_name()))
+                         .format(riemann.get_network_name(network)))
+    return network.CASHADDR_PREFIX
+
 
+def _encode(prefix: str, data: bytes) -> str:
     data = convertbits(data, 8, 5)
-    checksum = calculate_checksum(riemann.network.CASHADDR_PREFIX, data)
+    checksum = calculate_checksum(prefix, data)
 
     payload = b32encode(data + checksum)
 
     form = '{prefix}:{payload}'
     return form.format(
-        prefix=riemann.network.CASHADDR_PREFIX,
+        prefix=prefix,
         payload=payload)
 
 
-def decode(data: str) -> bytes:
-    '''Convert cashaddr-bech32 to bytes'''
-
-    if riemann.network.CASHADDR_PREFIX is None:
-        raise ValueError('Network {} does not support cashaddresses.'
-                         .format(riemann.get_current_network_name()))
-    if data.find(riemann.network.CASHADDR_PREFIX) != 0:
+def _decode(network_prefix: str, data: str) -> bytes:
+    if data.find(network_prefix) != 0:
         raise ValueError('Malformed cashaddr. Cannot locate prefix: {}'
-                         .format(riemann.network.CASHADDR_PREFIX))
+                         .format(network_prefix))
 
     # the data is everything after the colon
     prefix, data = data.split(':')
@@ -64,28 +123,33 @@ def decode(data: str) -> bytes:
 
 
 def polymod(values):
-    chk = 1
-    generator = [
-        (0x01, 0x98f2bc8e61),
-        (0x02, 0x79b76d99e2),
-        (0x04, 0xf33e5fb3c4),
-        (0x08, 0xae2eabe2a8),
-        (0x10, 0x1e4f43e470)]
+    return _polymod(values) ^ 1
+
+
+def _polymod(values, chk=1):
+    '''
+    The unfinalized checksum state. Pass chk to continue from the result of
+    an earlier call.
+    '''
+    table = _GENERATOR_TABLE
     for value in values:
-        top = chk >> 35
-        chk = ((chk & 0x07ffffffff) << 5) ^ value
-        for i in generator:
-            if top & i[0] != 0:
-                chk ^= i[1]
-    return chk ^ 1
+        chk = ((chk & 0x07ffffffff) << 5) ^ value ^ table[chk >> 35]
+    return chk
 
 
 def prefix_expand(prefix):
     return [ord(x) & 0x1f for x in prefix] + [0]
 
 
+@functools.lru_cache(maxsize=32)
+def _prefix_polymod(prefix):
+    '''The checksum state after the expanded prefix. Shared by each address'''
+    return _polymod(prefix_expand(prefix))
+
+
 def calculate_checksum(prefix, payload):
-    poly = polymod(prefix_expand(prefix) + payload + [0, 0, 0, 0, 0, 0, 0, 0])
+    poly = _polymod(
+        payload + [0, 0, 0, 0, 0, 0, 0, 0], _prefix_polymod(prefix)) ^ 1
     out = list()
     for i in range(8):
         out.append((poly >> 5 * (7 - i)) & 0x1f)
@@ -93,40 +157,13 @@ def calculate_checksum(prefix, payload):
 
 
 def verify_checksum(prefix, payload):
-    return polymod(prefix_expand(prefix) + payload) == 0
+    return _polymod(payload, _prefix_polymod(prefix)) ^ 1 == 0
 
 
 def b32decode(inputs):
-    out = list()
-    for letter in inputs:
-        out.append(CHARSET.find(letter))
-    return out
+    get = _CHARSET_VALUES.get
+    return [get(letter, -1) for letter in inputs]
 
 
 def b32encode(inputs):
-    out = ''
-    for char_code in inputs:
-        out += CHARSET[char_code]
-    return out
-
-
-def convertbits(data, frombits, tobits, pad=True):
-    acc = 0
-    bits = 0
-    ret = []
-    maxv = (1 << tobits) - 1
-    max_acc = (1 << (frombits + tobits - 1)) - 1
-    for value in data:
-        if value < 0 or (value >> frombits):
-            return None
-        acc = ((acc << frombits) | value) & max_acc
-        bits += frombits
-        while bits >= tobits:
-            bits -= tobits
-            ret.append((acc >> bits) & maxv)
-    if pad:
-        if bits:
-            ret.append((acc << (tobits - bits)) & maxv)
-    elif bits >= frombits or ((acc << (tobits - bits)) & maxv):
-        return None
-    return ret
+    return ''.join([CHARSET[char_code] for char_code in inputs])
@@ -1,5 +1,6 @@
+from riemann import utils
 from riemann.encoding import base58, bech32, cashaddr
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 
 class Network:
@@ -28,6 +29,11 @@ class Network:
     CASHADDR_P2PKH: Optional[bytes] = None
     CODE_TO_INT_OVERWRITE: Dict[str, int] = {}
     INT_TO_CODE_OVERWRITE: Dict[int, str] = {}
+    # Resolved once here, so hashing never has to inspect the network name
+    HASH160: Callable[[bytes], bytes] = staticmethod(utils.sha256_hash160)
+    HASH256: Callable[[bytes], bytes] = staticmethod(utils.double_sha256)
+    # Reject VarInts that are not minimally encoded
+    COMPACT_VAR_INTS: bool = False
 
 
 class BitcoinMain(Network):
@@ -270,6 +276,7 @@ class ZcashOverwinterMain(Network):
     P2PKH_PREFIX = b'\x1c\xb8'
     P2SH_PREFIX = b'\x1c\xbd'
     SEGWIT = False
+    COMPACT_VAR_INTS = True
 
 
 class ZcashOverwinterTest(Network):
@@ -279,6 +286,7 @@ class ZcashOverwinterTest(Network):
     P2PKH_PREFIX = b'\x1d\x25'
     P2SH_PREFIX = b'\x1c\xba'
     SEGWIT = False
+    COMPACT_VAR_INTS = True
 
 
 class ZcashOverwinterRegtest(Network):
@@ -288,6 +296,7 @@ class ZcashOverwinterRegtest(Network):
     P2PKH_PREFIX = b'\x1d\x25'
     P2SH_PREFIX = b'\x1c\xba'
     SEGWIT = False
+    COMPACT_VAR_INTS = True
 
 
 class ZcashSaplingMain(Network):
@@ -297,6 +306,7 @@ class ZcashSaplingMain(Network):
     P2PKH_PREFIX = b'\x1c\xb8'
     P2SH_PREFIX = b'\x1c\xbd'
     SEGWIT = False
+    COMPACT_VAR_INTS = True
 
 
 class ZcashSaplingTest(Network):
@@ -306,6 +316,7 @@ class ZcashSaplingTest(Network):
     P2PKH_PREFIX = b'\x1d\x25'
     P2SH_PREFIX = b'\x1c\xba'
     SEGWIT = False
+    COMPACT_VAR_INTS = True
 
 
 class ZcashSaplingRegtest(Network):
@@ -315,6 +326,7 @@ class ZcashSaplingRegtest(Network):
     P2PKH_PREFIX = b'\x1d\x25'
     P2SH_PREFIX = b'\x1c\xba'
     SEGWIT = False
+    COMPACT_VAR_INTS = True
 
 
 class DecredMain(Network):
@@ -331,6 +343,8 @@ class DecredMain(Network):
     ]
     CODE_TO_INT_OVERWRITE = dict(o for o in OPCODE_CHANGES)
     INT_TO_CODE_OVERWRITE = dict((o[1], o[0]) for o in OPCODE_CHANGES)
+    HASH160 = staticmethod(utils.blake256_hash160)
+    HASH256 = staticmethod(utils.double_blake256)
 
 
 class DecredTest(Network):
@@ -347,6 +361,8 @@ class DecredTest(Network):
     ]
     CODE_TO_INT_OVERWRITE = dict(o for o in OPCODE_CHANGES)
     INT_TO_CODE_OVERWRITE = dict((o[1], o[0]) for o in OPCODE_CHANGES)
+    HASH160 = staticmethod(utils.blake256_hash160)
+    HASH256 = staticmethod(utils.double_blake256)
 
 
 class DecredSimnet(Network):
@@ -362,6 +378,8 @@ class DecredSimnet(Network):
     ]
     CODE_TO_INT_OVERWRITE = dict(o for o in OPCODE_CHANGES)
     INT_TO_CODE_OVERWRITE = dict((o[1], o[0]) for o in OPCODE_CHANGES)
+    HASH160 = staticmethod(utils.blake256_hash160)
+    HASH256 = staticmethod(utils.double_blake256)
 
 
 class PivxMain(Network):
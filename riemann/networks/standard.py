@@ -1,43 +1,359 @@
+'''
+Analogs of Bitcoin's standardness policy: the checks a node makes before
+relaying a transaction or accepting it to its mempool.
+
+Script verification is out of scope. Riemann is not a Script VM, so the
+checks Bitcoin makes by executing scripts under its standard script
+verification flags are not performed.
+'''
+import riemann
+from riemann import networks
 from riemann import tx
 from riemann import utils as rutils
-from riemann.encoding import addresses as addr
+from riemann.script import classify
 from riemann.script import serialization as ser
 from riemann.script import opcodes
+from riemann.script import sigops
+from riemann.script.classify import ScriptType
+
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Type, \
+    Union
 
 MAX_STANDARD_TX_WEIGHT = 400000
 MIN_STANDARD_TX_NONWITNESS_SIZE = 82
+MAX_OP_RETURN_RELAY = 83
+
+OP_1 = opcodes.CODE_TO_INT['OP_1']
+OP_16 = opcodes.CODE_TO_INT['OP_16']
+
+# TX_PUBKEYHASH, TX_SCRIPTHASH, TX_WITNESS_V0_KEYHASH,
+# TX_WITNESS_V0_SCRIPTHASH, TX_PUBKEY and TX_WITNESS_UNKNOWN. Paying future
+# witness versions, e.g. taproot, is standard. Spending them is not
+STANDARD_OUTPUT_TYPES = frozenset([
+    ScriptType.P2PKH,
+    ScriptType.P2SH,
+    ScriptType.P2WPKH,
+    ScriptType.P2WSH,
+    ScriptType.P2PK,
+    ScriptType.WITNESS_UNKNOWN,
+])
+
+WITNESS_PROGRAM_TYPES = frozenset([
+    ScriptType.P2WPKH,
+    ScriptType.P2WSH,
+    ScriptType.WITNESS_UNKNOWN,
+])
+
+# BIP68 relative lock-time fields of an input's sequence number
+SEQUENCE_FINAL = 0xffffffff
+SEQUENCE_LOCKTIME_DISABLE_FLAG = 1 << 31
+SEQUENCE_LOCKTIME_TYPE_FLAG = 1 << 22
+SEQUENCE_LOCKTIME_MASK = 0x0000ffff
+SEQUENCE_LOCKTIME_GRANULARITY = 9
+
+# The reasons check_tx_policy reports, in the order they are checked. These
+# are the reject reasons Bitcoin's mempool uses
+REASONS = (
+    'version',
+    'tx-size',
+    'scriptsig-size',
+    'scriptsig-not-pushonly',
+    'scriptpubkey',
+    'bare-multisig',
+    'dust',
+    'multi-op-return',
+    'tx-size-small',
+    'non-final',
+    'bad-txns-nonstandard-inputs',
+    'bad-witness-nonstandard',
+    'non-BIP68-final',
+    'bad-txns-too-many-sigops',
+)
+
+
+class Policy(NamedTuple):
+    '''
+    The parameters of a network's relay policy. Defaults follow Bitcoin.
+
+    Attributes:
+        max_version: the highest standard tx version
+        max_tx_weight: the largest standard tx weight
+        min_tx_nonwitness_size: the smallest standard tx, without witnesses
+        max_scriptsig_size: the largest standard script sig
+        max_op_return_relay: the largest standard OP_RETURN output script
+        permit_bare_multisig: False to reject bare multisig outputs
+        max_bare_multisig_keys: the most keys in a standard bare multisig
+        dust_relay_fee: the feerate, in satoshi per 1000 bytes, used to
+                        find the dust threshold of an output
+        max_tx_sigops_cost: the highest standard sigop cost of a tx
+        max_p2sh_sigops: the most sigops in a standard P2SH redeem script
+        max_p2wsh_script_size: the largest standard P2WSH witness script
+        max_p2wsh_stack_items: the most standard P2WSH stack items, not
+                               counting the witness script
+        max_p2wsh_stack_item_size: the largest standard P2WSH stack item
+    '''
+    max_version: int = 2
+    max_tx_weight: int = MAX_STANDARD_TX_WEIGHT
+    min_tx_nonwitness_size: int = MIN_STANDARD_TX_NONWITNESS_SIZE
+    max_scriptsig_size: int = 1650
+    max_op_return_relay: int = MAX_OP_RETURN_RELAY
+    permit_bare_multisig: bool = True
+    max_bare_multisig_keys: int = 3
+    dust_relay_fee: int = 3000
+    max_tx_sigops_cost: int = 16000
+    max_p2sh_sigops: int = 15
+    max_p2wsh_script_size: int = 3600
+    max_p2wsh_stack_items: int = 100
+    max_p2wsh_stack_item_size: int = 80
+
+
+DEFAULT_POLICY = Policy()
+
+# Policies that differ from Bitcoin's, keyed by network name
+NETWORK_POLICIES: Dict[str, Policy] = {
+    'bitcoin_cash': Policy(max_op_return_relay=223),
+}
+
+
+class Coin(NamedTuple):
+    '''
+    An output spent by a transaction, and when it was confirmed.
+
+    Attributes:
+        tx_out: the output being spent
+        height: the height of the block that confirmed it. None if it is
+                unconfirmed
+        median_time_past: the median time past of the block before the one
+                          that confirmed it. Required to check BIP68
+                          time locks on confirmed coins
+    '''
+    tx_out: tx.TxOut
+    height: Optional[int] = None
+    median_time_past: Optional[int] = None
+
+
+def get_policy(
+        network: Optional[Type[networks.Network]] = None) -> Policy:
+    '''
+    Args:
+        network: The network to use. Default the current network
+    Returns:
+        The relay policy of the network
+    '''
+    network = network or riemann.get_current_network()
+    return NETWORK_POLICIES.get(network.NETWORK_NAME, DEFAULT_POLICY)
+
+
+def check_tx_policy(
+        t: tx.Tx,
+        coins: Optional[Sequence[Union[Coin, tx.TxOut]]] = None,
+        policy: Optional[Policy] = None,
+        network: Optional[Type[networks.Network]] = None,
+        best_height: Optional[int] = None,
+        best_timestamp: int = 0) -> Optional[str]:
+    '''
+    Analog of the policy checks in Bitcoin's mempool acceptance. Evaluates
+    every rule in one pass over the inputs and one over the outputs, and
+    reports the first failure in the order of REASONS.
+
+    Without coins, the rules that need the spent outputs are skipped, and
+    only legacy sigops are counted. Without best_height, the finality rules
+    are skipped.
+
+    Args:
+        t:              the transaction
+        coins:          the outputs spent by each input, in order, as Coins
+                        or TxOuts
+        policy:         the policy to check against. Default the network's
+        network:        the network to use. Default the current network
+        best_height:    the height of the chain tip
+        best_timestamp: the median time past of the chain tip
+    Returns:
+        The reason the tx is non-standard, or None if it is standard
+    Raises:
+        ValueError: if an input has a BIP68 time lock, and its coin has a
+                    height but no median_time_past
+    '''
+    policy = policy or get_policy(network)
+
+    # 'version'
+    if not 1 <= rutils.le2i(t.version) <= policy.max_version:
+        return 'version'
+
+    # 'tx-size'
+    if t.weight > policy.max_tx_weight:
+        return 'tx-size'
+
+    failed = set()
+    sigop_cost = t.legacy_sigops * tx.WITNESS_SCALE_FACTOR
+    bip68 = best_height is not None and rutils.le2i(t.version) >= 2
+    min_height = -1
+    min_time = -1
+    witnesses = t.tx_witnesses or ()
+
+    for i, tx_in in enumerate(t.tx_ins):
+        script_sig = tx_in.script_sig
+
+        # 'scriptsig-size'
+        if len(script_sig) > policy.max_scriptsig_size:
+            return 'scriptsig-size'
+
+        # 'scriptsig-not-pushonly'
+        if not is_push_only(script_sig):
+            return 'scriptsig-not-pushonly'
+
+        if coins is None:
+            continue
+
+        coin = _as_coin(coins[i])
+        stack = _witness_items(witnesses, i)
+        prev_type, prev_script, redeem_script = _spend(tx_in, coin)
+
+        # 'bad-txns-nonstandard-inputs'
+        if not _is_input_standard(prev_type, redeem_script, policy):
+            failed.add('bad-txns-nonstandard-inputs')
+
+        # 'bad-witness-nonstandard'
+        if not _is_witness_standard(
+                prev_type, prev_script, redeem_script, stack, policy):
+            failed.add('bad-witness-nonstandard')
+
+        # 'bad-txns-too-many-sigops'
+        if redeem_script is not None:
+            sigop_cost += (sigops.count_sigops(redeem_script, accurate=True)
+                           * tx.WITNESS_SCALE_FACTOR)
+        sigop_cost += sigops.count_witness_sigops(
+            script_sig, prev_script, stack)
+
+        # 'non-BIP68-final'
+        if bip68:
+            lock_height, lock_time = _sequence_lock(
+                tx_in, coin, best_height, best_timestamp)
+            min_height = max(min_height, lock_height)
+            min_time = max(min_time, lock_time)
+
+    op_returns = 0
+    for o in t.tx_outs:
+        output_script = o.output_script
+        script_type = classify.classify_output_script(output_script)
+
+        # 'scriptpubkey'
+        if not _is_standard_output_type(o, script_type, policy):
+            return 'scriptpubkey'
+
+        # 'bare-multisig'
+        if (script_type is ScriptType.MULTISIG
+                and not policy.permit_bare_multisig):
+            return 'bare-multisig'
+
+        # 'dust'
+        if rutils.le2i(o.value) < _dust_threshold(o, script_type, policy):
+            return 'dust'
+
+        op_returns += script_type is ScriptType.OP_RETURN
 
+    # 'multi-op-return'
+    if op_returns > 1:
+        return 'multi-op-return'
+
+    # 'tx-size-small'
+    if not check_tx_size_small(t, policy):
+        return 'tx-size-small'
+
+    # 'non-final'
+    if (best_height is not None
+            and not check_final(t, best_height, best_timestamp)):
+        return 'non-final'
+
+    for reason in ('bad-txns-nonstandard-inputs', 'bad-witness-nonstandard'):
+        if reason in failed:
+            return reason
+
+    # 'non-BIP68-final'
+    if bip68 and (min_height > best_height or min_time >= best_timestamp):
+        return 'non-BIP68-final'
+
+    # 'bad-txns-too-many-sigops'
+    if sigop_cost > policy.max_tx_sigops_cost:
+        return 'bad-txns-too-many-sigops'
+
+    return None
+
+
+def check_tx_policies(
+        txs: Sequence[tx.Tx],
+        coins: Optional[Sequence[Optional[Sequence[Union[Coin, tx.TxOut]]]]]
+        = None,
+        policy: Optional[Policy] = None,
+        network: Optional[Type[networks.Network]] = None,
+        best_height: Optional[int] = None,
+        best_timestamp: int = 0,
+        processes: Optional[int] = None) -> List[Optional[str]]:
+    '''
+    Runs check_tx_policy on many transactions, in order.
 
-def check_is_standard_tx(t: tx.Tx) -> bool:
+    Args:
+        txs:            the transactions
+        coins:          the coins spent by each transaction, or None
+        policy:         the policy to check against. Default the network's
+        network:        the network to use. Default the current network
+        best_height:    the height of the chain tip
+        best_timestamp: the median time past of the chain tip
+        processes:      the number of worker processes to check the txs
+                        in. Default None, to check them in this process
+    Returns:
+        The reason each tx is non-standard, or None if it is standard
+    '''
+    policy = policy or get_policy(network)
+    txs = list(txs)
+    tx_coins = list(coins) if coins is not None else [None] * len(txs)
+    return rutils.map_chunks(
+        _check_tx_policies, list(zip(txs, tx_coins)), policy, best_height,
+        best_timestamp, processes=processes)
+
+
+def _check_tx_policies(
+        txs_and_coins: Sequence[
+            Tuple[tx.Tx, Optional[Sequence[Union[Coin, tx.TxOut]]]]],
+        policy: Policy,
+        best_height: Optional[int],
+        best_timestamp: int) -> List[Optional[str]]:
+    '''Checks each tx against its coins. The worker of check_tx_policies'''
+    return [
+        check_tx_policy(t, coins, policy, None, best_height, best_timestamp)
+        for t, coins in txs_and_coins]
+
+
+def check_is_standard_tx(t: tx.Tx, policy: Optional[Policy] = None) -> bool:
     '''
     Analog of Bitcoin's IsStandardTx
     Args:
         t (tx.Tx): the transaction
+        policy (Policy): the policy. Default the current network's
     Returns:
         (bool): True for standard, false for non-standard
     '''
+    policy = policy or get_policy()
+
     # 'version'
-    if t.version[0] not in [1, 2]:
+    if not 1 <= rutils.le2i(t.version) <= policy.max_version:
         return False
 
     # 'tx-size'
-    if len(t.no_witness()) * 3 + len(t) > MAX_STANDARD_TX_WEIGHT:
+    if t.weight > policy.max_tx_weight:
         return False
 
     for tx_in in t.tx_ins:
-        try:
-            # 'scriptsig-size'
-            # 'scriptsig-not-pushonly'
-            if (len(tx_in.script_sig) > 1650
-                    or not is_push_only(tx_in.script_sig)):
-                return False
-        except Exception:
+        # 'scriptsig-size'
+        # 'scriptsig-not-pushonly'
+        if (len(tx_in.script_sig) > policy.max_scriptsig_size
+                or not is_push_only(tx_in.script_sig)):
             return False
 
     # 'scriptpubkey'
     # 'dust'
     # 'multi-op-return'
-    if not check_is_standard(t):
+    if not check_is_standard(t, policy):
         return False
 
     return True
@@ -46,120 +362,148 @@ def check_is_standard_tx(t: tx.Tx) -> bool:
 def is_push_only(script_sig: bytes) -> bool:
     '''
     Determines whether a script is push-only
-    Does this by parsing, and inspecting non-data elements
+    Does this by walking its opcodes. Like Bitcoin, OP_RESERVED counts as a
+    push, and scripts with truncated pushes are not push-only
     Args:
         script_sig (bytes): the scriptSig
     Returns:
         (bool): True if Push Only, otherwise False
     '''
-    script = ser.deserialize(script_sig)
-    non_data_opcodes = [t for t in script if t[0:3] == 'OP_']
-    for token in non_data_opcodes:
-        integer_opcode = opcodes.CODE_TO_INT[token]
-        if (integer_opcode in [79, 80]
-                or integer_opcode >= 97):
-            return False
-    return True
+    try:
+        return all(op[0] <= OP_16 for op in ser.iter_script_ops(script_sig))
+    except IndexError:
+        return False
 
 
-def check_is_standard(t: tx.Tx) -> bool:
+def check_is_standard(t: tx.Tx, policy: Optional[Policy] = None) -> bool:
     '''
     Analog of Bitcoin's IsStandard
     Args:
         t (tx.Tx): the transaction to check
+        policy (Policy): the policy. Default the current network's
     Returns:
         (bool): True for standard, false for non-standard
     '''
+    policy = policy or get_policy()
+    op_returns = 0
     for o in t.tx_outs:
+        script_type = classify.classify_output_script(o.output_script)
+
         # 'scriptpubkey'
-        if not is_standard_output_type(o):
+        # 'bare-multisig'
+        if (not _is_standard_output_type(o, script_type, policy)
+                or (script_type is ScriptType.MULTISIG
+                    and not policy.permit_bare_multisig)):
             return False
 
         # 'dust'
-        if (rutils.le2i(o.value) < 550
-                and o.output_script[:2] != b'\x00\x14'):
+        if rutils.le2i(o.value) < _dust_threshold(o, script_type, policy):
             return False
 
+        op_returns += script_type is ScriptType.OP_RETURN
+
     # 'multi-op-return'
-    if len([is_op_return(o) for o in t.tx_outs]) > 1:
+    if op_returns > 1:
         return False
 
     return True
 
 
-def is_op_return(o: tx.TxOut) -> bool:
+def is_op_return(o: tx.TxOut, policy: Optional[Policy] = None) -> bool:
     '''
     Checks whether a txout is standard TX_NULL_DATA op_return output
     Args:
         o (tx.TxOut): the output
+        policy (Policy): the policy. Default the current network's
     Returns:
         (bool): True if standard opreturn, otherwise false
     '''
-    script: str = ser.deserialize(o.output_script)
-    split_script = script.split()
+    policy = policy or get_policy()
+    script_type = classify.classify_output_script(o.output_script)
+    return (script_type is ScriptType.OP_RETURN
+            and _is_standard_output_type(o, script_type, policy))
 
-    # TX_NULL_DATA, up to 83 bytes (80 for safety)
-    if (rutils.le2i(o.value) == 0
-            and split_script[0] == 'OP_RETURN'
-            and len(script) < 80):
-        return True
-    return False
 
-
-def is_standard_output_type(o: tx.TxOut) -> bool:
+def is_standard_output_type(
+        o: tx.TxOut,
+        policy: Optional[Policy] = None) -> bool:
     '''
     Checks standardness of an output based on its value and output script
     Args:
         o (tx.TxOut): the output the check
+        policy (Policy): the policy. Default the current network's
     Returns:
         (bool): True if standard, False otherwise
     '''
-    # TX_SCRIPTHASH
-    # TX_WITNESS_V0_KEYHASH
-    # TX_WITNESS_V0_SCRIPTHASH
-    # TX_PUBKEYHASH
-    try:
-        addr.from_output_script(o.output_script)
-        return True
-    except ValueError:
-        pass
+    return _is_standard_output_type(
+        o,
+        classify.classify_output_script(o.output_script),
+        policy or get_policy())
 
-    script: str = ser.deserialize(o.output_script)
-    split_script = script.split()
-
-    # TX_PUBKEY
-    if (split_script[-1] == 'OP_CHECKSIG'
-            and len(split_script) == 2
-            and len(bytes.fromhex(split_script[1])) in [33, 65]):
-        return True
 
+def _is_standard_output_type(
+        o: tx.TxOut,
+        script_type: ScriptType,
+        policy: Policy) -> bool:
     # TX_MULTISIG, up to x-of-3
-    if (split_script[-1] == 'OP_CHECKMULTISIG'
-            and split_script[-2] in ['OP_1', 'OP_2', 'OP_3']):
-
-        num_pubkeys = int(split_script[-2][-1])
-        num_sigs = int(split_script[0][-1])
+    if script_type is ScriptType.MULTISIG:
+        return (o.output_script[-2] - OP_1 + 1
+                <= policy.max_bare_multisig_keys)
 
-        if (num_sigs > num_pubkeys  # 3-of-2, or 16-of-3, or something
-                or len(split_script) != num_pubkeys + 3):  # some junk script
-            return False
-        for pubkey in split_script[1:-2]:
-            if len(bytes.fromhex(pubkey)) not in [33, 65]:
-                return False
-        return True
+    # TX_NULL_DATA, up to 83 bytes
+    if script_type is ScriptType.OP_RETURN:
+        return (rutils.le2i(o.value) == 0
+                and len(o.output_script) <= policy.max_op_return_relay)
 
-    # TX_NONSTANDARD/TX_WITNESS_UNKNOWN
-    return False
+    # TX_NONSTANDARD is not in STANDARD_OUTPUT_TYPES
+    return script_type in STANDARD_OUTPUT_TYPES
 
 
-def check_tx_size_small(t: tx.Tx) -> bool:
+def get_dust_threshold(
+        o: tx.TxOut,
+        policy: Optional[Policy] = None) -> int:
+    '''
+    Analog of Bitcoin's GetDustThreshold. An output is dust if it is worth
+    less than the fee to spend it at the policy's dust relay fee.
+    Args:
+        o (tx.TxOut): the output
+        policy (Policy): the policy. Default the current network's
+    Returns:
+        (int): the smallest standard value of the output, in satoshi
+    '''
+    return _dust_threshold(
+        o,
+        classify.classify_output_script(o.output_script),
+        policy or get_policy())
+
+
+def _dust_threshold(
+        o: tx.TxOut,
+        script_type: ScriptType,
+        policy: Policy) -> int:
+    # Unspendable outputs are never dust
+    if script_type is ScriptType.OP_RETURN:
+        return 0
+    size = len(o)
+    if script_type in WITNESS_PROGRAM_TYPES:
+        # outpoint, empty script sig, sequence, and a discounted witness
+        size += 32 + 4 + 1 + 107 // tx.WITNESS_SCALE_FACTOR + 4
+    else:
+        # outpoint, script sig with a signature and pubkey, sequence
+        size += 32 + 4 + 1 + 107 + 4
+    return size * policy.dust_relay_fee // 1000
+
+
+def check_tx_size_small(t: tx.Tx, policy: Optional[Policy] = None) -> bool:
     '''
     Args:
         t (tx.Tx): the transaction
+        policy (Policy): the policy. Default the current network's
     Returns:
         (bool): True for standard, False for non-standard
     '''
-    return len(t.no_witness()) >= MIN_STANDARD_TX_NONWITNESS_SIZE
+    policy = policy or get_policy()
+    return len(t.no_witness()) >= policy.min_tx_nonwitness_size
 
 
 def check_final(
@@ -168,34 +512,232 @@ def check_final(
         best_timestamp: int = 0) -> bool:
     '''
     Checks absolute locktime of a transaction.
-    Pass in the best height and timestamp
+    Pass in the best height and timestamp. Like Bitcoin's IsFinalTx, the
+    lock is ignored if every input has a final sequence number, and a time
+    lock must be before the median time past
     Args:
         t               (tx.Tx): the transaction
         best_height     (int): best known Bitcoin height
-        best_timestamp  (int): best known Bitcoin timestamp
+        best_timestamp  (int): median time past of the best block
     '''
     lock = rutils.le2i(t.lock_time)
     if lock >= 500_000_000:  # timelocked
-        return lock <= best_timestamp
+        if lock < best_timestamp:
+            return True
     else:  # height-locked
-        return lock <= best_height
+        if lock <= best_height:
+            return True
+    return all(rutils.le2i(tx_in.sequence) == SEQUENCE_FINAL
+               for tx_in in t.tx_ins)
+
 
+def check_bip68_final(
+        t: tx.Tx,
+        coins: Sequence[Union[Coin, tx.TxOut]],
+        best_height: int,
+        best_timestamp: int = 0) -> bool:
+    '''
+    Analog of Bitcoin's CheckSequenceLocks. Checks the relative locktimes
+    of a transaction's inputs.
+    Args:
+        t               (tx.Tx): the transaction
+        coins           (Sequence[Coin]): the coins spent by each input
+        best_height     (int): best known Bitcoin height
+        best_timestamp  (int): median time past of the best block
+    Returns:
+        (bool): True if the tx could be included in the next block
+    Raises:
+        ValueError: if an input has a time lock, and its coin has a height
+                    but no median_time_past
+    '''
+    if rutils.le2i(t.version) < 2:
+        return True
+    min_height = -1
+    min_time = -1
+    for tx_in, coin in zip(t.tx_ins, coins):
+        lock_height, lock_time = _sequence_lock(
+            tx_in, _as_coin(coin), best_height, best_timestamp)
+        min_height = max(min_height, lock_height)
+        min_time = max(min_time, lock_time)
+    # The tx would be included in the block after the best block
+    return min_height <= best_height and min_time < best_timestamp
+
+
+def check_nonstandard_inputs(
+        t: tx.Tx,
+        coins: Sequence[Union[Coin, tx.TxOut]],
+        policy: Optional[Policy] = None) -> bool:
+    '''
+    Analog of Bitcoin's AreInputsStandard
+    Args:
+        t (tx.Tx): the transaction
+        coins (Sequence[Coin]): the coins spent by each input
+        policy (Policy): the policy. Default the current network's
+    Returns:
+        (bool): True for standard, False for non-standard
+    '''
+    policy = policy or get_policy()
+    for tx_in, coin in zip(t.tx_ins, coins):
+        prev_type, _, redeem_script = _spend(tx_in, _as_coin(coin))
+        if not _is_input_standard(prev_type, redeem_script, policy):
+            return False
+    return True
+
+
+def check_witness_nonstandard(
+        t: tx.Tx,
+        coins: Sequence[Union[Coin, tx.TxOut]],
+        policy: Optional[Policy] = None) -> bool:
+    '''
+    Analog of Bitcoin's IsWitnessStandard
+    Args:
+        t (tx.Tx): the transaction
+        coins (Sequence[Coin]): the coins spent by each input
+        policy (Policy): the policy. Default the current network's
+    Returns:
+        (bool): True for standard, False for non-standard
+    '''
+    policy = policy or get_policy()
+    witnesses = t.tx_witnesses or ()
+    for i, (tx_in, coin) in enumerate(zip(t.tx_ins, coins)):
+        prev_type, prev_script, redeem_script = _spend(
+            tx_in, _as_coin(coin))
+        stack = _witness_items(witnesses, i)
+        if not _is_witness_standard(
+                prev_type, prev_script, redeem_script, stack, policy):
+            return False
+    return True
 
-def check_bip68_final():
-    ...
 
+def get_sigop_cost(
+        t: tx.Tx,
+        coins: Optional[Sequence[Union[Coin, tx.TxOut]]] = None) -> int:
+    '''
+    Analog of Bitcoin's GetTransactionSigOpCost. Without coins, only the
+    legacy sigops in script sigs and output scripts are counted.
+    Args:
+        t (tx.Tx): the transaction
+        coins (Sequence[Coin]): the coins spent by each input
+    Returns:
+        (int): the sigop cost of the transaction
+    '''
+    if coins is None:
+        return t.sigop_cost()
+    return t.sigop_cost([_as_coin(c).tx_out.output_script for c in coins])
 
-def check_nonstandard_inputs():
-    ...
+
+def check_too_many_sigops(
+        t: tx.Tx,
+        coins: Optional[Sequence[Union[Coin, tx.TxOut]]] = None,
+        policy: Optional[Policy] = None) -> bool:
+    '''
+    Args:
+        t (tx.Tx): the transaction
+        coins (Sequence[Coin]): the coins spent by each input
+        policy (Policy): the policy. Default the current network's
+    Returns:
+        (bool): True for standard, False for non-standard
+    '''
+    policy = policy or get_policy()
+    return get_sigop_cost(t, coins) <= policy.max_tx_sigops_cost
 
 
-def check_witness_nonstandard():
-    ...
+def _as_coin(coin: Union[Coin, tx.TxOut]) -> Coin:
+    return Coin(coin) if isinstance(coin, tx.TxOut) else coin
 
 
-def check_too_many_sigops():
-    ...
+def _witness_items(
+        witnesses: Sequence[tx.InputWitness],
+        index: int) -> List[bytes]:
+    '''The witness stack items of an input, empty if it has no witness'''
+    if index >= len(witnesses):
+        return []
+    return [item.item for item in witnesses[index].stack]
 
 
-def check_non_mandatory_script():
-    ...
+def _sequence_lock(
+        tx_in: tx.TxIn,
+        coin: Coin,
+        best_height: int,
+        best_timestamp: int) -> Tuple[int, int]:
+    '''
+    The last height and median time past at which an input's BIP68 relative
+    lock is unsatisfied, as in Bitcoin's CalculateSequenceLocks. -1 if it
+    has no lock of that kind. Unconfirmed coins are treated as confirmed in
+    the block after the best block
+    '''
+    sequence = rutils.le2i(tx_in.sequence)
+    if sequence & SEQUENCE_LOCKTIME_DISABLE_FLAG:
+        return -1, -1
+    lock = sequence & SEQUENCE_LOCKTIME_MASK
+
+    if sequence & SEQUENCE_LOCKTIME_TYPE_FLAG:
+        mtp = coin.median_time_past
+        if mtp is None:
+            if coin.height is not None:
+                raise ValueError(
+                    'A time-locked input spends a coin at height {} with '
+                    'no median_time_past.'.format(coin.height))
+            mtp = best_timestamp
+        return -1, mtp + (lock << SEQUENCE_LOCKTIME_GRANULARITY) - 1
+
+    height = best_height + 1 if coin.height is None else coin.height
+    return height + lock - 1, -1
+
+
+def _spend(
+        tx_in: tx.TxIn,
+        coin: Coin) -> Tuple[ScriptType, bytes, Optional[bytes]]:
+    '''
+    Classifies the output script an input spends. Returns its type, the
+    script, and the redeem script if it is P2SH
+    '''
+    prev_script = coin.tx_out.output_script
+    prev_type = classify.classify_output_script(prev_script)
+    redeem_script = None
+    if prev_type is ScriptType.P2SH:
+        redeem_script = sigops.last_push(tx_in.script_sig)
+    return prev_type, prev_script, redeem_script
+
+
+def _is_input_standard(
+        prev_type: ScriptType,
+        redeem_script: Optional[bytes],
+        policy: Policy) -> bool:
+    # Spending nonstandard or future witness outputs is nonstandard
+    if prev_type in (ScriptType.NONSTANDARD, ScriptType.WITNESS_UNKNOWN):
+        return False
+    if prev_type is ScriptType.P2SH:
+        return (redeem_script is not None
+                and sigops.count_sigops(redeem_script, accurate=True)
+                <= policy.max_p2sh_sigops)
+    return True
+
+
+def _is_witness_standard(
+        prev_type: ScriptType,
+        prev_script: bytes,
+        redeem_script: Optional[bytes],
+        stack: Sequence[bytes],
+        policy: Policy) -> bool:
+    if len(stack) == 0:
+        return True
+    if prev_type is ScriptType.P2SH and redeem_script is None:
+        return False
+
+    # Non-witness programs must not be associated with any witness. P2SH
+    # inputs may spend a witness program in their redeem script
+    program = sigops.witness_program(prev_script)
+    if program is None and redeem_script is not None:
+        program = sigops.witness_program(redeem_script)
+    if program is None:
+        return False
+
+    # P2WSH limits
+    if program[0] == 0 and len(program[1]) == 32:
+        if (len(stack[-1]) > policy.max_p2wsh_script_size
+                or len(stack) - 1 > policy.max_p2wsh_stack_items):
+            return False
+        return all(len(item) <= policy.max_p2wsh_stack_item_size
+                   for item in stack[:-1])
+    return True
@@ -0,0 +1,135 @@
+import enum
+from riemann.tx import tx
+from riemann.script import opcodes
+from riemann.script import serialization as ser
+
+from typing import Iterable, List
+
+OP_0 = opcodes.CODE_TO_INT['OP_0']
+OP_1 = opcodes.CODE_TO_INT['OP_1']
+OP_16 = opcodes.CODE_TO_INT['OP_16']
+OP_RETURN = opcodes.CODE_TO_INT['OP_RETURN']
+OP_CHECKSIG = opcodes.CODE_TO_INT['OP_CHECKSIG']
+OP_CHECKMULTISIG = opcodes.CODE_TO_INT['OP_CHECKMULTISIG']
+
+# The first bytes of valid pubkeys of each length, as in Bitcoin's
+# CPubKey::ValidSize
+PUBKEY_PREFIXES = {
+    33: frozenset([0x02, 0x03]),
+    65: frozenset([0x04, 0x06, 0x07]),
+}
+
+
+class ScriptType(str, enum.Enum):
+    '''
+    The template an output script matches. Members compare equal to their
+    values, which match the types reported by addresses.classify
+    '''
+    P2PKH = 'p2pkh'
+    P2SH = 'p2sh'
+    P2WPKH = 'p2wpkh'
+    P2WSH = 'p2wsh'
+    P2PK = 'p2pk'
+    MULTISIG = 'multisig'
+    OP_RETURN = 'op_return'
+    WITNESS_UNKNOWN = 'witness_unknown'
+    NONSTANDARD = 'nonstandard'
+
+
+def classify_output_script(script: bytes) -> ScriptType:
+    '''
+    Determine the template an output script matches, by its length and
+    fixed bytes. Never raises, and never deserializes the script.
+
+    Args:
+        script: The serialized output script
+    Returns:
+        The ScriptType of the script. NONSTANDARD if it matches none
+    '''
+    length = len(script)
+
+    # OP_DUP OP_HASH160 PUSH14 {hash} OP_EQUALVERIFY OP_CHECKSIG
+    if (length == 25 and script[:3] == b'\x76\xa9\x14'
+            and script[23:] == b'\x88\xac'):
+        return ScriptType.P2PKH
+
+    # OP_HASH160 PUSH14 {hash} OP_EQUAL
+    if length == 23 and script[:2] == b'\xa9\x14' and script[22] == 0x87:
+        return ScriptType.P2SH
+
+    # version, PUSH{2-40} {program}
+    if (4 <= length <= 42 and script[1] == length - 2
+            and (script[0] == OP_0 or OP_1 <= script[0] <= OP_16)):
+        if script[0] != OP_0:
+            return ScriptType.WITNESS_UNKNOWN
+        if length == 22:
+            return ScriptType.P2WPKH
+        if length == 34:
+            return ScriptType.P2WSH
+        return ScriptType.NONSTANDARD
+
+    if length == 0:
+        return ScriptType.NONSTANDARD
+
+    last = script[-1]
+
+    # PUSH{33,65} {pubkey} OP_CHECKSIG
+    if (last == OP_CHECKSIG and length in (35, 67)
+            and script[0] == length - 2
+            and script[1] in PUBKEY_PREFIXES[length - 2]):
+        return ScriptType.P2PK
+
+    # OP_RETURN, followed only by pushes
+    if script[0] == OP_RETURN:
+        if _is_push_only(script, 1):
+            return ScriptType.OP_RETURN
+        return ScriptType.NONSTANDARD
+
+    # OP_m {pubkey}... OP_n OP_CHECKMULTISIG
+    if (last == OP_CHECKMULTISIG and length >= 37
+            and OP_1 <= script[0] <= script[-2] <= OP_16
+            and _count_pubkeys(script) == script[-2] - OP_1 + 1):
+        return ScriptType.MULTISIG
+
+    return ScriptType.NONSTANDARD
+
+
+def classify_outputs(tx_outs: Iterable[tx.TxOut]) -> List[ScriptType]:
+    '''
+    Classify the output script of each output
+
+    Args:
+        tx_outs: The outputs, e.g. a transaction's tx_outs
+    Returns:
+        The ScriptType of each output, in order
+    '''
+    return [classify_output_script(o.output_script) for o in tx_outs]
+
+
+def _count_pubkeys(script: bytes) -> int:
+    '''
+    Counts the 33 and 65 byte pubkeys pushed between the first and the last
+    two opcodes of a script. -1 if anything else is there
+    '''
+    i = 1
+    end = len(script) - 2
+    count = 0
+    while i < end:
+        push = script[i]
+        prefixes = PUBKEY_PREFIXES.get(push)
+        if prefixes is None or i + 1 >= end or script[i + 1] not in prefixes:
+            return -1
+        i += push + 1
+        count += 1
+    return count if i == end else -1
+
+
+def _is_push_only(script: bytes, i: int) -> bool:
+    '''
+    Checks that the script contains only pushes from index i. Truncated
+    pushes are not push-only
+    '''
+    try:
+        return all(op[0] <= OP_16 for op in ser.iter_script_ops(script[i:]))
+    except IndexError:
+        return False
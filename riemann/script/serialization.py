@@ -1,9 +1,33 @@
 import riemann
-from riemann import utils
+from riemann import networks, utils
 from riemann.script.opcodes import CODE_TO_INT, INT_TO_CODE
 
+from typing import Iterator, Optional, Tuple, Type
 
-def serialize(script_string: str) -> bytes:
+
+def push_prefix(length: int) -> bytes:
+    '''
+    The opcode, and any length bytes, that push length bytes of data
+
+    Args:
+        length: The number of bytes to push
+    Returns:
+        OP_PUSH_N for up to 75 bytes, else OP_PUSHDATA1 or OP_PUSHDATA2 and
+        the little-endian length
+    '''
+    if length <= 75:
+        return bytes([length])
+    elif length <= 255:
+        return bytes([CODE_TO_INT['OP_PUSHDATA1'], length])
+    elif length <= 1000:
+        return (bytes([CODE_TO_INT['OP_PUSHDATA2']])
+                + utils.i2le_padded(length, 2))
+    raise NotImplementedError('Hex string too long to serialize.')
+
+
+def serialize(
+        script_string: str,
+        network: Optional[Type[networks.Network]] = None) -> bytes:
     '''
     Serialize a human-readable script to bytes
 
@@ -12,9 +36,12 @@ def serialize(script_string: str) -> bytes:
 
     Args:
         script_string: A human-readable Bitcoin Script string
+        network:       The network whose opcode overwrites to use. Default the
+                       current network
     Returns:
         The Script serialized as a bytestring
     '''
+    network = network or riemann.get_current_network()
     string_tokens = script_string.split()
     serialized_script = bytearray()
 
@@ -22,42 +49,24 @@ def serialize(script_string: str) -> bytes:
         if token == 'OP_CODESEPARATOR' or token == 'OP_PUSHDATA4':
             raise NotImplementedError('{} is a bad idea.'.format(token))
 
-        if token in riemann.network.CODE_TO_INT_OVERWRITE:
+        if token in network.CODE_TO_INT_OVERWRITE:
             serialized_script.extend(
-                [riemann.network.CODE_TO_INT_OVERWRITE[token]])
+                [network.CODE_TO_INT_OVERWRITE[token]])
 
         elif token in CODE_TO_INT:
             serialized_script.extend([CODE_TO_INT[token]])
 
         else:
             token_bytes = bytes.fromhex(token)
-
-            if len(token_bytes) <= 75:
-                op = 'OP_PUSH_{}'.format(len(token_bytes))
-                serialized_script.extend([CODE_TO_INT[op]])
-                serialized_script.extend(token_bytes)
-
-            elif len(token_bytes) > 75 and len(token_bytes) <= 255:
-                op = 'OP_PUSHDATA1'
-                serialized_script.extend([CODE_TO_INT[op]])
-                serialized_script.extend(utils.i2le(len(token_bytes)))
-                serialized_script.extend(token_bytes)
-
-            elif len(token_bytes) > 255 and len(token_bytes) <= 1000:
-                op = 'OP_PUSHDATA2'
-                serialized_script.extend([CODE_TO_INT[op]])
-                serialized_script.extend(
-                    utils.i2le_padded(len(token_bytes), 2))
-                serialized_script.extend(token_bytes)
-
-            else:
-                raise NotImplementedError(
-                    'Hex string too long to serialize.')
+            serialized_script.extend(push_prefix(len(token_bytes)))
+            serialized_script.extend(token_bytes)
 
     return serialized_script
 
 
-def hex_serialize(script_string: str) -> str:
+def hex_serialize(
+        script_string: str,
+        network: Optional[Type[networks.Network]] = None) -> str:
     '''
     Serialize a human-readable script to hex
 
@@ -66,13 +75,17 @@ def hex_serialize(script_string: str) -> str:
 
     Args:
         script_string: A human-readable Bitcoin Script string
+        network:       The network whose opcode overwrites to use. Default the
+                       current network
     Returns:
         The Script serialized as a hex string
     '''
-    return serialize(script_string).hex()
+    return serialize(script_string, network).hex()
 
 
-def deserialize(serialized_script: bytes) -> str:
+def deserialize(
+        serialized_script: bytes,
+        network: Optional[Type[networks.Network]] = None) -> str:
     '''
     Deserialize a human-readable script from bytes
 
@@ -80,9 +93,12 @@ def deserialize(serialized_script: bytes) -> str:
         deserialize(b'\x19\x76\xa9\x88\xac')
     Args:
         serialized_script: The Script serialized as a bytestring
+        network:           The network whose opcode overwrites to use.
+                           Default the current network
     Returns:
         A human-readable Script string
     '''
+    network = network or riemann.get_current_network()
     deserialized = []
     i = 0
     while i < len(serialized_script):
@@ -122,9 +138,9 @@ def deserialize(serialized_script: bytes) -> str:
             raise NotImplementedError('OP_PUSHDATA4 is a bad idea.')
 
         else:
-            if current_byte in riemann.network.INT_TO_CODE_OVERWRITE:
+            if current_byte in network.INT_TO_CODE_OVERWRITE:
                 deserialized.append(
-                    riemann.network.INT_TO_CODE_OVERWRITE[current_byte])
+                    network.INT_TO_CODE_OVERWRITE[current_byte])
             elif current_byte in INT_TO_CODE:
                 deserialized.append(INT_TO_CODE[current_byte])
             else:
@@ -136,7 +152,55 @@ def deserialize(serialized_script: bytes) -> str:
     return ' '.join(deserialized)
 
 
-def hex_deserialize(script_hex: str) -> str:
+def iter_script_ops(
+        script: bytes
+) -> Iterator[Tuple[int, Optional[memoryview], int]]:
+    '''
+    Walk a serialized script one opcode at a time, without copying or
+    converting pushes to hex. Opcodes are not validated.
+
+    Example:
+        for opcode, data, offset in iter_script_ops(output_script):
+            ...
+
+    Args:
+        script: The Script serialized as a bytestring
+    Yields:
+        The integer opcode, a memoryview of its push data (empty for OP_0,
+        None for non-push opcodes) and its offset in the script
+    Raises:
+        IndexError: if a push runs past the end of the script
+    '''
+    view = memoryview(script)
+    length = len(view)
+    i = 0
+    while i < length:
+        opcode = view[i]
+        offset = i
+        i += 1
+        if opcode > 78:
+            yield opcode, None, offset
+            continue
+
+        if opcode < 76:
+            data_len = opcode
+        else:
+            # OP_PUSHDATA1, 2 and 4 are followed by a 1, 2 or 4 byte length
+            width = 1 << (opcode - 76)
+            data_len = int.from_bytes(view[i:i + width], 'little')
+            i += width
+
+        if i + data_len > length:
+            raise IndexError(
+                'Push {} at offset {} caused out of bounds exception.'
+                .format(opcode, offset))
+        yield opcode, view[i:i + data_len], offset
+        i += data_len
+
+
+def hex_deserialize(
+        script_hex: str,
+        network: Optional[Type[networks.Network]] = None) -> str:
     '''
     Deserialize a human-readable script from hex
 
@@ -144,7 +208,9 @@ def hex_deserialize(script_hex: str) -> str:
         hex_deserialize('1976a988ac')
     Args:
         serialized_script: The Script serialized as a hex string
+        network:           The network whose opcode overwrites to use.
+                           Default the current network
     Returns:
         A human-readable Script string
     '''
-    return deserialize(bytes.fromhex(script_hex))
+    return deserialize(bytes.fromhex(script_hex), network)
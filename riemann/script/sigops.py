@@ -0,0 +1,152 @@
+from riemann.script import opcodes
+from riemann.script import serialization as ser
+
+from typing import Optional, Sequence, Tuple
+
+OP_0 = opcodes.CODE_TO_INT['OP_0']
+OP_1NEGATE = opcodes.CODE_TO_INT['OP_1NEGATE']
+OP_1 = opcodes.CODE_TO_INT['OP_1']
+OP_16 = opcodes.CODE_TO_INT['OP_16']
+OP_CHECKSIG = opcodes.CODE_TO_INT['OP_CHECKSIG']
+OP_CHECKSIGVERIFY = opcodes.CODE_TO_INT['OP_CHECKSIGVERIFY']
+OP_CHECKMULTISIG = opcodes.CODE_TO_INT['OP_CHECKMULTISIG']
+OP_CHECKMULTISIGVERIFY = opcodes.CODE_TO_INT['OP_CHECKMULTISIGVERIFY']
+
+# The sigops counted for a multisig whose key count isn't known
+MAX_PUBKEYS_PER_MULTISIG = 20
+
+
+def count_sigops(script: bytes, accurate: bool = False) -> int:
+    '''
+    Analog of Bitcoin's GetSigOpCount. Counting stops at the first
+    truncated push.
+
+    Args:
+        script:   The serialized script
+        accurate: Pass True to count OP_n OP_CHECKMULTISIG as n sigops, as
+                  for P2SH redeem scripts and witness scripts. Otherwise
+                  each multisig counts as 20
+    Returns:
+        The number of signature operations in the script
+    '''
+    count = 0
+    last = None
+    try:
+        for opcode, _, _ in ser.iter_script_ops(script):
+            if opcode == OP_CHECKSIG or opcode == OP_CHECKSIGVERIFY:
+                count += 1
+            elif (opcode == OP_CHECKMULTISIG
+                    or opcode == OP_CHECKMULTISIGVERIFY):
+                if (accurate and last is not None
+                        and OP_1 <= last <= OP_16):
+                    count += last - OP_1 + 1
+                else:
+                    count += MAX_PUBKEYS_PER_MULTISIG
+            last = opcode
+    except IndexError:
+        pass
+    return count
+
+
+def is_p2sh(script: bytes) -> bool:
+    '''
+    Args:
+        script: The serialized output script
+    Returns:
+        True if it is OP_HASH160 PUSH14 {hash} OP_EQUAL
+    '''
+    return (len(script) == 23 and script[:2] == b'\xa9\x14'
+            and script[22] == 0x87)
+
+
+def witness_program(script: bytes) -> Optional[Tuple[int, bytes]]:
+    '''
+    Analog of Bitcoin's IsWitnessProgram
+
+    Args:
+        script: The serialized output or redeem script
+    Returns:
+        The witness version and program, or None if it isn't a witness
+        program
+    '''
+    if (4 <= len(script) <= 42 and script[1] == len(script) - 2
+            and (script[0] == OP_0 or OP_1 <= script[0] <= OP_16)):
+        version = 0 if script[0] == OP_0 else script[0] - OP_1 + 1
+        return version, script[2:]
+    return None
+
+
+def last_push(script_sig: bytes) -> Optional[bytes]:
+    '''
+    The last item pushed by a push-only script sig, e.g. a P2SH redeem
+    script.
+
+    Args:
+        script_sig: The serialized script sig
+    Returns:
+        The last item pushed. None if the script sig is empty or not
+        push-only
+    '''
+    last = None
+    try:
+        for opcode, data, _ in ser.iter_script_ops(script_sig):
+            if data is not None:
+                last = bytes(data)
+            elif opcode == OP_1NEGATE:
+                last = b'\x81'
+            elif OP_1 <= opcode <= OP_16:
+                last = bytes([opcode - OP_1 + 1])
+            else:
+                # Including OP_RESERVED, which fails when executed
+                return None
+    except IndexError:
+        return None
+    return last
+
+
+def count_p2sh_sigops(script_sig: bytes, prev_script: bytes) -> int:
+    '''
+    The sigops in the redeem script of an input that spends P2SH, counted
+    accurately. 0 for inputs that don't spend P2SH.
+
+    Args:
+        script_sig:  The input's serialized script sig
+        prev_script: The output script the input spends
+    Returns:
+        The number of signature operations
+    '''
+    if not is_p2sh(prev_script):
+        return 0
+    redeem_script = last_push(script_sig)
+    if redeem_script is None:
+        return 0
+    return count_sigops(redeem_script, accurate=True)
+
+
+def count_witness_sigops(
+        script_sig: bytes,
+        prev_script: bytes,
+        witness: Sequence[bytes]) -> int:
+    '''
+    Analog of Bitcoin's CountWitnessSigOps. Handles native and P2SH-wrapped
+    witness programs.
+
+    Args:
+        script_sig:  The input's serialized script sig
+        prev_script: The output script the input spends
+        witness:     The items of the input's witness stack
+    Returns:
+        The number of witness signature operations
+    '''
+    program = witness_program(prev_script)
+    if program is None and is_p2sh(prev_script):
+        redeem_script = last_push(script_sig)
+        if redeem_script is not None:
+            program = witness_program(redeem_script)
+    if program is None or program[0] != 0:
+        return 0
+    if len(program[1]) == 20:
+        return 1
+    if len(program[1]) == 32 and len(witness) > 0:
+        return count_sigops(witness[-1], accurate=True)
+    return 0
@@ -0,0 +1,116 @@
+import re
+import functools
+import riemann
+from riemann import networks
+from riemann.script import serialization
+
+from typing import List, Optional, Tuple, Type, Union
+
+# Matches placeholders like {pk}, {0} or {}
+_PLACEHOLDER = re.compile(r'^\{(\w*)\}$')
+
+
+class ScriptTemplate:
+    '''
+    A human-readable script with placeholders, like those in
+    riemann.script.examples, parsed once. Filling it pushes raw bytes into
+    the placeholders without re-parsing the template.
+
+    Example:
+        template = ScriptTemplate(examples.p2pkh_script_pubkey)
+        script = template.fill(pk=pubkey_hash)
+    '''
+    __slots__ = ('template', 'network', 'keys', '_literals')
+
+    template: str
+    network: Type[networks.Network]
+    keys: Tuple[Union[int, str], ...]
+    _literals: Tuple[bytes, ...]
+
+    def __init__(
+            self,
+            template: str,
+            network: Optional[Type[networks.Network]] = None):
+        '''
+        Args:
+            template: A human-readable script. Placeholders are named,
+                      {pk}, or positional, {} or {0}, as in str.format
+            network:  The network whose opcode overwrites to use. Default
+                      the current network
+        '''
+        network = network or riemann.get_current_network()
+
+        keys: List[Union[int, str]] = []
+        literals: List[bytes] = []
+        run: List[str] = []
+        for token in template.split():
+            match = _PLACEHOLDER.match(token)
+            if match is None:
+                run.append(token)
+                continue
+            key: Union[int, str] = match.group(1)
+            if key == '':
+                key = len([k for k in keys if isinstance(k, int)])
+            elif key.isdigit():
+                key = int(key)
+            keys.append(key)
+            literals.append(serialization.serialize(' '.join(run), network))
+            run = []
+        literals.append(serialization.serialize(' '.join(run), network))
+
+        self.template = template
+        self.network = network
+        self.keys = tuple(keys)
+        self._literals = tuple(bytes(literal) for literal in literals)
+
+    def fill(self, *args: bytes, **kwargs: bytes) -> bytes:
+        '''
+        Serialize the script, pushing raw bytes in place of the placeholders
+
+        Example:
+            template.fill(sig0, sig1)
+            template.fill(pk0=pubkey0, pk1=pubkey1)
+
+        Args:
+            args:   The data for positional placeholders
+            kwargs: The data for named placeholders
+        Returns:
+            The serialized script
+        '''
+        literals = self._literals
+        script = bytearray(literals[0])
+        for i, key in enumerate(self.keys):
+            data = args[key] if isinstance(key, int) else kwargs[key]
+            script.extend(serialization.push_prefix(len(data)))
+            script.extend(data)
+            script.extend(literals[i + 1])
+        return bytes(script)
+
+    def __repr__(self) -> str:
+        return 'ScriptTemplate({!r})'.format(self.template)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(
+        template: str,
+        network: Type[networks.Network]) -> ScriptTemplate:
+    return ScriptTemplate(template, network)
+
+
+def compile_template(
+        template: str,
+        network: Optional[Type[networks.Network]] = None) -> ScriptTemplate:
+    '''
+    Parse a template once per network, and reuse it afterwards
+
+    Example:
+        compile_template(examples.msig_two_two).fill(pk0=pk0, pk1=pk1)
+
+    Args:
+        template: A human-readable script with placeholders
+        network:  The network whose opcode overwrites to use. Default the
+                  current network
+    Returns:
+        The compiled ScriptTemplate
+    '''
+    return _compile(template, network or riemann.get_current_network())
@@ -1,33 +1,46 @@
 from riemann import tx
+from riemann import networks
 from riemann import utils
 from riemann.tx import decred
 from riemann.tx import tx_builder as tb
 from riemann.encoding import addresses as addr
 
-from typing import overload
+from typing import Optional, overload, Type
 
 
-def output(value: int, address: str) -> tx.TxOut:
+def output(
+        value: int,
+        address: str,
+        network: Optional[Type[networks.Network]] = None) -> tx.TxOut:
     '''
     int, str -> TxOut
     accepts base58 or bech32 addresses
+    pass network to use it instead of the current network
     '''
-    script = addr.to_output_script(address)
+    script = addr.to_output_script(address, network)
     value_bytes = utils.i2le_padded(value, 8)
-    return tb._make_output(value_bytes, script)
+    return tb._make_output(value_bytes, script, network=network)
 
 
 @overload
-def outpoint(tx_id: str, index: int, tree: int) -> decred.DecredOutpoint:
+def outpoint(
+        tx_id: str,
+        index: int,
+        tree: int,
+        network: Optional[Type[networks.Network]] = None
+) -> decred.DecredOutpoint:
     ...
 
 
 @overload  # noqa: F811
-def outpoint(tx_id: str, index: int) -> tx.Outpoint:
+def outpoint(
+        tx_id: str,
+        index: int,
+        network: Optional[Type[networks.Network]] = None) -> tx.Outpoint:
     ...
 
 
-def outpoint(tx_id, index, tree=None):  # noqa: F811
+def outpoint(tx_id, index, tree=None, network=None):  # noqa: F811
     '''
     Some overloads are not documented by Sphinx
 
@@ -35,20 +48,22 @@ def outpoint(tx_id, index, tree=None):  # noqa: F811
     accepts block explorer txid string
     '''
     tx_id_le = bytes.fromhex(tx_id)[::-1]
-    return tb.make_outpoint(tx_id_le, index, tree)
+    return tb.make_outpoint(tx_id_le, index, tree, network)
 
 
 @overload
 def unsigned_input(
         outpoint: tx.Outpoint,
-        sequence: int) -> tx.TxIn:
+        sequence: int,
+        network: Optional[Type[networks.Network]] = None) -> tx.TxIn:
     ...
 
 
 @overload   # noqa: F811
 def unsigned_input(
         outpoint: decred.DecredOutpoint,
-        sequence: int) -> decred.DecredTxIn:
+        sequence: int,
+        network: Optional[Type[networks.Network]] = None) -> decred.DecredTxIn:
     ...
 
 
@@ -64,7 +79,10 @@ def unsigned_input(
     ...
 
 
-def unsigned_input(outpoint, sequence=0xFFFFFFFE):   # noqa: F811
+def unsigned_input(  # noqa: F811
+        outpoint,
+        sequence=0xFFFFFFFE,
+        network=None):
     '''
     Some overloads are not documented by Sphinx
 
@@ -74,7 +92,8 @@ def unsigned_input(outpoint, sequence=0xFFFFFFFE):   # noqa: F811
         outpoint=outpoint,
         stack_script=b'',
         redeem_script=b'',
-        sequence=sequence)
+        sequence=sequence,
+        network=network)
 
 
 def unsigned_legacy_tx(tx_ins, tx_outs, **kwargs):
@@ -93,6 +112,7 @@ def unsigned_legacy_tx(tx_ins, tx_outs, **kwargs):
         tx_joinsplits       (list): list of joinsplits transactions
         joinsplit_pubkey    (bytes): joinsplit public key
         joinsplit_sig       (bytes): joinsplit signature
+        network   (Network class): network to use instead of the current
 
     Returns:
         (Tx instance): unsigned transaction
@@ -109,7 +129,8 @@ def unsigned_legacy_tx(tx_ins, tx_outs, **kwargs):
                           if 'joinsplit_pubkey' in kwargs
                           else []),
         joinsplit_sig=(kwargs['joinsplit_sig']
-                       if 'joinsplit_sig' in kwargs else []))
+                       if 'joinsplit_sig' in kwargs else []),
+        network=kwargs['network'] if 'network' in kwargs else None)
 
 
 def unsigned_witness_tx(tx_ins, tx_outs, **kwargs):
@@ -125,6 +146,7 @@ def unsigned_witness_tx(tx_ins, tx_outs, **kwargs):
         **kwargs:
         version     (int): transaction version number
         locktime    (hex): transaction locktime
+        network     (Network class): network to use instead of the current
 
     Returns:
         (Tx instance): unsigned transaction with empty witness
@@ -134,4 +156,5 @@ def unsigned_witness_tx(tx_ins, tx_outs, **kwargs):
         tx_ins=tx_ins,
         tx_outs=tx_outs,
         lock_time=kwargs['lock_time'] if 'lock_time' in kwargs else 0,
-        tx_witnesses=[tb.make_empty_witness() for _ in tx_ins])
+        tx_witnesses=[tb.make_empty_witness() for _ in tx_ins],
+        network=kwargs['network'] if 'network' in kwargs else None)
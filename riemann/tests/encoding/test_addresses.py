@@ -1,6 +1,6 @@
 import unittest
 import riemann
-from riemann import utils
+from riemann import networks, simple, utils
 from .. import helpers
 from ...encoding import addresses as addr
 
@@ -23,6 +23,7 @@ class TestAddresses(unittest.TestCase):
 
     def tearDown(self):
         riemann.select_network('bitcoin_main')
+        addr.disable_cache()
 
     def test_make_p2sh_address(self):
         a = addr.make_p2sh_address('OP_IF')
@@ -47,6 +48,25 @@ class TestAddresses(unittest.TestCase):
         a = addr.make_p2wpkh_address(helpers.P2WPKH_ADDR['pubkey'])
         self.assertEqual(a, helpers.P2WPKH_ADDR['address'])
 
+    def test_make_pkh_addresses(self):
+        pubkeys = [helpers.PK['ser'][0]['pk'],
+                   helpers.P2WPKH_ADDR['pubkey'],
+                   helpers.CASHADDR['pubkey']]
+        bch = networks.get_network('bitcoin_cash_main')
+        for kwargs in [{},
+                       {'witness': True},
+                       {'cashaddr': False, 'network': bch},
+                       {'network': bch}]:
+            self.assertEqual(
+                addr.make_pkh_addresses(pubkeys, **kwargs),
+                [addr.make_pkh_address(p, **kwargs) for p in pubkeys])
+
+        self.assertEqual(
+            addr.make_pkh_addresses(pubkeys * 3, witness=True, processes=2),
+            [addr.make_p2wpkh_address(p) for p in pubkeys * 3])
+        self.assertEqual(addr.make_pkh_addresses([]), [])
+        self.assertEqual(addr.make_pkh_addresses([], processes=2), [])
+
     def test_parse(self):
         self.assertEqual(addr.parse(helpers.OP_IF['p2sh']),
                          b'\x05' + helpers.OP_IF['script_hash'])
@@ -66,6 +86,46 @@ class TestAddresses(unittest.TestCase):
         self.assertIn('Unsupported address format. Got: ',
                       str(context.exception))
 
+    def test_classify(self):
+        btc = networks.get_network('bitcoin_main')
+        cases = [
+            (helpers.ADDR[0]['p2pkh'], 'p2pkh', helpers.PK['ser'][0]['pkh'],
+             None),
+            (helpers.OP_IF['p2sh'], 'p2sh',
+             helpers.OP_IF['output_script'][2:22], None),
+            (helpers.P2WPKH_ADDR['address'], 'p2wpkh',
+             helpers.P2WPKH_ADDR['pkh'], 0),
+            (helpers.P2WSH['human']['ins'][0]['addr'], 'p2wsh',
+             helpers.P2WSH['ser']['ins'][0]['pk_script'][2:], 0)]
+        for address, address_type, address_hash, version in cases:
+            self.assertEqual(
+                addr.classify(address),
+                addr.AddressInfo(
+                    address, address_type, address_hash, btc, version))
+
+        info = addr.classify('BC1SW50QA3JX3S', network=btc)
+        self.assertEqual(info.type, 'witness_unknown')
+        self.assertEqual(info.witness_version, 16)
+        self.assertEqual(info.hash, bytes.fromhex('751e'))
+        with self.assertRaises(ValueError) as context:
+            addr.to_output_script('BC1SW50QA3JX3S')
+        self.assertIn('Cannot parse output script', str(context.exception))
+
+        bch = networks.get_network('bitcoin_cash_main')
+        info = addr.classify(helpers.CASHADDR['p2pkh'], network=bch)
+        self.assertEqual(info.type, 'p2pkh')
+        self.assertEqual(info.hash, utils.hash160(helpers.CASHADDR['pubkey']))
+        self.assertIsNone(info.witness_version)
+
+        with self.assertRaises(ValueError) as context:
+            # Junk B58 w valid checksum
+            addr.classify('1111111111111111111111111111111111177fdsQ')
+        self.assertIn('Unknown address type', str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            addr.classify(helpers.CASHADDR['p2pkh'])
+        self.assertIn('Unsupported address format', str(context.exception))
+
     def test_parse_hash(self):
         self.assertEqual(addr.parse_hash(helpers.OP_IF['p2sh']),
                          helpers.OP_IF['script_hash'])
@@ -182,3 +242,77 @@ class TestAddresses(unittest.TestCase):
         self.assertEqual(
             addr.to_output_script(helpers.ADDR[0]['p2pkh_cashaddr']),
             helpers.PK['ser'][0]['pkh_output'])
+
+    def test_cache(self):
+        riemann.select_network('bitcoin_main')
+        self.assertEqual(addr.cache_info(), {})
+        addr.enable_cache(maxsize=2)
+
+        script = helpers.P2WPKH_ADDR['output']
+        for _ in range(3):
+            self.assertEqual(
+                addr.to_output_script(helpers.P2WPKH_ADDR['address']),
+                script)
+            self.assertEqual(
+                addr.from_output_script(bytearray(script)),
+                helpers.P2WPKH_ADDR['address'])
+        info = addr.cache_info()
+        self.assertEqual(info['to_output_script'].hits, 2)
+        self.assertEqual(info['to_output_script'].misses, 1)
+        self.assertEqual(info['from_output_script'].hits, 2)
+        self.assertEqual(info['from_output_script'].misses, 1)
+
+        # simple.output shares the cache
+        output = simple.output(1, helpers.P2WPKH_ADDR['address'])
+        self.assertEqual(output.output_script, script)
+        self.assertEqual(addr.cache_info()['to_output_script'].hits, 3)
+
+        # entries are keyed by network
+        bch = networks.get_network('bitcoin_cash_main')
+        self.assertEqual(
+            addr.to_output_script(helpers.OP_IF['cashaddr'], network=bch),
+            helpers.OP_IF['output_script'])
+        self.assertEqual(addr.cache_info()['to_output_script'].misses, 2)
+
+        # errors are not cached
+        with self.assertRaises(ValueError):
+            addr.to_output_script(helpers.OP_IF['cashaddr'])
+
+        riemann.select_network('bitcoin_cash_main')
+        self.assertEqual(addr.cache_info()['to_output_script'].currsize, 0)
+
+        addr.disable_cache()
+        self.assertEqual(addr.cache_info(), {})
+        self.assertEqual(
+            addr.to_output_script(helpers.OP_IF['cashaddr']),
+            helpers.OP_IF['output_script'])
+
+    def test_explicit_network(self):
+        # the current network is bitcoin_main
+        bch = networks.get_network('bitcoin_cash_main')
+        self.assertEqual(
+            addr.make_sh_address('OP_IF', network=bch),
+            helpers.OP_IF['cashaddr'])
+        self.assertEqual(
+            addr.make_pkh_address(helpers.CASHADDR['pubkey'], network=bch),
+            helpers.CASHADDR['p2pkh'])
+        self.assertEqual(
+            addr.from_output_script(
+                helpers.OP_IF['output_script'], network=bch),
+            helpers.OP_IF['cashaddr'])
+        self.assertEqual(
+            addr.to_output_script(helpers.OP_IF['cashaddr'], network=bch),
+            helpers.OP_IF['output_script'])
+        self.assertEqual(
+            addr.parse_hash(helpers.CASHADDR['p2pkh'], network=bch),
+            utils.hash160(helpers.CASHADDR['pubkey']))
+
+        riemann.select_network('bitcoin_cash_main')
+        btc = networks.get_network('bitcoin_main')
+        self.assertEqual(
+            addr.make_p2wpkh_address(
+                helpers.P2WPKH_ADDR['pubkey'], network=btc),
+            helpers.P2WPKH_ADDR['address'])
+        self.assertEqual(
+            addr.to_output_script(helpers.P2WPKH_ADDR['address'], network=btc),
+            helpers.P2WPKH_ADDR['output'])
@@ -62,3 +62,36 @@ class TestBase58(unittest.TestCase):
             addr_hash.extend(addr[1])
             addr_hash.extend(addr[2])
             self.assertEqual(expected, base58.encode(addr_hash))
+
+    def test_matches_generic_conversion(self):
+        payloads = [b'', b'\x00', b'\x00' * 5, b'\x01', b'\xff' * 25,
+                    b'\x00\x00' + bytes(range(1, 24))]
+        payloads.extend(bytes(range(i, i + n))
+                        for i in range(0, 200, 37) for n in range(1, 40, 3))
+        for payload in payloads:
+            v, prefix = base58.to_long(256, lambda x: x, payload)
+            expected = base58.from_long(
+                v, prefix, base58.BASE58_BASE,
+                lambda v: base58.BASE58_ALPHABET[v]).decode('utf8')
+            self.assertEqual(base58.encode(payload, False), expected)
+            self.assertEqual(base58.decode(expected, False), payload)
+
+    def test_decode_bad_character(self):
+        with self.assertRaises(ValueError) as context:
+            base58.decode('1P86rvoC4bTympTEdXnw9HhWVxb0', False)
+        self.assertIn('bad character', str(context.exception))
+
+    def test_encode_many(self):
+        payloads = [b'\x00' + helpers.PK['ser'][0]['pkh'],
+                    b'\x05' + helpers.PK['ser'][1]['pkh']]
+        encoded = base58.encode_many(payloads)
+        self.assertEqual(encoded, [base58.encode(p) for p in payloads])
+        self.assertEqual(base58.decode_many(encoded), payloads)
+        self.assertEqual(
+            base58.encode_many(payloads, checksum=False),
+            [base58.encode(p, checksum=False) for p in payloads])
+
+        riemann.select_network('decred_main')
+        for addr in DCR_ADDR:
+            self.assertEqual(
+                base58.encode_many([addr[1] + addr[2]]), [addr[0]])
@@ -159,3 +159,47 @@ class TestBech32(unittest.TestCase):
 
     def test_convert_bits_error(self):
         self.assertIsNone(bech32.convertbits([2 ** 5 + 1], 5, 8))
+
+    def test_polymod_table(self):
+        # The bitwise loop from the reference implementation
+        generator = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd,
+                     0x2a1462b3]
+
+        def reference_polymod(values):
+            chk = 1
+            for value in values:
+                top = chk >> 25
+                chk = (chk & 0x1ffffff) << 5 ^ value
+                for i in range(5):
+                    chk ^= generator[i] if ((top >> i) & 1) else 0
+            return chk
+
+        for t in VALID_CHECKSUM:
+            hrp, data = bech32.bech32_decode(t)
+            values = bech32.bech32_hrp_expand(hrp) + data
+            self.assertEqual(
+                bech32.bech32_polymod(values), reference_polymod(values))
+        values = list(range(32)) * 3
+        self.assertEqual(
+            bech32.bech32_polymod(values), reference_polymod(values))
+
+    def test_encode_many(self):
+        # encode takes the raw witness version, not its opcode
+        decoded = [bech32.segwit_decode('bc', a) for a, _ in VALID_ADDRESS]
+        datas = [bytes([version, len(program)] + program)
+                 for version, program in decoded if version is not None]
+        addresses = bech32.encode_many(datas)
+        self.assertEqual(addresses, [bech32.encode(d) for d in datas])
+        self.assertEqual(bech32.decode_many(addresses), datas)
+
+        testnet = riemann.networks.get_network('bitcoin_test')
+        self.assertEqual(
+            bech32.encode_many(datas, network=testnet),
+            [bech32.encode(d, network=testnet) for d in datas])
+        self.assertEqual(bech32.encode_many([]), [])
+
+        riemann.select_network('zcash_sprout_main')
+        with self.assertRaises(ValueError):
+            bech32.encode_many(datas)
+        with self.assertRaises(ValueError):
+            bech32.decode_many(addresses)
@@ -0,0 +1,67 @@
+import unittest
+import riemann
+from riemann import networks, utils
+from .. import helpers
+from ...encoding import cashaddr
+
+
+class TestCashaddr(unittest.TestCase):
+
+    def setUp(self):
+        riemann.select_network('bitcoin_cash_main')
+        self.pkh = (riemann.get_current_network().CASHADDR_P2PKH
+                    + utils.hash160(helpers.CASHADDR['pubkey']))
+
+    def tearDown(self):
+        riemann.select_network('bitcoin_main')
+
+    def test_polymod_table(self):
+        # The bitwise loop from the reference implementation
+        generator = [
+            (0x01, 0x98f2bc8e61),
+            (0x02, 0x79b76d99e2),
+            (0x04, 0xf33e5fb3c4),
+            (0x08, 0xae2eabe2a8),
+            (0x10, 0x1e4f43e470)]
+
+        def reference_polymod(values):
+            chk = 1
+            for value in values:
+                top = chk >> 35
+                chk = ((chk & 0x07ffffffff) << 5) ^ value
+                for i in generator:
+                    if top & i[0] != 0:
+                        chk ^= i[1]
+            return chk ^ 1
+
+        for values in [list(range(32)) * 3,
+                       cashaddr.prefix_expand('bitcoincash')
+                       + cashaddr.b32decode(
+                           helpers.CASHADDR['p2pkh'].split(':')[1])]:
+            self.assertEqual(
+                cashaddr.polymod(values), reference_polymod(values))
+
+    def test_encode_decode(self):
+        self.assertEqual(cashaddr.encode(self.pkh), helpers.CASHADDR['p2pkh'])
+        self.assertEqual(cashaddr.decode(helpers.CASHADDR['p2pkh']), self.pkh)
+
+        with self.assertRaises(ValueError) as context:
+            cashaddr.decode(helpers.CASHADDR['p2pkh'][:-1] + 'q')
+        self.assertIn('Bad cash address checksum', str(context.exception))
+
+    def test_encode_many(self):
+        datas = [self.pkh, self.pkh[:1] + bytes(20), self.pkh[::-1]]
+        addresses = cashaddr.encode_many(datas)
+        self.assertEqual(addresses, [cashaddr.encode(d) for d in datas])
+        self.assertEqual(cashaddr.decode_many(addresses), datas)
+        self.assertEqual(cashaddr.encode_many([]), [])
+
+        bch_test = networks.get_network('bitcoin_cash_test')
+        self.assertEqual(
+            cashaddr.encode_many(datas, network=bch_test),
+            [cashaddr.encode(d, network=bch_test) for d in datas])
+
+        riemann.select_network('bitcoin_main')
+        with self.assertRaises(ValueError) as context:
+            cashaddr.encode_many(datas)
+        self.assertIn('does not support cashaddresses', str(context.exception))
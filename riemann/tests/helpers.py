@@ -703,3 +703,11 @@ COINBASE_REGRESSION = [
     # https://blockchain.info/rawtx/e20e36e570989243cfefa5ee414dfbee30a16d25a21076ef815f3f88a181d178?format=hex
     '0000000000000000000000000000000000000000000000000000000000000000ffffffff4b0317d407049f68a55a642f4254432e434f4d2ffabe6d6d0f14f2a2c572f0755da25d1d97600aed82b8729b6fb7a1ab2854e26fb4d71783010000000000000001094d04dd5d000000000000ffffffff'
 ]
+
+GENESIS_BLOCK = {
+    'block': bytes.fromhex('0100000000000000000000000000000000000000000000000000000000000000000000003ba3edfd7a7b12b27ac72c3e67768f617fc81bc3888a51323a9fb8aa4b1e5e4a29ab5f49ffff001d1dac2b7c0101000000010000000000000000000000000000000000000000000000000000000000000000ffffffff4d04ffff001d0104455468652054696d65732030332f4a616e2f32303039204368616e63656c6c6f72206f6e206272696e6b206f66207365636f6e64206261696c6f757420666f722062616e6b73ffffffff0100f2052a01000000434104678afdb0fe5548271967f1a67130b7105cd6a828e03909a67962e0ea1f61deb649f6bc3f4cef38c4f35504e51ec112de5c384df7ba0b8d578a4c702b6bf11d5fac00000000'),
+    'block_hash': bytes.fromhex('000000000019d6689c085ae165831e934ff763ae46a2a6c172b3f1b60a8ce26f'),
+    'merkle_root_le': bytes.fromhex('3ba3edfd7a7b12b27ac72c3e67768f617fc81bc3888a51323a9fb8aa4b1e5e4a'),
+    'tx_id': bytes.fromhex('4a5e1e4baab89f3a32518a88c31bc87f618f76673e2cc77ab2127b7afdeda33b'),
+    'magic': bytes.fromhex('f9beb4d9')
+}
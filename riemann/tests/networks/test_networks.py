@@ -1,5 +1,6 @@
 import unittest
 import riemann.networks as networks
+from riemann import utils
 
 
 class TestNetworks(unittest.TestCase):
@@ -18,3 +19,18 @@ class TestNetworks(unittest.TestCase):
 
         self.assertIn('Unknown chain specifed: {}'.format('toast'),
                       str(context.exception))
+
+    def test_network_rules(self):
+        data = b'\x00'
+        for name, n in networks.SUPPORTED.items():
+            decred = 'decred' in name
+            self.assertEqual(
+                n.HASH256(data),
+                utils.double_blake256(data) if decred
+                else utils.double_sha256(data))
+            self.assertEqual(
+                n.HASH160(data),
+                utils.blake256_hash160(data) if decred
+                else utils.sha256_hash160(data))
+            self.assertEqual(n.COMPACT_VAR_INTS,
+                             'overwinter' in name or 'sapling' in name)
@@ -0,0 +1,342 @@
+import unittest
+import riemann
+from riemann import networks, utils
+from riemann.tests import helpers
+from riemann.networks import standard
+from riemann.tx import tx
+
+
+# The fixture pubkeys are placeholders, without a valid first byte
+PUBKEY = b'\x04' + helpers.PK['ser'][0]['pk'][1:]
+MSIG_2_2 = b'\x52\x41' + PUBKEY + b'\x41' + PUBKEY + b'\x52\xae'
+
+
+def _output(value: int, output_script: bytes) -> tx.TxOut:
+    return tx.TxOut(utils.i2le_padded(value, 8), output_script)
+
+
+class TestStandard(unittest.TestCase):
+
+    def test_is_push_only(self):
+        self.assertTrue(standard.is_push_only(b''))
+        self.assertTrue(
+            standard.is_push_only(
+                helpers.P2SH_PD1['ser']['ins'][0]['script_sig']))
+        self.assertTrue(standard.is_push_only(b'\x00\x4f\x50\x60\x01\xaa'))
+        self.assertFalse(standard.is_push_only(b'\x00\x61'))
+        self.assertFalse(
+            standard.is_push_only(helpers.MSIG_2_2['ser_script']))
+        self.assertFalse(standard.is_push_only(b'\x05\x00'))
+
+    def test_is_op_return(self):
+        self.assertTrue(standard.is_op_return(_output(0, b'\x6a')))
+        self.assertTrue(
+            standard.is_op_return(_output(0, b'\x6a\x4c\x50' + b'\x00' * 80)))
+        self.assertFalse(
+            standard.is_op_return(_output(0, b'\x6a\x4c\x51' + b'\x00' * 81)))
+        self.assertFalse(standard.is_op_return(_output(1, b'\x6a')))
+        self.assertFalse(standard.is_op_return(_output(0, b'\x6a\x61')))
+        self.assertFalse(standard.is_op_return(_output(0, b'')))
+
+    def test_is_standard_output_type(self):
+        pk = PUBKEY
+        self.assertTrue(standard.is_standard_output_type(
+            _output(1000, helpers.PK['ser'][0]['pkh_output'])))
+        self.assertTrue(standard.is_standard_output_type(
+            _output(1000, b'\x41' + pk + b'\xac')))
+        self.assertTrue(standard.is_standard_output_type(
+            _output(1000, MSIG_2_2)))
+        self.assertTrue(standard.is_standard_output_type(
+            _output(0, b'\x6a\x01\x00')))
+        # P2TR, and other future witness versions
+        self.assertTrue(standard.is_standard_output_type(
+            _output(1000, b'\x51\x20' + b'\x00' * 32)))
+        self.assertTrue(standard.is_standard_output_type(
+            _output(1000, b'\x60\x02\x00\x00')))
+
+        # 1-of-1 with a 20 byte "pubkey"
+        self.assertFalse(standard.is_standard_output_type(
+            _output(1000, b'\x51\x14' + b'\x00' * 20 + b'\x51\xae')))
+        # 3-of-2
+        self.assertFalse(standard.is_standard_output_type(
+            _output(1000, b'\x53\x41' + pk + b'\x41' + pk + b'\x52\xae')))
+        self.assertFalse(standard.is_standard_output_type(
+            _output(1000, b'\x41' + pk)))
+        # pubkeys whose first byte doesn't match their length
+        self.assertFalse(standard.is_standard_output_type(
+            _output(1000, b'\x21\x04' + b'\x11' * 32 + b'\xac')))
+        self.assertFalse(standard.is_standard_output_type(
+            _output(1000, b'\x51\x21\x09' + b'\x11' * 32 + b'\x51\xae')))
+        self.assertFalse(standard.is_standard_output_type(
+            _output(1000, b'\x4c')))
+
+    def test_check_is_standard(self):
+        pkh_output = helpers.PK['ser'][0]['pkh_output']
+        op_return = _output(0, b'\x6a\x01\x00')
+
+        t = tx.Tx.from_bytes(helpers.P2PKH['ser']['tx']['signed'])
+        t = t.copy(tx_outs=[_output(1000, pkh_output), op_return])
+        self.assertTrue(standard.check_is_standard(t))
+
+        t = t.copy(tx_outs=[op_return, op_return])
+        self.assertFalse(standard.check_is_standard(t))
+
+        t = t.copy(tx_outs=[_output(1, pkh_output)])
+        self.assertFalse(standard.check_is_standard(t))
+
+
+class TestPolicy(unittest.TestCase):
+
+    def setUp(self):
+        riemann.select_network('bitcoin_main')
+        # locked to height 523722, spends a P2WPKH output
+        self.p2wpkh = tx.Tx.from_bytes(helpers.P2WPKH['ser']['tx']['signed'])
+        self.p2wpkh_coin = standard.Coin(
+            _output(120000, b'\x00\x14' + helpers.P2WPKH['ser']['ins'][0]
+                    ['pk_script'][3:]),
+            height=600000)
+
+        # spends a P2WSH 2-of-3 multisig
+        self.p2wsh = tx.Tx.from_bytes(helpers.P2WSH['ser']['tx']['signed'])
+        self.p2wsh_coin = standard.Coin(
+            _output(1000, helpers.P2WSH['ser']['ins'][0]['pk_script']))
+
+        # spends a P2SH output
+        self.p2sh = tx.Tx.from_bytes(helpers.P2SH['ser']['tx']['signed'])
+        redeem_script = helpers.P2SH['ser']['ins'][0]['redeem_script']
+        self.p2sh_coin = standard.Coin(_output(
+            1000, b'\xa9\x14' + utils.hash160(redeem_script) + b'\x87'))
+
+    def test_check_tx_policy(self):
+        for t, coin in [(self.p2wpkh, self.p2wpkh_coin),
+                        (self.p2wsh, self.p2wsh_coin),
+                        (self.p2sh, self.p2sh_coin)]:
+            self.assertIsNone(standard.check_tx_policy(t))
+            self.assertIsNone(standard.check_tx_policy(
+                t, [coin], best_height=600010, best_timestamp=1600000000))
+
+        t = self.p2wpkh.copy(version=b'\x03\x00\x00\x00')
+        self.assertEqual(standard.check_tx_policy(t), 'version')
+
+        self.assertEqual(
+            standard.check_tx_policy(
+                self.p2wpkh,
+                policy=standard.Policy(max_tx_weight=self.p2wpkh.weight - 1)),
+            'tx-size')
+
+        size = len(self.p2sh.tx_ins[0].script_sig)
+        self.assertEqual(
+            standard.check_tx_policy(
+                self.p2sh,
+                policy=standard.Policy(max_scriptsig_size=size - 1)),
+            'scriptsig-size')
+
+        tx_in = self.p2sh.tx_ins[0]
+        t = self.p2sh.copy(tx_ins=[tx_in.copy(stack_script=b'\x61')])
+        self.assertEqual(
+            standard.check_tx_policy(t), 'scriptsig-not-pushonly')
+
+        t = self.p2wpkh.copy(
+            tx_outs=[_output(0, b'\x6a'), _output(0, b'\x6a')])
+        self.assertEqual(standard.check_tx_policy(t), 'multi-op-return')
+
+        t = self.p2wpkh.copy(
+            tx_outs=[_output(1000, b'\x21\x04' + b'\x11' * 32 + b'\xac')])
+        self.assertEqual(standard.check_tx_policy(t), 'scriptpubkey')
+
+        msig = _output(1000, MSIG_2_2)
+        t = self.p2wpkh.copy(tx_outs=[msig])
+        self.assertIsNone(standard.check_tx_policy(t))
+        self.assertEqual(
+            standard.check_tx_policy(
+                t, policy=standard.Policy(permit_bare_multisig=False)),
+            'bare-multisig')
+
+        p2tr = _output(1000, b'\x51\x20' + b'\x22' * 32)
+        t = self.p2wpkh.copy(tx_outs=[p2tr])
+        self.assertIsNone(standard.check_tx_policy(t))
+        # paying P2TR is standard, but spending it is not
+        self.assertEqual(
+            standard.check_tx_policy(t, [p2tr]),
+            'bad-txns-nonstandard-inputs')
+
+        t = self.p2wpkh.copy(tx_outs=[_output(293, b'\x00\x14' * 11)])
+        self.assertEqual(standard.check_tx_policy(t), 'dust')
+
+        # 61 bytes without the witness
+        t = self.p2wpkh.copy(tx_outs=[_output(0, b'\x6a')])
+        self.assertEqual(standard.check_tx_policy(t), 'tx-size-small')
+
+        self.assertEqual(
+            standard.check_tx_policy(self.p2wpkh, best_height=500000),
+            'non-final')
+
+        # a time lock must be before the median time past
+        t = self.p2wpkh.copy(lock_time=utils.i2le_padded(1600000000, 4))
+        self.assertFalse(standard.check_final(t, 600010, 1600000000))
+        self.assertTrue(standard.check_final(t, 600010, 1600000001))
+        self.assertEqual(
+            standard.check_tx_policy(
+                t, best_height=600010, best_timestamp=1600000000),
+            'non-final')
+        self.assertIsNone(
+            standard.check_tx_policy(
+                t, best_height=600010, best_timestamp=1600000001))
+        # a height lock may be at the best height
+        self.assertTrue(standard.check_final(self.p2wpkh, 523722))
+
+        # spending the wrong kind of output
+        self.assertEqual(
+            standard.check_tx_policy(self.p2wpkh, [_output(1000, b'\x51')]),
+            'bad-txns-nonstandard-inputs')
+        self.assertEqual(
+            standard.check_tx_policy(
+                self.p2wsh, [_output(1000, helpers.MSIG_2_2['output'])]),
+            'bad-txns-nonstandard-inputs')
+        self.assertEqual(
+            standard.check_tx_policy(
+                self.p2wsh,
+                [_output(1000, helpers.PK['ser'][0]['pkh_output'])]),
+            'bad-witness-nonstandard')
+        self.assertEqual(
+            standard.check_tx_policy(
+                self.p2wsh, [self.p2wsh_coin],
+                policy=standard.Policy(max_p2wsh_stack_item_size=71)),
+            'bad-witness-nonstandard')
+
+        self.assertEqual(
+            standard.check_tx_policy(
+                self.p2wsh, [self.p2wsh_coin],
+                policy=standard.Policy(max_tx_sigops_cost=10)),
+            'bad-txns-too-many-sigops')
+
+    def test_check_is_standard_tx(self):
+        for t in (self.p2wpkh, self.p2wsh, self.p2sh):
+            self.assertTrue(standard.check_is_standard_tx(t))
+
+        # 'version'
+        self.assertFalse(standard.check_is_standard_tx(
+            self.p2wpkh.copy(version=b'\x03\x00\x00\x00')))
+
+        # 'tx-size'
+        self.assertFalse(standard.check_is_standard_tx(
+            self.p2wpkh,
+            standard.Policy(max_tx_weight=self.p2wpkh.weight - 1)))
+
+        # 'scriptsig-size'
+        size = len(self.p2sh.tx_ins[0].script_sig)
+        self.assertFalse(standard.check_is_standard_tx(
+            self.p2sh, standard.Policy(max_scriptsig_size=size - 1)))
+
+        # 'scriptsig-not-pushonly'
+        tx_in = self.p2sh.tx_ins[0]
+        self.assertFalse(standard.check_is_standard_tx(
+            self.p2sh.copy(tx_ins=[tx_in.copy(stack_script=b'\x61')])))
+
+        # 'multi-op-return'
+        self.assertFalse(standard.check_is_standard_tx(
+            self.p2wpkh.copy(
+                tx_outs=[_output(0, b'\x6a'), _output(0, b'\x6a')])))
+
+    def test_bip68(self):
+        # version 2, a relative lock of 10 blocks
+        tx_in = self.p2wpkh.tx_ins[0].copy(sequence=utils.i2le_padded(10, 4))
+        t = self.p2wpkh.copy(tx_ins=[tx_in])
+        self.assertFalse(
+            standard.check_bip68_final(t, [self.p2wpkh_coin], 600008))
+        self.assertEqual(
+            standard.check_tx_policy(
+                t, [self.p2wpkh_coin], best_height=600008),
+            'non-BIP68-final')
+        self.assertTrue(
+            standard.check_bip68_final(t, [self.p2wpkh_coin], 600009))
+        self.assertIsNone(
+            standard.check_tx_policy(
+                t, [self.p2wpkh_coin], best_height=600009))
+
+        # a relative lock of 512 * 2 seconds
+        sequence = standard.SEQUENCE_LOCKTIME_TYPE_FLAG | 2
+        tx_in = tx_in.copy(sequence=utils.i2le_padded(sequence, 4))
+        t = self.p2wpkh.copy(tx_ins=[tx_in])
+        coin = self.p2wpkh_coin._replace(median_time_past=1600000000)
+        self.assertFalse(
+            standard.check_bip68_final(t, [coin], 600009, 1600001023))
+        self.assertTrue(
+            standard.check_bip68_final(t, [coin], 600009, 1600001024))
+
+        # a confirmed coin without a median time past
+        with self.assertRaises(ValueError) as context:
+            standard.check_bip68_final(
+                t, [self.p2wpkh_coin], 600009, 1600001024)
+        self.assertIn('no median_time_past', str(context.exception))
+        with self.assertRaises(ValueError):
+            standard.check_tx_policy(
+                t, [self.p2wpkh_coin], best_height=600009)
+
+        # the disable flag
+        self.assertTrue(
+            standard.check_bip68_final(self.p2wpkh, [self.p2wpkh_coin], 0))
+
+    def test_sigops(self):
+        # two P2PKH outputs, and a 2-of-3 witness script
+        self.assertEqual(standard.get_sigop_cost(self.p2wsh), 8)
+        self.assertEqual(
+            standard.get_sigop_cost(self.p2wsh, [self.p2wsh_coin]), 11)
+        self.assertEqual(
+            standard.get_sigop_cost(self.p2wpkh, [self.p2wpkh_coin]), 1)
+        # one checksig in the P2PKH outputs, and 2-of-2 in the redeem script
+        self.assertEqual(
+            standard.get_sigop_cost(self.p2sh, [self.p2sh_coin]),
+            4 * sum(o.output_script[-1] == 0xac for o in self.p2sh.tx_outs)
+            + 4 * 2)
+        self.assertTrue(standard.check_too_many_sigops(self.p2wsh))
+        self.assertTrue(standard.check_too_many_sigops(
+            self.p2wsh, policy=standard.Policy(max_tx_sigops_cost=10)))
+        self.assertFalse(standard.check_too_many_sigops(
+            self.p2wsh, [self.p2wsh_coin],
+            standard.Policy(max_tx_sigops_cost=10)))
+
+    def test_inputs(self):
+        self.assertTrue(standard.check_nonstandard_inputs(
+            self.p2sh, [self.p2sh_coin]))
+        self.assertFalse(standard.check_nonstandard_inputs(
+            self.p2sh, [self.p2sh_coin],
+            standard.Policy(max_p2sh_sigops=1)))
+        self.assertTrue(standard.check_witness_nonstandard(
+            self.p2wsh, [self.p2wsh_coin]))
+        self.assertFalse(standard.check_witness_nonstandard(
+            self.p2wsh, [self.p2wsh_coin],
+            standard.Policy(max_p2wsh_script_size=104)))
+
+    def test_dust_threshold(self):
+        self.assertEqual(
+            standard.get_dust_threshold(
+                _output(0, helpers.PK['ser'][0]['pkh_output'])),
+            546)
+        self.assertEqual(
+            standard.get_dust_threshold(
+                _output(0, helpers.PK['ser'][0]['pkh_p2wpkh_output'])),
+            294)
+        self.assertEqual(
+            standard.get_dust_threshold(_output(0, b'\x6a')), 0)
+
+    def test_get_policy(self):
+        self.assertIs(standard.get_policy(), standard.DEFAULT_POLICY)
+        bch = networks.get_network('bitcoin_cash_main')
+        self.assertEqual(standard.get_policy(bch).max_op_return_relay, 223)
+
+        op_return = _output(0, b'\x6a\x4c\x64' + b'\x00' * 100)
+        t = self.p2sh.copy(tx_outs=[op_return])
+        self.assertEqual(standard.check_tx_policy(t), 'scriptpubkey')
+        self.assertIsNone(standard.check_tx_policy(t, network=bch))
+
+    def test_check_tx_policies(self):
+        txs = [self.p2wpkh, self.p2wsh, self.p2sh,
+               self.p2wpkh.copy(version=b'\x03\x00\x00\x00')]
+        coins = [[self.p2wpkh_coin], None, [_output(1000, b'\x51')], None]
+        expected = [None, None, 'bad-txns-nonstandard-inputs', 'version']
+        self.assertEqual(
+            standard.check_tx_policies(txs, coins), expected)
+        self.assertEqual(
+            standard.check_tx_policies(txs, coins, processes=2), expected)
+        self.assertEqual(standard.check_tx_policies(txs[:2]), [None, None])
@@ -0,0 +1,62 @@
+import unittest
+from riemann.tx import tx
+from riemann.tests import helpers
+from riemann.script import classify
+from riemann.script.classify import ScriptType
+
+
+class TestClassify(unittest.TestCase):
+
+    def test_classify_output_script(self):
+        # The fixture pubkeys are placeholders, without a valid first byte
+        pk = b'\x04' + helpers.PK['ser'][0]['pk'][1:]
+        compressed = b'\x02' + b'\x11' * 32
+        msig = b'\x52\x41' + pk + b'\x21' + compressed + b'\x52\xae'
+        cases = [
+            (helpers.PK['ser'][0]['pkh_output'], ScriptType.P2PKH),
+            (helpers.OP_IF['output_script'], ScriptType.P2SH),
+            (helpers.P2WPKH_ADDR['output'], ScriptType.P2WPKH),
+            (helpers.P2WSH['ser']['ins'][0]['pk_script'], ScriptType.P2WSH),
+            (b'\x41' + pk + b'\xac', ScriptType.P2PK),
+            (b'\x21' + compressed + b'\xac', ScriptType.P2PK),
+            (msig, ScriptType.MULTISIG),
+            (b'\x51\x21' + compressed + b'\x51\xae', ScriptType.MULTISIG),
+            (b'\x6a', ScriptType.OP_RETURN),
+            (b'\x6a\x4c\x03abc\x00\x51', ScriptType.OP_RETURN),
+            (b'\x51\x20' + b'\x00' * 32, ScriptType.WITNESS_UNKNOWN),
+            (b'\x60\x02\x00\x00', ScriptType.WITNESS_UNKNOWN),
+
+            (b'', ScriptType.NONSTANDARD),
+            (b'\x00\x15' + b'\x00' * 21, ScriptType.NONSTANDARD),
+            (b'\x00\x01\x00', ScriptType.NONSTANDARD),
+            (b'\x61\x02\x00\x00', ScriptType.NONSTANDARD),
+            (b'\x6a\x61', ScriptType.NONSTANDARD),
+            (b'\x6a\x05\x00', ScriptType.NONSTANDARD),
+            (b'\x40' + pk[:64] + b'\xac', ScriptType.NONSTANDARD),
+            # pubkeys whose first byte doesn't match their length
+            (b'\x21\x04' + b'\x11' * 32 + b'\xac', ScriptType.NONSTANDARD),
+            (b'\x41\x02' + pk[1:] + b'\xac', ScriptType.NONSTANDARD),
+            (b'\x51\x21\x09' + b'\x11' * 32 + b'\x51\xae',
+             ScriptType.NONSTANDARD),
+            (b'\x51\x41\x03' + pk[1:] + b'\x51\xae', ScriptType.NONSTANDARD),
+            (helpers.MSIG_2_2['ser_script'], ScriptType.NONSTANDARD),
+            # 2-of-1, 1-of-2 with one key, and a 20 byte "pubkey"
+            (b'\x52\x21' + compressed + b'\x51\xae', ScriptType.NONSTANDARD),
+            (b'\x51\x21' + compressed + b'\x52\xae', ScriptType.NONSTANDARD),
+            (b'\x51\x14' + b'\x00' * 20 + b'\x51\xae',
+             ScriptType.NONSTANDARD),
+            (b'\x76\xa9\x14' + b'\x00' * 20 + b'\x88\xad',
+             ScriptType.NONSTANDARD),
+        ]
+        for script, script_type in cases:
+            self.assertIs(
+                classify.classify_output_script(script), script_type,
+                script.hex())
+
+        self.assertEqual(ScriptType.P2WPKH, 'p2wpkh')
+
+    def test_classify_outputs(self):
+        t = tx.Tx.from_bytes(helpers.P2WPKH['ser']['tx']['signed'])
+        self.assertEqual(
+            classify.classify_outputs(t.tx_outs), [ScriptType.P2SH])
+        self.assertEqual(classify.classify_outputs([]), [])
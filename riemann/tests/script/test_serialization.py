@@ -103,6 +103,41 @@ class TestSerialization(unittest.TestCase):
             'Unsupported opcode. Got 0xfe',
             str(context.exception))
 
+    def test_iter_script_ops(self):
+        ops = [(op, None if data is None else bytes(data), offset)
+               for op, data, offset
+               in ser.iter_script_ops(helpers.MSIG_2_2['ser_script'])]
+        self.assertEqual(
+            ops,
+            [(82, None, 0),
+             (65, helpers.PK['ser'][0]['pk'], 1),
+             (65, helpers.PK['ser'][1]['pk'], 67),
+             (82, None, 133),
+             (174, None, 134)])
+
+        # OP_0, then pushes of each length encoding
+        script = helpers.P2SH_PD2['ser']['ins'][0]['script_sig']
+        self.assertEqual(
+            [op[1].hex() for op in ser.iter_script_ops(script)][1:],
+            ser.deserialize(script).split()[1:])
+
+        ops = list(ser.iter_script_ops(
+            b'\x00\x4c\x01\xff\x4e\x01\x00\x00\x00\xee\xab'))
+        self.assertEqual(
+            [(op, None if data is None else bytes(data), offset)
+             for op, data, offset in ops],
+            [(0, b'', 0), (76, b'\xff', 1), (78, b'\xee', 4),
+             (171, None, 10)])
+
+    def test_iter_script_ops_error(self):
+        for script in [b'\x05\x00\x00', b'\x4c', b'\x4d\x01',
+                       b'\x4d\x02\x00\x00', b'\x4e\x00\x00\x00']:
+            with self.assertRaises(IndexError) as context:
+                list(ser.iter_script_ops(b'\x51' + script))
+            self.assertIn(
+                'at offset 1 caused out of bounds exception.',
+                str(context.exception))
+
     def test_hex_deserialize(self):
         self.assertEqual(
             helpers.MSIG_2_2['redeem_script'],
@@ -0,0 +1,20 @@
+import unittest
+from riemann.tests import helpers
+from riemann.script import sigops
+
+
+class TestSigops(unittest.TestCase):
+
+    def test_count_sigops(self):
+        msig = helpers.MSIG_2_2['ser_script']
+        self.assertEqual(sigops.count_sigops(msig), 20)
+        self.assertEqual(sigops.count_sigops(msig, accurate=True), 2)
+        self.assertEqual(
+            sigops.count_sigops(helpers.PK['ser'][0]['pkh_output']), 1)
+        self.assertEqual(sigops.count_sigops(b'\xac\xad\xae\xaf'), 42)
+        self.assertEqual(
+            sigops.count_sigops(b'\xac\xad\xae\xaf', accurate=True), 42)
+        self.assertEqual(sigops.count_sigops(b''), 0)
+
+        # counting stops at a truncated push
+        self.assertEqual(sigops.count_sigops(b'\xac\x05\xac'), 1)
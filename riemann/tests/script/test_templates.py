@@ -0,0 +1,72 @@
+import unittest
+import riemann
+from riemann import networks
+from riemann.tests import helpers
+from riemann.script import examples
+from riemann.script import serialization as ser
+from riemann.script import templates
+
+
+class TestTemplates(unittest.TestCase):
+
+    def tearDown(self):
+        riemann.select_network('bitcoin_main')
+
+    def test_fill(self):
+        pks = [pk['pk'] for pk in helpers.PK['ser']]
+
+        template = templates.ScriptTemplate(examples.msig_two_two)
+        self.assertEqual(template.keys, ('pk0', 'pk1'))
+        self.assertEqual(
+            template.fill(pk0=pks[0], pk1=pks[1]),
+            helpers.MSIG_2_2['ser_script'])
+
+        template = templates.ScriptTemplate(examples.p2pkh_script_pubkey)
+        self.assertEqual(
+            template.fill(pk=helpers.PK['ser'][0]['pkh']),
+            helpers.PK['ser'][0]['pkh_output'])
+
+        # positional placeholders, and a placeholder at each end
+        template = templates.ScriptTemplate('{} OP_DROP {}')
+        self.assertEqual(template.keys, (0, 1))
+        self.assertEqual(
+            template.fill(b'\xaa' * 80, b''),
+            b'\x4c\x50' + b'\xaa' * 80 + b'\x75' + b'\x00')
+        self.assertEqual(
+            templates.ScriptTemplate('{1} {0}').fill(b'\x01', b'\x02'),
+            b'\x01\x02\x01\x01')
+
+        data = bytes(range(256)) * 2
+        self.assertEqual(
+            templates.ScriptTemplate('OP_RETURN {data}').fill(data=data),
+            ser.serialize('OP_RETURN {}'.format(data.hex())))
+
+    def test_fill_error(self):
+        template = templates.ScriptTemplate(examples.msig_two_two)
+        with self.assertRaises(KeyError):
+            template.fill(pk0=b'\x00' * 33)
+        with self.assertRaises(NotImplementedError):
+            template.fill(pk0=b'\x00' * 33, pk1=b'\x00' * 1001)
+        with self.assertRaises(ValueError):
+            templates.ScriptTemplate('OP_NOTAREALOPCODE {pk}')
+
+    def test_compile_template(self):
+        script_hash = helpers.MSIG_2_2['script_hash']
+        template = templates.compile_template(examples.p2sh_script_pubkey)
+        self.assertIs(
+            template,
+            templates.compile_template(examples.p2sh_script_pubkey))
+        self.assertEqual(
+            template.fill(sh=script_hash),
+            b'\xa9\x14' + script_hash + b'\x87')
+
+        # templates are compiled against each network's opcodes
+        dcr = networks.get_network('decred_main')
+        template = templates.compile_template('OP_SHA256 {sh}', network=dcr)
+        self.assertIsNot(
+            template, templates.compile_template('OP_SHA256 {sh}'))
+        self.assertEqual(template.fill(sh=b'\x01'), b'\xc0\x01\x01')
+
+        riemann.select_network('decred_main')
+        self.assertIs(
+            template, templates.compile_template('OP_SHA256 {sh}'))
@@ -1,6 +1,7 @@
 # flake8: noqa
 
 import unittest
+from .. import blake256
 from ..blake256 import blake_hash
 
 TEST_VECTORS = [
@@ -46,3 +47,37 @@ class TestBlake(unittest.TestCase):
     def test_blake(self):
         for vectorSet in TEST_VECTORS:
             self.assertEqual(vectorSet[0], blake_hash(vectorSet[1]).hex())
+
+    def test_python_backend(self):
+        for vectorSet in TEST_VECTORS:
+            self.assertEqual(
+                vectorSet[0], blake256.python_blake_hash(vectorSet[1]).hex())
+
+        # The one-shot path matches the incremental BLAKE class across every
+        # padding case and multi-block messages
+        for length in range(200):
+            data = bytes(range(256))[:length]
+            self.assertEqual(
+                blake256.python_blake_hash(data),
+                blake256.BLAKE(256).digest(data))
+        self.assertEqual(
+            blake256.python_blake_hash(memoryview(b'\xa5' * 1000)),
+            blake256.BLAKE(256).digest(b'\xa5' * 1000))
+
+    @unittest.skipIf(blake256.native_blake_hash is None,
+                     'native BLAKE-256 backend is not built')
+    def test_native_backend(self):
+        for vectorSet in TEST_VECTORS:
+            self.assertEqual(
+                vectorSet[0], blake256.native_blake_hash(vectorSet[1]).hex())
+
+        # Cover every padding case and multi-block messages
+        for length in range(200):
+            data = bytes(range(256))[:length]
+            self.assertEqual(
+                blake256.native_blake_hash(data),
+                blake256.python_blake_hash(data))
+        data = bytearray(b'\xa5' * 10000)
+        self.assertEqual(
+            blake256.native_blake_hash(data),
+            blake256.python_blake_hash(bytes(data)))
@@ -1,6 +1,10 @@
+import asyncio
+import threading
 import unittest
 import riemann
 from riemann import networks
+from riemann.encoding import addresses
+from riemann.tests import helpers
 
 
 class test_riemann(unittest.TestCase):
@@ -24,5 +28,76 @@ class test_riemann(unittest.TestCase):
             riemann.select_network(n)
             self.assertEqual(riemann.get_current_network_name(), n)
 
+    def test_network_context(self):
+        with riemann.network_context('litecoin_main') as network:
+            self.assertIs(network, networks.LitecoinMain)
+            self.assertIs(riemann.network, networks.LitecoinMain)
+            self.assertEqual(riemann.get_current_network_name(),
+                             'litecoin_main')
+            with riemann.network_context('decred_main'):
+                self.assertIs(riemann.get_current_network(),
+                              networks.DecredMain)
+            self.assertIs(riemann.get_current_network(),
+                          networks.LitecoinMain)
+
+            # The context takes precedence over the selected network
+            riemann.select_network('dash_main')
+            self.assertIs(riemann.network, networks.LitecoinMain)
+
+        self.assertIs(riemann.network, networks.DashMain)
+
+        with self.assertRaises(ValueError):
+            with riemann.network_context('toast'):
+                pass  # pragma: nocover
+
+    def test_network_context_threads(self):
+        pubkey = helpers.PK['ser'][0]['pk']
+        names = ['bitcoin_main', 'litecoin_main', 'dogecoin_main']
+        expected = {}
+        for name in names:
+            riemann.select_network(name)
+            expected[name] = addresses.make_p2pkh_address(pubkey)
+        riemann.select_network('bitcoin_main')
+
+        # Each thread waits for the others to enter their contexts before
+        # encoding, so all the contexts are active at once
+        barrier = threading.Barrier(len(names))
+        results = {}
+
+        def worker(name):
+            with riemann.network_context(name):
+                barrier.wait()
+                results[name] = addresses.make_p2pkh_address(pubkey)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in names]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(results, expected)
+        self.assertIs(riemann.network, networks.BitcoinMain)
+
+    def test_network_context_tasks(self):
+        async def current_name(name):
+            with riemann.network_context(name):
+                await asyncio.sleep(0)
+                return riemann.get_current_network_name()
+
+        async def main():
+            return await asyncio.gather(
+                current_name('litecoin_main'), current_name('dash_main'))
+
+        self.assertEqual(asyncio.run(main()), ['litecoin_main', 'dash_main'])
+
+    def test_network_read_only(self):
+        riemann.select_network('bitcoin_main')
+        with self.assertRaises(AttributeError) as context:
+            riemann.network = networks.LitecoinMain
+        self.assertIn('riemann.select_network', str(context.exception))
+        self.assertIs(riemann.network, networks.BitcoinMain)
+
+        with self.assertRaises(AttributeError):
+            riemann.not_an_attribute
+
     def tearDown(self):
         riemann.select_network('bitcoin_main')
@@ -1,5 +1,6 @@
 import unittest
 import riemann
+from riemann import networks
 from riemann import simple
 from riemann import tx as txn
 from riemann.tests import helpers
@@ -21,6 +22,17 @@ class TestSimple(unittest.TestCase):
                     address=helpers.P2WSH['human']['outs'][i]['addr']),
                 helpers.P2WSH['ser']['outs'][i]['output'])
 
+    def test_output_explicit_network(self):
+        riemann.select_network('bitcoin_cash_main')
+        btc = networks.get_network('bitcoin_main')
+        for i in range(len(helpers.P2WSH['human']['outs'])):
+            self.assertEqual(
+                simple.output(
+                    value=helpers.P2WSH['human']['outs'][i]['value'],
+                    address=helpers.P2WSH['human']['outs'][i]['addr'],
+                    network=btc),
+                helpers.P2WSH['ser']['outs'][i]['output'])
+
     def test_outpoint(self):
         self.assertEqual(
             simple.outpoint(
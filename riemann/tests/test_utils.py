@@ -4,6 +4,10 @@ from .. import utils
 from . import helpers
 
 
+def _scale(items, factor):
+    return [i * factor for i in items]
+
+
 class TestUtils(unittest.TestCase):
 
     def setUp(self):
@@ -143,6 +147,16 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(utils.hash256(b'\x00'),
                          utils.blake256(utils.blake256(b'\x00')))
 
+    def test_network_hashes(self):
+        self.assertEqual(utils.sha256_hash160(b'\x00'),
+                         utils.rmd160(utils.sha256(b'\x00')))
+        self.assertEqual(utils.blake256_hash160(b'\x00'),
+                         utils.rmd160(utils.blake256(b'\x00')))
+        self.assertEqual(utils.double_sha256(b'\x00'),
+                         utils.sha256(utils.sha256(b'\x00')))
+        self.assertEqual(utils.double_blake256(b'\x00'),
+                         utils.blake256(utils.blake256(b'\x00')))
+
     def test_blake2b(self):
         '''
         https://github.com/BLAKE2/BLAKE2/blob/master/testvectors/blake2b-kat.txt
@@ -177,3 +191,16 @@ class TestUtils(unittest.TestCase):
             utils.blake2s(bytes.fromhex('000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f202122232425262728292a2b2c2d2e2f303132333435363738393a3b3c3d3e3f'),  # noqa: E501
                           key=bytes.fromhex('000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f')),  # noqa: E501
             bytes.fromhex('8975b0577fd35566d750b362b0897a26c399136df07bababbde6203ff2954ed4'))  # noqa: E501
+
+    def test_map_chunks(self):
+        self.assertEqual(utils.map_chunks(_scale, [], 3), [])
+        self.assertEqual(
+            utils.map_chunks(_scale, range(10), 3),
+            [i * 3 for i in range(10)])
+        for processes in (1, 2):
+            self.assertEqual(
+                utils.map_chunks(_scale, [], 3, processes=processes), [])
+            self.assertEqual(
+                utils.map_chunks(
+                    _scale, range(10), 3, processes=processes),
+                [i * 3 for i in range(10)])
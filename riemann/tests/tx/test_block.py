@@ -0,0 +1,174 @@
+import io
+import mmap
+import tempfile
+import unittest
+from riemann import tx, utils
+from riemann.tests import helpers
+
+
+class TestBlockHeader(unittest.TestCase):
+
+    def setUp(self):
+        self.header_bytes = helpers.GENESIS_BLOCK['block'][:80]
+
+    def test_from_bytes(self):
+        header = tx.BlockHeader.from_bytes(self.header_bytes)
+        self.assertEqual(header, self.header_bytes)
+        self.assertEqual(header.prev_block, b'\x00' * 32)
+        self.assertEqual(
+            header.merkle_root,
+            helpers.GENESIS_BLOCK['merkle_root_le'])
+        self.assertEqual(
+            header.block_hash,
+            helpers.GENESIS_BLOCK['block_hash'])
+
+    def test_block_hash_lazy(self):
+        header = tx.BlockHeader.from_bytes(self.header_bytes)
+        self.assertIsNone(header._block_hash_le)
+        self.assertEqual(
+            header.block_hash_le,
+            utils.hash256(self.header_bytes))
+        self.assertIs(header.block_hash_le, header.block_hash_le)
+        with self.assertRaises(TypeError):
+            header.nonce = b'\x00' * 4
+
+    def test_copy(self):
+        header = tx.BlockHeader.from_bytes(self.header_bytes)
+        res = header.copy()
+        self.assertEqual(res, header)
+        self.assertIsNot(res, header)
+
+        res = header.copy(nonce=b'\x00' * 4)
+        self.assertEqual(res[:76], header[:76])
+        self.assertNotEqual(res.block_hash, header.block_hash)
+
+    def test_init_error(self):
+        with self.assertRaises(ValueError) as context:
+            tx.BlockHeader.from_bytes(self.header_bytes[:79])
+
+        self.assertIn(
+            'Expected byte-like object with length 4. ',
+            str(context.exception))
+
+
+class TestParseBlock(unittest.TestCase):
+
+    def check_genesis(self, header, tx_count, txs):
+        self.assertEqual(
+            header.block_hash,
+            helpers.GENESIS_BLOCK['block_hash'])
+        self.assertEqual(tx_count, 1)
+        txs = list(txs)
+        self.assertEqual(len(txs), 1)
+        self.assertEqual(txs[0].tx_id, helpers.GENESIS_BLOCK['tx_id'])
+
+    def test_parse_block_bytes(self):
+        self.check_genesis(*tx.parse_block(helpers.GENESIS_BLOCK['block']))
+
+    def test_parse_block_file(self):
+        f = io.BytesIO(helpers.GENESIS_BLOCK['block'])
+        self.check_genesis(*tx.parse_block(f, chunk_size=7))
+
+    def test_parse_block_mmap(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(helpers.GENESIS_BLOCK['block'])
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                self.check_genesis(*tx.parse_block(m))
+
+    def test_parse_block_truncated(self):
+        with self.assertRaises(ValueError):
+            list(tx.parse_block(helpers.GENESIS_BLOCK['block'][:-3])[2])
+
+        f = io.BytesIO(helpers.GENESIS_BLOCK['block'][:-3])
+        with self.assertRaises(ValueError):
+            list(tx.parse_block(f, chunk_size=16)[2])
+
+    def test_iter_blocks(self):
+        block = helpers.GENESIS_BLOCK['block']
+        record = (helpers.GENESIS_BLOCK['magic']
+                  + len(block).to_bytes(4, 'little')
+                  + block)
+        data = record * 3 + b'\x00' * 20
+
+        for source in [data, io.BytesIO(data)]:
+            blocks = tx.iter_blocks(source)
+
+            # consume the first block's txs
+            self.check_genesis(*next(blocks))
+
+            # leave the second block's txs unconsumed
+            header, tx_count, _ = next(blocks)
+            self.assertEqual(tx_count, 1)
+
+            self.check_genesis(*next(blocks))
+            self.assertEqual(list(blocks), [])
+
+
+class TestIterTxs(unittest.TestCase):
+
+    def setUp(self):
+        self.txs = [
+            helpers.P2PKH1['ser']['tx']['signed'],
+            helpers.P2WSH['ser']['tx']['signed'],
+            helpers.P2SH['ser']['tx']['signed'],
+            helpers.P2WPKH['ser']['tx']['signed']]
+        self.stream = b''.join(self.txs)
+
+    def test_iter_txs_bytes(self):
+        self.assertEqual(list(tx.iter_txs(self.stream)), self.txs)
+        self.assertEqual(list(tx.iter_txs(b'')), [])
+
+    def test_iter_txs_file(self):
+        for chunk_size in [1, 5, 64, 1 << 20]:
+            f = io.BytesIO(self.stream)
+            self.assertEqual(
+                list(tx.iter_txs(f, chunk_size=chunk_size)),
+                self.txs)
+
+    def test_iter_txs_lazy(self):
+        f = io.BytesIO(self.stream)
+        txs = tx.iter_txs(f, chunk_size=16)
+        self.assertEqual(next(txs), self.txs[0])
+        self.assertLess(f.tell(), len(self.stream))
+
+    def test_iter_txs_malformed(self):
+        # A tx with no inputs or outputs, followed by many valid txs
+        malformed = b'\x01\x00\x00\x00' + b'\x00\x00' + b'\x00' * 4
+        f = io.BytesIO(malformed + self.stream * 1000)
+        with self.assertRaises(ValueError) as context:
+            next(tx.iter_txs(f, chunk_size=64))
+        self.assertIn('Too few inputs or outputs.', str(context.exception))
+        self.assertEqual(f.tell(), 64)
+
+    def test_iter_txs_witness_flag(self):
+        # Witnesses are read whenever the flag is set, not when data is left
+        t = tx.Tx.from_bytes(helpers.P2WPKH['ser']['tx']['signed'])
+        unsigned = t.copy(tx_witnesses=[tx.InputWitness([])])
+        stream = unsigned.to_bytes() * 2 + t.to_bytes()
+        self.assertEqual(list(tx.iter_txs(stream)), [unsigned, unsigned, t])
+        f = io.BytesIO(stream)
+        self.assertEqual(
+            list(tx.iter_txs(f, chunk_size=16)), [unsigned, unsigned, t])
+
+        # A flagged tx without witnesses can't be parsed
+        flagged = tx.Tx(
+            t.version, t.flag, t.tx_ins, t.tx_outs, None, t.lock_time)
+        with self.assertRaises(tx.TruncatedDataError):
+            tx.Tx.from_bytes(flagged.to_bytes())
+        with self.assertRaises(tx.TruncatedDataError):
+            list(tx.iter_txs(flagged.to_bytes() * 2))
+
+    def test_iter_txs_truncated(self):
+        f = io.BytesIO(self.stream[:-3])
+        with self.assertRaises(tx.TruncatedDataError) as context:
+            list(tx.iter_txs(f, chunk_size=64))
+        self.assertIn('Unexpected end of data', str(context.exception))
+
+    def test_iter_txs_error(self):
+        with self.assertRaises(TypeError) as context:
+            tx.iter_txs(7)
+
+        self.assertIn(
+            'Expected a bytes-like or binary file object.',
+            str(context.exception))
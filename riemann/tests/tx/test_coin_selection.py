@@ -0,0 +1,194 @@
+import random
+import unittest
+import riemann
+from riemann import utils
+from riemann.tx import tx
+from riemann.tx import tx_builder as tb
+from riemann.tx import coin_selection as cs
+
+OUTPOINT = tx.Outpoint(b'\x11' * 32, b'\x00' * 4)
+OUTPUT_SCRIPT = b'\x00\x14' + b'\x22' * 20
+CHANGE_SCRIPT = b'\x00\x14' + b'\x33' * 20
+
+
+def make_utxos(values, input_type='p2wpkh'):
+    return [cs.Utxo(OUTPOINT, value, input_type) for value in values]
+
+
+def make_output(value):
+    return tx.TxOut(utils.i2le_padded(value, 8), OUTPUT_SCRIPT)
+
+
+class TestCoinSelection(unittest.TestCase):
+
+    def setUp(self):
+        riemann.select_network('bitcoin_main')
+
+    def assertBalances(self, selection, outputs, feerate):
+        spent = sum(u.value for u in selection.inputs)
+        paid = sum(utils.le2i(o.value) for o in outputs)
+        self.assertEqual(spent, paid + selection.change + selection.fee)
+
+        estimator = tb.TxSizeEstimator()
+        for u in selection.inputs:
+            estimator.add_input(u.input_type)
+        for o in outputs:
+            estimator.add_output(o.output_script)
+        if selection.change:
+            estimator.add_output(CHANGE_SCRIPT)
+        self.assertGreaterEqual(selection.fee, estimator.vsize * feerate)
+
+    def test_select_bnb(self):
+        values = [500, 400, 300, 200]
+        weights = [1] * 4
+        self.assertEqual(cs.select_bnb(values, weights, 600, 10), [1, 3])
+        self.assertEqual(cs.select_bnb(values, weights, 605, 10), None)
+        self.assertEqual(cs.select_bnb(values, weights, 900, 0), [0, 1])
+        self.assertEqual(
+            cs.select_bnb(values, [3, 1, 1, 1], 900, 0, max_weight=3),
+            [1, 2, 3])
+        self.assertEqual(
+            cs.select_bnb(values, [3, 1, 1, 1], 900, 0, max_weight=2), None)
+        self.assertEqual(
+            cs.select_bnb([500, 400], [1, 1], 1000, 10), None)
+        self.assertEqual(
+            cs.select_bnb([5, 5, 5, 5, 3], [1] * 5, 13, 0), [0, 1, 4])
+
+    def test_select_knapsack(self):
+        rng = random.Random(0)
+        # An exact match
+        self.assertEqual(
+            cs.select_knapsack([900, 500, 100], [1] * 3, 500, 100, rng=rng),
+            [1])
+        # The smallest value large enough to make change
+        self.assertEqual(
+            cs.select_knapsack(
+                [5000, 2000, 300, 200], [1] * 4, 1000, 500, rng=rng),
+            [1])
+        # Every small value, when they add up to the target
+        self.assertEqual(
+            cs.select_knapsack([5000, 300, 200], [1] * 3, 500, 500, rng=rng),
+            [1, 2])
+        self.assertEqual(
+            cs.select_knapsack(
+                [5000, 300, 200], [1] * 3, 500, 500, max_weight=1, rng=rng),
+            None)
+        # A subset of the small values
+        values = [400, 300, 200, 100]
+        chosen = cs.select_knapsack(values, [1] * 4, 600, 10, rng=rng)
+        self.assertEqual(sum(values[i] for i in chosen), 600)
+        self.assertEqual(
+            cs.select_knapsack([400, 300], [1] * 2, 1000, 10, rng=rng), None)
+
+    def test_select_largest_first(self):
+        values = [500, 400, 300, 200]
+        self.assertEqual(
+            cs.select_largest_first(values, [1] * 4, 600), [0, 1])
+        self.assertEqual(
+            cs.select_largest_first(values, [1] * 4, 1000, max_weight=2),
+            None)
+        self.assertEqual(
+            cs.select_largest_first([500, 400], [1] * 2, 1000), None)
+
+    def test_select_coins(self):
+        utxos = make_utxos([50_000, 20_000, 10_000, 5_000])
+        outputs = [make_output(29_600)]
+
+        # 20_000 + 10_000 pays 29_600, and leaves too little for change
+        selection = cs.select_coins(utxos, outputs, 1, CHANGE_SCRIPT)
+        self.assertEqual(selection.strategy, 'bnb')
+        self.assertEqual(
+            [u.value for u in selection.inputs], [20_000, 10_000])
+        self.assertEqual(selection.change, 0)
+        self.assertEqual(selection.fee, 400)
+        self.assertBalances(selection, outputs, 1)
+
+        selection = cs.select_coins(
+            utxos, outputs, 1, CHANGE_SCRIPT, strategy='largest_first')
+        self.assertEqual(selection.strategy, 'largest_first')
+        self.assertEqual([u.value for u in selection.inputs], [50_000])
+        self.assertEqual(selection.fee, 141)
+        self.assertEqual(selection.change, 50_000 - 29_600 - 141)
+        self.assertBalances(selection, outputs, 1)
+
+        # No changeless solution, so knapsack makes change
+        outputs = [make_output(33_000)]
+        selection = cs.select_coins(
+            utxos, outputs, 1, CHANGE_SCRIPT, rng=random.Random(0))
+        self.assertEqual(selection.strategy, 'knapsack')
+        self.assertGreater(selection.change, 0)
+        self.assertBalances(selection, outputs, 1)
+
+        with self.assertRaises(ValueError) as context:
+            cs.select_coins(
+                utxos, outputs, 1, CHANGE_SCRIPT, strategy='bnb')
+        self.assertIn('No solution found by bnb', str(context.exception))
+
+    def test_select_coins_input_types(self):
+        outputs = [make_output(100_000)]
+        utxos = (make_utxos([60_000], 'p2pkh')
+                 + make_utxos([60_000], 'p2sh_p2wpkh'))
+        for feerate in (1, 2.5, 20):
+            selection = cs.select_coins(
+                utxos, outputs, feerate, CHANGE_SCRIPT,
+                strategy='largest_first')
+            self.assertEqual(len(selection.inputs), 2)
+            self.assertBalances(selection, outputs, feerate)
+
+    def test_select_coins_weight_limit(self):
+        # About 1_460 p2wpkh inputs fit in a standard tx
+        utxos = make_utxos([10_000] * 2_000)
+        selection = cs.select_coins(
+            utxos, [make_output(5_000_000)], 1, CHANGE_SCRIPT)
+        self.assertEqual(len(selection.inputs), 504)
+        self.assertBalances(selection, [make_output(5_000_000)], 1)
+
+        for strategy in [None, *cs.STRATEGIES]:
+            with self.assertRaises(ValueError) as context:
+                cs.select_coins(
+                    utxos, [make_output(15_000_000)], 1, CHANGE_SCRIPT,
+                    strategy=strategy)
+            self.assertIn('within a weight of 400000', str(context.exception))
+
+    def test_select_coins_bnb_changeless(self):
+        rng = random.Random(0)
+        utxos = make_utxos([rng.randint(1_000, 100_000) for _ in range(500)])
+        outputs = [make_output(1_000_000)]
+        for feerate in (1, 3.7, 25):
+            selection = cs.select_coins(
+                utxos, outputs, feerate, CHANGE_SCRIPT, strategy='bnb')
+            self.assertEqual(selection.change, 0)
+            self.assertBalances(selection, outputs, feerate)
+
+    def test_select_coins_uneconomical(self):
+        # At 100 sat/vbyte, spending a p2wpkh input costs 6_800
+        utxos = make_utxos([100_000] + [6_000] * 100)
+        with self.assertRaises(ValueError) as context:
+            cs.select_coins(
+                utxos, [make_output(100_000)], 100, CHANGE_SCRIPT)
+        self.assertIn('Insufficient funds', str(context.exception))
+
+    def test_select_coins_min_change(self):
+        utxos = make_utxos([50_000])
+        outputs = [make_output(49_000)]
+        selection = cs.select_coins(
+            utxos, outputs, 1, CHANGE_SCRIPT, strategy='largest_first')
+        self.assertEqual(selection.change, 859)
+        selection = cs.select_coins(
+            utxos, outputs, 1, CHANGE_SCRIPT, strategy='largest_first',
+            min_change=1_000)
+        self.assertEqual(selection.change, 0)
+        self.assertEqual(selection.fee, 1_000)
+
+    def test_select_coins_errors(self):
+        utxos = make_utxos([50_000])
+        outputs = [make_output(10_000)]
+        with self.assertRaises(ValueError) as context:
+            cs.select_coins(
+                utxos, outputs, 1, CHANGE_SCRIPT, strategy='fifo')
+        self.assertIn('Unknown strategy', str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            cs.select_coins(
+                make_utxos([50_000], 'p2tr'), outputs, 1, CHANGE_SCRIPT)
+        self.assertIn('Unknown input type: p2tr', str(context.exception))
@@ -16,6 +16,17 @@ class TestByteData(unittest.TestCase):
         next(i)
         self.assertRaises(StopIteration, i.__next__)
 
+    def test_freeze(self):
+        bd = tx.ByteData()
+        bd._freeze(b'\x00', tx.VarInt(1), bytearray(b'\x02'))
+        self.assertEqual(bd, b'\x00\x01\x02')
+        with self.assertRaises(TypeError):
+            bd.a = 1
+
+        res = tx.VarInt._from_parts(b'\x07', number=7)
+        self.assertEqual(res, tx.VarInt(7))
+        self.assertEqual(res.number, 7)
+
     def test_iadd_error(self):
         bd = tx.ByteData()
         with self.assertRaises(TypeError) as context:
@@ -147,6 +158,39 @@ class TestVarInt(unittest.TestCase):
             'Malformed VarInt. Got: fe',
             str(context.exception))
 
+    def test_encode(self):
+        for n in [0, 0xfc, 0xfd, 0xffff, 0x10000, 0xffffffff, 2 ** 64 - 1]:
+            self.assertEqual(tx.VarInt.encode(n), tx.VarInt(n))
+
+        with self.assertRaises(ValueError) as context:
+            tx.VarInt.encode(-1)
+        self.assertIn('VarInt cannot be less than 0.',
+                      str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            tx.VarInt.encode(2 ** 64)
+        self.assertIn('VarInt cannot be greater than (2 ** 64) - 1.',
+                      str(context.exception))
+
+    def test_non_compact(self):
+        self.assertEqual(tx.VarInt(5, length=3), b'\xfd\x05\x00')
+        self.assertEqual(tx.VarInt.from_bytes(b'\xfe\x05\x00\x00\x00'),
+                         b'\xfe\x05\x00\x00\x00')
+        self.assertEqual(tx.VarInt(5, length=1), b'\x05')
+
+    def test_read(self):
+        view = memoryview(b'\x00\x07\xfd\x91#\xfe\x01\x00\x01\x00')
+        self.assertEqual(tx.VarInt.read(view), (0, 1))
+        self.assertEqual(tx.VarInt.read(view, 1), (7, 2))
+        self.assertEqual(tx.VarInt.read(view, 2), (0x2391, 5))
+        self.assertEqual(tx.VarInt.read(view, 5), (0x10001, 10))
+
+        with self.assertRaises(ValueError) as context:
+            tx.VarInt.read(view[:8], 5)
+        self.assertIn(
+            'Malformed VarInt. Got: ',
+            str(context.exception))
+
     def test_zcash_compact_enforcement(self):
         riemann.select_network('zcash_overwinter_main')
 
@@ -552,6 +552,25 @@ class TestTx(unittest.TestCase):
         self.assertEqual(t.lock_time, helpers.P2WSH['ser']['locktime'])
         self.assertEqual(t, helpers.P2WSH['ser']['tx']['signed'])
 
+    def test_from_view(self):
+        signed = helpers.P2WSH['ser']['tx']['signed']
+        padding = b'\xaa' * 7
+        view = memoryview(padding + signed + padding)
+        t, end = tx.Tx.from_view(view, len(padding))
+        self.assertEqual(t, signed)
+        self.assertEqual(end, len(padding) + len(signed))
+
+        # tx_ins and tx_outs can be read back-to-back from one view
+        signed = helpers.P2PKH1['ser']['tx']['signed']
+        view = memoryview(signed)
+        tx_in, current = tx.TxIn.from_view(view, 5)
+        self.assertEqual(tx_in, helpers.P2PKH1['ser']['tx']['in'])
+        tx_out, current = tx.TxOut.from_view(view, current + 1)
+        self.assertEqual(tx_out, helpers.P2PKH1['ser']['outs'][0]['out'])
+        tx_out, current = tx.TxOut.from_view(view, current)
+        self.assertEqual(tx_out, helpers.P2PKH1['ser']['outs'][1]['out'])
+        self.assertEqual(view[current:], helpers.P2PKH1['ser']['locktime'])
+
     def test_calculate_fee(self):
         t = tx.Tx(self.version, self.none_flag, self.tx_ins, self.tx_outs,
                   self.none_witnesses, self.lock_time)
@@ -626,6 +645,104 @@ class TestTx(unittest.TestCase):
                 anyone_can_pay=True),
             helpers.P2WPKH['ser']['segwit_sighash']['single_anyonecanpay'])
 
+    def test_slots(self):
+        t = tx.Tx.from_bytes(helpers.P2WSH['ser']['tx']['signed'])
+        objects = [t, t.tx_ins[0], t.tx_ins[0].outpoint, t.tx_outs[0],
+                   t.tx_witnesses[0], t.tx_witnesses[0].stack[0]]
+        for o in objects:
+            self.assertFalse(hasattr(o, '__dict__'))
+
+        # Components are read back out of the serialization
+        self.assertEqual(t.version, t[:4])
+        self.assertEqual(t.lock_time, t[-4:])
+        self.assertEqual(
+            t.tx_ins[0].script_sig,
+            t.tx_ins[0].stack_script + t.tx_ins[0].redeem_script)
+        self.assertEqual(t.tx_outs[0].output_script, t.tx_outs[0][9:])
+
+        # Multi-byte VarInt length prefixes
+        tx_in = t.tx_ins[0].copy(stack_script=b'\x51' * 300,
+                                 redeem_script=b'\x52' * 3)
+        self.assertEqual(tx_in.stack_script, b'\x51' * 300)
+        self.assertEqual(tx_in.redeem_script, b'\x52' * 3)
+        self.assertEqual(tx_in.script_sig, b'\x51' * 300 + b'\x52' * 3)
+        tx_out = t.tx_outs[0].copy(output_script=b'\x51' * 0xfd)
+        self.assertEqual(tx_out.output_script, b'\x51' * 0xfd)
+        item = tx.WitnessStackItem(b'\x00' * 0x10000)
+        self.assertEqual(item.item, b'\x00' * 0x10000)
+
+    def test_lazy_tx_ids(self):
+        t = tx.Tx.from_bytes(helpers.P2WSH['ser']['tx']['signed'])
+        self.assertIsNone(t._tx_id_le)
+        self.assertIsNone(t._wtx_id_le)
+        self.assertEqual(t.tx_id_le, utils.hash256(t.no_witness()))
+        self.assertEqual(t.wtx_id_le, utils.hash256(t.to_bytes()))
+        self.assertEqual(t.tx_id, t.tx_id_le[::-1])
+        self.assertEqual(t.wtx_id, t.wtx_id_le[::-1])
+        self.assertIs(t.tx_id_le, t._tx_id_le)
+
+        t = tx.Tx(self.version, None, self.tx_ins, self.tx_outs,
+                  None, self.lock_time)
+        self.assertEqual(t.tx_id_le, utils.hash256(t.to_bytes()))
+        self.assertIsNone(t.wtx_id_le)
+        self.assertIsNone(t.wtx_id)
+
+    def test_weight(self):
+        for name in ['P2PKH1', 'P2SH', 'P2WPKH', 'P2WSH']:
+            t = tx.Tx.from_bytes(getattr(helpers, name)['ser']['tx']['signed'])
+            self.assertIsNone(t._weight)
+            self.assertEqual(t.weight, len(t.no_witness()) * 3 + len(t))
+            self.assertEqual(t.vsize, -(-t.weight // 4))
+            self.assertIs(t.weight, t._weight)
+
+        t = tx.Tx(self.version, None, self.tx_ins, self.tx_outs,
+                  None, self.lock_time)
+        self.assertEqual(t.weight, len(t) * 4)
+        self.assertEqual(t.vsize, len(t))
+
+    def test_sigops(self):
+        # two P2PKH outputs
+        t = tx.Tx.from_bytes(helpers.P2WSH['ser']['tx']['signed'])
+        self.assertIsNone(t._legacy_sigops)
+        self.assertEqual(t.legacy_sigops, 2)
+        self.assertEqual(t.legacy_sigops, t._legacy_sigops)
+        self.assertEqual(t.sigop_cost(), 8)
+        # and a 2-of-3 witness script
+        self.assertEqual(
+            t.sigop_cost([helpers.P2WSH['ser']['ins'][0]['pk_script']]), 11)
+
+        # a 2-of-2 P2SH redeem script
+        t = tx.Tx.from_bytes(helpers.P2SH['ser']['tx']['signed'])
+        redeem_script = helpers.P2SH['ser']['ins'][0]['redeem_script']
+        prevout_script = \
+            b'\xa9\x14' + utils.hash160(redeem_script) + b'\x87'
+        self.assertEqual(t.sigop_cost(), 0)
+        self.assertEqual(t.sigop_cost([prevout_script]), 8)
+
+        # P2WPKH
+        t = tx.Tx.from_bytes(helpers.P2WPKH['ser']['tx']['signed'])
+        self.assertEqual(t.sigop_cost([b'\x00\x14' + b'\x00' * 20]), 1)
+
+    def test_precompute_sighash_cache(self):
+        t = tx.Tx.from_bytes(helpers.P2WSH['ser']['tx']['signed'])
+        cache = t.precompute_sighash_cache()
+        self.assertIs(t.precompute_sighash_cache(), cache)
+
+        self.assertEqual(
+            cache.hash_prevouts,
+            utils.hash256(b''.join(i.outpoint.to_bytes() for i in t.tx_ins)))
+        self.assertEqual(
+            cache.hash_sequence,
+            utils.hash256(b''.join(i.sequence for i in t.tx_ins)))
+        self.assertEqual(
+            cache.hash_outputs,
+            utils.hash256(b''.join(o.to_bytes() for o in t.tx_outs)))
+
+        # The cache does not change the tx or its serialization
+        self.assertEqual(t, helpers.P2WSH['ser']['tx']['signed'])
+        with self.assertRaises(TypeError):
+            t._sighash_cache = None
+
     def test_presegwit_sighashes(self):
         ''' all, all anyonecanpay, single, single_anyonecanpay.
         Marks transaction as pre- or non-segwit in a segwit network.
@@ -670,6 +787,100 @@ class TestTx(unittest.TestCase):
             'I refuse to implement the SIGHASH_SINGLE bug.',
             str(context.exception))
 
+    def _batch_tx(self, flag=None, witnesses=None):
+        tx_ins = [self.tx_in.copy(
+                      outpoint=self.outpoint.copy(
+                          index=utils.i2le_padded(i, 4)),
+                      sequence=utils.i2le_padded(0xfffffffd - i, 4))
+                  for i in range(3)]
+        tx_outs = [self.tx_out_0, self.tx_out_1, self.tx_out_0]
+        return tx.Tx(self.version, flag, tx_ins, tx_outs,
+                     witnesses, self.lock_time)
+
+    def _check_batch(self, t, prevout_values=None):
+        scripts = [helpers.P2PKH1['ser']['ins'][0]['pk_script'],
+                   helpers.P2WPKH['ser']['ins'][0]['pk_script'],
+                   helpers.P2PKH1['ser']['ins'][0]['pk_script']]
+        values = prevout_values or [None] * 3
+        for anyone_can_pay in [False, True]:
+            self.assertEqual(
+                t.sighash_all_batch(scripts, prevout_values, anyone_can_pay),
+                [t.sighash_all(i, scripts[i], values[i], anyone_can_pay)
+                 for i in range(3)])
+            self.assertEqual(
+                t.sighash_single_batch(
+                    scripts, prevout_values, anyone_can_pay),
+                [t.sighash_single(i, scripts[i], values[i], anyone_can_pay)
+                 for i in range(3)])
+
+    def test_sighash_batch_legacy(self):
+        self._check_batch(self._batch_tx())
+
+    def test_sighash_batch_witness(self):
+        values = [helpers.P2WPKH['ser']['ins'][0]['value']] * 3
+        self._check_batch(self._batch_tx(flag=self.segwit_flag), values)
+
+    def test_sighash_batch_forkid(self):
+        riemann.select_network('bitcoin_cash_main')
+        values = [helpers.P2PKH1['ser']['ins'][0]['value']] * 3
+        self._check_batch(self._batch_tx(), values)
+
+    def test_legacy_sighash_multi_input(self):
+        # Reference implementation built from modified Tx copies
+        t = self._batch_tx()
+        script = helpers.P2PKH1['ser']['ins'][0]['pk_script']
+        index = 1
+
+        def reference(tx_ins, tx_outs, sighash_type):
+            copy_tx = t.copy(tx_ins=tx_ins, tx_outs=tx_outs)
+            return utils.hash256(
+                copy_tx.to_bytes() + utils.i2le_padded(sighash_type, 4))
+
+        blank_ins = [i.copy(stack_script=b'', redeem_script=b'')
+                     for i in t.tx_ins]
+        blank_ins[index] = blank_ins[index].copy(redeem_script=script[1:])
+        single_ins = [i.copy(sequence=b'\x00' * 4) for i in blank_ins]
+        single_ins[index] = blank_ins[index]
+        single_outs = [tx.TxOut(b'\xff' * 8, b'') for _ in t.tx_ins]
+        single_outs[index] = t.tx_outs[index]
+
+        self.assertEqual(
+            t.sighash_all(index, script),
+            reference(blank_ins, t.tx_outs, 0x01))
+        self.assertEqual(
+            t.sighash_all(index, script, anyone_can_pay=True),
+            reference(blank_ins[index:index + 1], t.tx_outs, 0x81))
+        self.assertEqual(
+            t.sighash_single(index, script),
+            reference(single_ins, single_outs, 0x03))
+        self.assertEqual(
+            t.sighash_single(index, script, anyone_can_pay=True),
+            reference(single_ins[index:index + 1], single_outs, 0x83))
+
+    def test_sighash_batch_errors(self):
+        script = helpers.P2PKH1['ser']['ins'][0]['pk_script']
+        t = self._batch_tx()
+        with self.assertRaises(ValueError) as context:
+            t.sighash_all_batch([script])
+        self.assertIn(
+            'Expected one script per input. Got 3 inputs and 1 scripts.',
+            str(context.exception))
+
+        t = self._batch_tx(flag=self.segwit_flag)
+        with self.assertRaises(ValueError) as context:
+            t.sighash_all_batch([script] * 3)
+        self.assertIn(
+            'Expected one prevout value per input.',
+            str(context.exception))
+
+        t = tx.Tx(self.version, None, self.tx_ins * 3, self.tx_outs,
+                  None, self.lock_time)
+        with self.assertRaises(NotImplementedError) as context:
+            t.sighash_single_batch([script] * 3)
+        self.assertIn(
+            'I refuse to implement the SIGHASH_SINGLE bug.',
+            str(context.exception))
+
     def test_sighash_forkid_single(self):
         riemann.select_network('bitcoin_cash_main')
         t = tx.Tx(self.version, self.none_flag, self.tx_ins, self.tx_outs,
@@ -1,7 +1,10 @@
 import unittest
 import riemann
 from unittest import mock
+from riemann import networks
 from riemann.tests import helpers
+from riemann.tests.tx.helpers import decred_helpers
+from riemann.tx import tx
 from riemann.tx import tx_builder as tb
 
 
@@ -160,12 +163,95 @@ class TestTxBuilder(unittest.TestCase):
 
         self.assertEqual(tx_in, helpers.P2PKH1['ser']['tx']['in'])
 
+    def test_explicit_network(self):
+        # the current network is bitcoin_main
+        dcr = networks.get_network('decred_main')
+        ser = decred_helpers.DCR['ser']
+        witness = ser['witnesses'][0]
+
+        outpoint = tb.make_outpoint(
+            ser['ins'][0]['hash'], 0, 0, network=dcr)
+        self.assertEqual(outpoint, ser['ins'][0]['outpoint'])
+
+        tx_in = tb.make_witness_input(outpoint, 0xFFFFFFFF, network=dcr)
+        self.assertEqual(tx_in, ser['tx']['in_unsigned'])
+
+        tx_out = tb._make_output(
+            value=ser['outs'][0]['value'],
+            output_script=ser['outs'][0]['pk_script'],
+            version=ser['outs'][0]['version'],
+            network=dcr)
+        self.assertEqual(tx_out, ser['outs'][0]['output'])
+
+        tx_witness = tb.make_decred_witness(
+            value=witness['value'],
+            height=witness['height'],
+            index=witness['index'],
+            stack_script=witness['stack_script'],
+            redeem_script=witness['redeem_script'],
+            network=dcr)
+        self.assertEqual(
+            tb.make_tx(
+                version=1,
+                tx_ins=[tx_in],
+                tx_outs=[tx_out],
+                lock_time=decred_helpers.DCR['human']['locktime'],
+                expiry=0,
+                tx_witnesses=tx_witness,
+                network=dcr),
+            ser['tx']['p2sh_2_p2pkh'])
+        self.assertEqual(riemann.get_current_network_name(), 'bitcoin_main')
+
+        bch = networks.get_network('bitcoin_cash_main')
+        with self.assertRaises(ValueError) as context:
+            tb.make_p2wpkh_output_script(
+                helpers.P2WPKH_ADDR['pubkey'], network=bch)
+        self.assertIn('bitcoin_cash_main', str(context.exception))
+
     def test_make_legacy_input_and_empty_witness(self):
         pass
 
     def test_make_witness_input_and_witness(self):
         pass
 
+    def test_tx_size_estimator(self):
+        # a P2WPKH input and a P2SH output
+        t = tx.Tx.from_bytes(helpers.P2WPKH['ser']['tx']['signed'])
+        estimator = tb.TxSizeEstimator()
+        estimator.add_output(t.tx_outs[0].output_script)
+        estimator.add_input_size(41, len(t.tx_witnesses[0]))
+        self.assertEqual(estimator.weight, t.weight)
+        self.assertEqual(estimator.vsize, t.vsize)
+
+        # the estimate matches, as this input's signature is 72 bytes
+        copy = estimator.copy()
+        copy.remove_input_size(41, len(t.tx_witnesses[0]))
+        copy.add_input('p2wpkh')
+        self.assertEqual(copy.weight, t.weight)
+        copy.add_input('p2sh_p2wpkh')
+        self.assertEqual(copy.weight, t.weight + (41 + 23) * 4 + 108)
+        self.assertEqual(estimator.num_inputs, 1)
+
+        # a legacy input adds an empty witness, until the last witness
+        # input is removed
+        estimator.add_input('p2pkh')
+        self.assertEqual(estimator.num_inputs, 2)
+        self.assertEqual(estimator.weight, t.weight + 148 * 4 + 1)
+        estimator.remove_input_size(41, len(t.tx_witnesses[0]))
+        self.assertEqual(estimator.num_witness_inputs, 0)
+        self.assertEqual(
+            estimator.weight, (4 + 1 + 148 + 1 + 32 + 4) * 4)
+
+        estimator.remove_input('p2pkh')
+        estimator.remove_output(t.tx_outs[0].output_script)
+        self.assertEqual(estimator.weight, tb.TxSizeEstimator().weight)
+
+        # the input and output counts grow past 1 byte VarInts
+        estimator = tb.TxSizeEstimator()
+        for _ in range(253):
+            estimator.add_output_size(22)
+        self.assertEqual(estimator.vsize, 4 + 1 + 3 + 253 * 31 + 4)
+
     def test_length_prepend(self):
         self.assertEqual(
             tb.length_prepend(b'\x00'),
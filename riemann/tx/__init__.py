@@ -1,6 +1,7 @@
 # flake8: noqa
 from riemann.tx.tx import *
 from riemann.tx.shared import *
+from riemann.tx.block import *
 from riemann.tx.decred import *
 from riemann.tx.sprout import *
 from riemann.tx.sapling import *
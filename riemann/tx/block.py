@@ -0,0 +1,310 @@
+from riemann import utils
+from riemann.tx.tx import Tx
+from riemann.tx.shared import ByteData, TruncatedDataError, VarInt
+
+from typing import Any, Callable, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+# Read files in 1 MiB chunks. Large txs grow the read size as needed.
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+class BlockHeader(ByteData):
+    '''
+    An 80-byte bitcoin-style block header.
+
+    NB: Args must be little-endian
+
+    Args:
+        version: the 4-byte LE block version
+        prev_block: the 32-byte LE hash of the previous block header
+        merkle_root: the 32-byte LE merkle root of the block's tx_ids
+        timestamp: the 4-byte LE unix timestamp of the block
+        target: the 4-byte LE compact-encoded difficulty target (nBits)
+        nonce: the 4-byte LE nonce
+
+    Attributes:
+        version: the 4-byte LE block version
+        prev_block: the 32-byte LE hash of the previous block header
+        merkle_root: the 32-byte LE merkle root of the block's tx_ids
+        timestamp: the 4-byte LE unix timestamp of the block
+        target: the 4-byte LE compact-encoded difficulty target (nBits)
+        nonce: the 4-byte LE nonce
+        block_hash_le: the LE (in-protocol) hash of the header
+        block_hash: the BE (block explorer or human-facing) hash of the header
+    '''
+
+    __slots__ = ('_block_hash_le',)
+
+    def __init__(self,
+                 version: bytes,
+                 prev_block: bytes,
+                 merkle_root: bytes,
+                 timestamp: bytes,
+                 target: bytes,
+                 nonce: bytes):
+        self.validate_bytes(version, 4)
+        self.validate_bytes(prev_block, 32)
+        self.validate_bytes(merkle_root, 32)
+        self.validate_bytes(timestamp, 4)
+        self.validate_bytes(target, 4)
+        self.validate_bytes(nonce, 4)
+
+        self._freeze(
+            version, prev_block, merkle_root, timestamp, target, nonce,
+            _block_hash_le=None)
+
+    @property
+    def version(self) -> bytes:
+        return self._bytes[:4]
+
+    @property
+    def prev_block(self) -> bytes:
+        return self._bytes[4:36]
+
+    @property
+    def merkle_root(self) -> bytes:
+        return self._bytes[36:68]
+
+    @property
+    def timestamp(self) -> bytes:
+        return self._bytes[68:72]
+
+    @property
+    def target(self) -> bytes:
+        return self._bytes[72:76]
+
+    @property
+    def nonce(self) -> bytes:
+        return self._bytes[76:80]
+
+    @property
+    def block_hash_le(self) -> bytes:
+        '''
+        The LE (in-protocol) hash of the header. Computed on first access
+        '''
+        if self._block_hash_le is None:
+            # The header is immutable, so the hash is never stale
+            object.__setattr__(
+                self, '_block_hash_le', utils.hash256(self._bytes))
+        return self._block_hash_le
+
+    @property
+    def block_hash(self) -> bytes:
+        '''
+        The BE (block explorer or human-facing) hash of the header
+        '''
+        return utils.change_endianness(self.block_hash_le)
+
+    def copy(self,
+             version: Optional[bytes] = None,
+             prev_block: Optional[bytes] = None,
+             merkle_root: Optional[bytes] = None,
+             timestamp: Optional[bytes] = None,
+             target: Optional[bytes] = None,
+             nonce: Optional[bytes] = None) -> 'BlockHeader':
+        '''
+        Make a new copy of the object with optional modifications.
+        '''
+        return BlockHeader(
+            version=version if version is not None else self.version,
+            prev_block=(prev_block if prev_block is not None
+                        else self.prev_block),
+            merkle_root=(merkle_root if merkle_root is not None
+                         else self.merkle_root),
+            timestamp=timestamp if timestamp is not None else self.timestamp,
+            target=target if target is not None else self.target,
+            nonce=nonce if nonce is not None else self.nonce)
+
+    @classmethod
+    def from_bytes(BlockHeader, byte_string: bytes) -> 'BlockHeader':
+        '''
+        Parse a BlockHeader from a bytestring. Also available as from_hex
+        '''
+        return BlockHeader.from_view(memoryview(byte_string))[0]
+
+    @classmethod
+    def from_view(BlockHeader,
+                  view: memoryview,
+                  offset: int = 0) -> Tuple['BlockHeader', int]:
+        '''
+        Parse a BlockHeader starting at offset in a memoryview. Returns the
+        BlockHeader and the offset of the first byte after it.
+        '''
+        header = BlockHeader(
+            version=bytes(view[offset:offset + 4]),
+            prev_block=bytes(view[offset + 4:offset + 36]),
+            merkle_root=bytes(view[offset + 36:offset + 68]),
+            timestamp=bytes(view[offset + 68:offset + 72]),
+            target=bytes(view[offset + 72:offset + 76]),
+            nonce=bytes(view[offset + 76:offset + 80]))
+        return header, offset + 80
+
+
+class _ByteStream():
+    '''
+    A read cursor over either a buffer (bytes, bytearray, memoryview, mmap) or
+    a binary file object.
+
+    Buffers are parsed in place through a single memoryview. Files are read in
+    chunks, and only the unconsumed tail of the most recent chunks is held in
+    memory.
+    '''
+
+    def __init__(self, data: Any, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._file = None
+        self._chunk_size = chunk_size
+        self._position = 0  # absolute offset of self._buffer[0]
+        self._offset = 0    # cursor within self._buffer
+        try:
+            self._buffer = memoryview(data)
+            self._eof = True
+        except TypeError:
+            if not callable(getattr(data, 'read', None)):
+                raise TypeError('Expected a bytes-like or binary file object. '
+                                'Got: {}'.format(type(data)))
+            self._file = data
+            self._buffer = memoryview(b'')
+            self._eof = False
+
+    def tell(self) -> int:
+        '''Returns the absolute position of the cursor'''
+        return self._position + self._offset
+
+    def _fill(self) -> None:
+        '''
+        Drops the consumed part of the buffer and reads another chunk. The
+        read size is at least the size of the data already buffered, so a
+        single large item needs only logarithmically many re-parses.
+        '''
+        remaining = bytes(self._buffer[self._offset:])
+        chunk = self._file.read(max(self._chunk_size, len(remaining)))
+        if not chunk:
+            self._eof = True
+        self._position += self._offset
+        self._offset = 0
+        self._buffer = memoryview(remaining + chunk)
+
+    def at_end(self) -> bool:
+        '''Returns True if there is no more data to read'''
+        while self._offset >= len(self._buffer) and not self._eof:
+            self._fill()
+        return self._offset >= len(self._buffer)
+
+    def parse(self, parser: Callable[[memoryview, int], Tuple[T, int]]) -> T:
+        '''
+        Parses one item at the cursor using a from_view style parser, and
+        advances the cursor past it. The parser must raise IndexError, e.g.
+        TruncatedDataError, when it runs out of data. That is retried with
+        more data. Other errors are raised immediately.
+        '''
+        while True:
+            try:
+                item, end = parser(self._buffer, self._offset)
+            except IndexError:
+                if self._eof:
+                    raise TruncatedDataError(
+                        'Unexpected end of data at position {}.'
+                        .format(self.tell()))
+                end = -1
+            # With a file, an item ending exactly at the end of the buffer
+            # might continue in the next chunk, so only accept it at EOF
+            if end != -1 and (end < len(self._buffer)
+                              or (end == len(self._buffer) and self._eof)):
+                self._offset = end
+                return item
+            if self._eof:
+                raise TruncatedDataError(
+                    'Unexpected end of data at position {}.'
+                    .format(self.tell()))
+            self._fill()
+
+    def read(self, length: int) -> bytes:
+        '''Reads length bytes from the cursor'''
+        return self.parse(
+            lambda view, offset: (bytes(view[offset:offset + length]),
+                                  offset + length))
+
+    def skip_to(self, position: int) -> None:
+        '''Advances the cursor to an absolute position'''
+        while position - self._position > len(self._buffer) and not self._eof:
+            self._offset = len(self._buffer)
+            self._fill()
+        if position - self._position > len(self._buffer):
+            raise TruncatedDataError(
+                'Unexpected end of data at position {}.'
+                .format(len(self._buffer) + self._position))
+        self._offset = max(self._offset, position - self._position)
+
+
+def _iter_txs(stream: _ByteStream, count: Optional[int]) -> Iterator[Tx]:
+    parsed = 0
+    while count is None or parsed < count:
+        if count is None and stream.at_end():
+            return
+        yield stream.parse(Tx.from_view)
+        parsed += 1
+
+
+def iter_txs(data: Any,
+             chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tx]:
+    '''
+    Lazily parses a stream of concatenated serialized transactions
+
+    Args:
+        data: bytes, bytearray, memoryview, mmap, or a binary file object
+        chunk_size: how many bytes to read at a time from a file object
+    Returns:
+        a generator yielding one Tx at a time
+    '''
+    return _iter_txs(_ByteStream(data, chunk_size), None)
+
+
+def parse_block(data: Any,
+                chunk_size: int = DEFAULT_CHUNK_SIZE
+                ) -> Tuple[BlockHeader, int, Iterator[Tx]]:
+    '''
+    Parses a serialized block. The header and tx count are read immediately.
+    The transactions are parsed lazily as the returned iterator is consumed.
+
+    Args:
+        data: bytes, bytearray, memoryview, mmap, or a binary file object
+        chunk_size: how many bytes to read at a time from a file object
+    Returns:
+        the block header, the number of txs, and a generator yielding the txs
+    '''
+    stream = _ByteStream(data, chunk_size)
+    header = BlockHeader.from_bytes(stream.read(80))
+    tx_count = stream.parse(VarInt.read)
+    return header, tx_count, _iter_txs(stream, tx_count)
+
+
+def iter_blocks(data: Any,
+                chunk_size: int = DEFAULT_CHUNK_SIZE
+                ) -> Iterator[Tuple[BlockHeader, int, Iterator[Tx]]]:
+    '''
+    Lazily parses a bitcoind blk*.dat file. Each record is a 4-byte network
+    magic, a 4-byte LE block length, and the serialized block. Iteration stops
+    at the end of the data, or at the zero padding bitcoind preallocates.
+
+    Txs not consumed from a block's iterator are skipped when the next block
+    is requested. A block's iterator must not be used after that.
+
+    Args:
+        data: bytes, bytearray, memoryview, mmap, or a binary file object
+        chunk_size: how many bytes to read at a time from a file object
+    Returns:
+        a generator yielding (header, tx count, tx generator) per block
+    '''
+    stream = _ByteStream(data, chunk_size)
+    while not stream.at_end():
+        magic = stream.read(4)
+        if magic == b'\x00' * 4:
+            return
+        block_length = utils.le2i(stream.read(4))
+        block_end = stream.tell() + block_length
+        header = BlockHeader.from_bytes(stream.read(80))
+        tx_count = stream.parse(VarInt.read)
+        yield header, tx_count, _iter_txs(stream, tx_count)
+        stream.skip_to(block_end)
@@ -0,0 +1,427 @@
+import random
+from riemann import networks, utils
+from riemann.networks import standard
+from riemann.tx import tx, tx_builder
+
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, \
+    Tuple, Type
+
+# The most branches searched by branch and bound, as in Bitcoin Core
+BNB_TOTAL_TRIES = 100000
+
+# The most random subsets tried by the knapsack solver, as in Bitcoin Core
+KNAPSACK_ITERATIONS = 1000
+
+# Bounds the UTXOs visited by each knapsack subset search. Large wallets
+# get fewer iterations, so that the search stays fast
+KNAPSACK_WORK = 200000
+
+# Selection works in 1/4000 satoshi, so that the fee for any weight at a
+# feerate in satoshi per 1000 vbytes is a whole number
+_SCALE = 4000
+
+
+class Utxo(NamedTuple):
+    '''
+    An output the wallet can spend.
+
+    Attributes:
+        outpoint: the outpoint of the output
+        value: the value of the output, in satoshi
+        input_type: the kind of input that spends it. A key of
+                    tx_builder.INPUT_SIZES
+    '''
+    outpoint: tx.Outpoint
+    value: int
+    input_type: str = 'p2wpkh'
+
+
+class Selection(NamedTuple):
+    '''
+    The result of coin selection.
+
+    Attributes:
+        inputs: the UTXOs to spend
+        change: the value of the change output. 0 if the tx has none
+        fee: the fee the tx pays, in satoshi
+        strategy: the name of the strategy that found the inputs
+    '''
+    inputs: List[Utxo]
+    change: int
+    fee: int
+    strategy: str
+
+
+def select_coins(
+        utxos: Sequence[Utxo],
+        outputs: Sequence[tx.TxOut],
+        feerate: float,
+        change_script: bytes,
+        strategy: Optional[str] = None,
+        min_change: Optional[int] = None,
+        rng: Optional[random.Random] = None,
+        network: Optional[Type[networks.Network]] = None) -> Selection:
+    '''
+    Choose UTXOs that pay for the outputs and the fee, and the change to
+    return. Each UTXO is weighed by its value less the fee to spend it, so
+    UTXOs that cost more to spend than they are worth are never chosen.
+    The tx never exceeds the network's largest standard weight.
+
+    Example:
+        selection = select_coins(utxos, [output], 10, change_script)
+        outpoints = [u.outpoint for u in selection.inputs]
+
+    Args:
+        utxos:         The wallet's spendable outputs
+        outputs:       The outputs the tx must pay, without change
+        feerate:       The feerate, in satoshi per vbyte. Precision beyond
+                       satoshi per 1000 vbytes is rounded off
+        change_script: The output script of the change output
+        strategy:      A key of STRATEGIES. Default 'bnb' if it finds a tx
+                       without change, then 'knapsack', then
+                       'largest_first'
+        min_change:    The smallest change output to make. Smaller change
+                       is added to the fee. Default the dust threshold of
+                       the change output
+        rng:           The random source of the knapsack solver
+        network:       The network whose relay policy to use. Default the
+                       current network
+    Returns:
+        The selection
+    Raises:
+        ValueError: if the UTXOs can't pay for the outputs, if the input
+                    type of a UTXO is unknown, or if the strategy finds no
+                    solution within the weight limit
+    '''
+    if strategy is not None and strategy not in STRATEGIES:
+        raise ValueError('Unknown strategy: {}'.format(strategy))
+    policy = standard.get_policy(network)
+    if min_change is None:
+        change_output = tx.TxOut(utils.i2le_padded(0, 8), change_script)
+        min_change = standard.get_dust_threshold(change_output, policy)
+    rate = round(feerate * 1000)
+
+    estimator = tx_builder.TxSizeEstimator()
+    for o in outputs:
+        estimator.add_output(o.output_script)
+    target = sum(utils.le2i(o.value) for o in outputs) * _SCALE
+
+    # The weights assume a witness tx, so that witness inputs can be added
+    # without changing the others'
+    input_weights = {
+        input_type: size * tx.WITNESS_SCALE_FACTOR + (witness or 1)
+        for input_type, (size, witness) in tx_builder.INPUT_SIZES.items()}
+    try:
+        weights = [input_weights[u.input_type] for u in utxos]
+    except KeyError as e:
+        raise ValueError('Unknown input type: {}'.format(e.args[0]))
+    effective = [u.value * _SCALE - weight * rate
+                 for u, weight in zip(utxos, weights)]
+
+    # The tx without inputs, with a marker and flag. Rounding the final fee
+    # up adds at most 3 weight units and 1 satoshi
+    base_weight = estimator.weight + 2
+    target += (base_weight + 3) * rate + _SCALE
+    with_change = estimator.copy()
+    with_change.add_output(change_script)
+    change_weight = with_change.weight - estimator.weight
+    cost_of_change = change_weight * rate + min_change * _SCALE
+    # The weight left for inputs, with room for change and for the input
+    # count VarInt to grow by 2 bytes
+    max_weight = (policy.max_tx_weight - base_weight - change_weight
+                  - 2 * tx.WITNESS_SCALE_FACTOR)
+
+    # The UTXOs worth spending, most valuable first
+    order = sorted(range(len(utxos)), key=effective.__getitem__, reverse=True)
+    values = [effective[i] for i in order]
+    while values and values[-1] <= 0:
+        values.pop()
+    weights = [weights[i] for i in order[:len(values)]]
+    if sum(values) < target:
+        raise ValueError('Insufficient funds')
+
+    rng = rng or random.Random()
+    names = [strategy] if strategy else ['bnb', 'knapsack', 'largest_first']
+    for name in names:
+        select = STRATEGIES[name]
+        chosen = select(
+            values, weights, target, cost_of_change, max_weight, rng)
+        if chosen is not None and len(chosen) >= 0xfd:
+            # The input count VarInt is 2 bytes longer
+            chosen = select(
+                values, weights, target + 2 * tx.WITNESS_SCALE_FACTOR * rate,
+                cost_of_change, max_weight, rng)
+        if chosen is not None:
+            break
+    else:
+        raise ValueError('No solution found by {} within a weight of {}'
+                         .format(' or '.join(names), policy.max_tx_weight))
+
+    inputs = [utxos[order[i]] for i in chosen]
+    return _make_selection(
+        inputs, outputs, estimator, rate, change_script, min_change, name)
+
+
+def select_largest_first(
+        values: Sequence[int],
+        weights: Sequence[int],
+        target: int,
+        cost_of_change: int = 0,
+        max_weight: Optional[int] = None,
+        rng: Optional[random.Random] = None) -> Optional[List[int]]:
+    '''
+    Chooses the most valuable UTXOs until they reach the target
+
+    Args:
+        values:         The effective values of the UTXOs, largest first
+        weights:        The weights of the UTXOs' inputs
+        target:         The value to reach
+        cost_of_change: Unused. For a uniform signature
+        max_weight:     The largest total weight. Default unlimited
+        rng:            Unused. For a uniform signature
+    Returns:
+        The indices of the chosen values. None if they can't reach target
+        within max_weight
+    '''
+    total = 0
+    weight = 0
+    for i, value in enumerate(values):
+        total += value
+        weight += weights[i]
+        if max_weight is not None and weight > max_weight:
+            return None
+        if total >= target:
+            return list(range(i + 1))
+    return None
+
+
+def select_bnb(
+        values: Sequence[int],
+        weights: Sequence[int],
+        target: int,
+        cost_of_change: int,
+        max_weight: Optional[int] = None,
+        rng: Optional[random.Random] = None) -> Optional[List[int]]:
+    '''
+    Analog of Bitcoin Core's SelectCoinsBnB. A depth-first search for the
+    values closest to the target, exceeding it by at most cost_of_change,
+    so that the tx needs no change output.
+
+    Args:
+        values:         The effective values of the UTXOs, largest first
+        weights:        The weights of the UTXOs' inputs
+        target:         The value to reach
+        cost_of_change: The most the values may exceed the target by
+        max_weight:     The largest total weight. Default unlimited
+        rng:            Unused. For a uniform signature
+    Returns:
+        The indices of the chosen values. None if no solution was found
+    '''
+    available = sum(values)
+    if available < target:
+        return None
+    if max_weight is None:
+        max_weight = sum(weights)
+
+    selection: List[int] = []
+    best: Optional[List[int]] = None
+    best_waste = cost_of_change
+    total = 0
+    weight = 0
+    i = 0
+    for _ in range(BNB_TOTAL_TRIES):
+        if (total + available < target or total > target + cost_of_change
+                or weight > max_weight):
+            backtrack = True
+        elif total >= target:
+            if total - target <= best_waste:
+                best = list(selection)
+                best_waste = total - target
+                if best_waste == 0:
+                    break
+            backtrack = True
+        else:
+            backtrack = False
+
+        if backtrack:
+            if not selection:
+                break
+            # Return the values skipped since the last included one, and
+            # try the branch that omits it
+            i -= 1
+            while i > selection[-1]:
+                available += values[i]
+                i -= 1
+            total -= values[i]
+            weight -= weights[i]
+            selection.pop()
+        else:
+            value = values[i]
+            available -= value
+            # Omitting a value equal to the last omitted one leads to
+            # branches already searched
+            if (not selection or i - 1 == selection[-1]
+                    or value != values[i - 1]):
+                selection.append(i)
+                total += value
+                weight += weights[i]
+        i += 1
+    return best
+
+
+def select_knapsack(
+        values: Sequence[int],
+        weights: Sequence[int],
+        target: int,
+        cost_of_change: int,
+        max_weight: Optional[int] = None,
+        rng: Optional[random.Random] = None) -> Optional[List[int]]:
+    '''
+    Analog of Bitcoin Core's KnapsackSolver. Looks for values that exactly
+    reach the target, or else exceed it by at least cost_of_change, by
+    trying random subsets of the values smaller than that. Falls back on
+    the smallest single value that is large enough.
+
+    Args:
+        values:         The effective values of the UTXOs, largest first
+        weights:        The weights of the UTXOs' inputs
+        target:         The value to reach
+        cost_of_change: The smallest change worth making
+        max_weight:     The largest total weight. Default unlimited
+        rng:            The random source. Default a new random.Random
+    Returns:
+        The indices of the chosen values. None if they can't reach target,
+        or if the subset found is heavier than max_weight
+    '''
+    chosen = _knapsack(values, target, cost_of_change, rng or random.Random())
+    if (chosen is not None and max_weight is not None
+            and sum(weights[i] for i in chosen) > max_weight):
+        return None
+    return chosen
+
+
+STRATEGIES: Dict[str, Callable[..., Optional[List[int]]]] = {
+    'bnb': select_bnb,
+    'knapsack': select_knapsack,
+    'largest_first': select_largest_first,
+}
+
+
+def _knapsack(
+        values: Sequence[int],
+        target: int,
+        cost_of_change: int,
+        rng: random.Random) -> Optional[List[int]]:
+    '''
+    The knapsack search, without regard to weight
+    '''
+    applicable: List[int] = []
+    total_lower = 0
+    lowest_larger = None
+    for i, value in enumerate(values):
+        if value == target:
+            return [i]
+        if value < target + cost_of_change:
+            applicable.append(i)
+            total_lower += value
+        else:
+            # Values are largest first, so the last is the smallest
+            lowest_larger = i
+
+    if total_lower == target:
+        return applicable
+    if total_lower < target:
+        return None if lowest_larger is None else [lowest_larger]
+
+    lower = [values[i] for i in applicable]
+    best, best_total = _approximate_best_subset(
+        lower, total_lower, target, rng)
+    if best_total != target and total_lower >= target + cost_of_change:
+        best, best_total = _approximate_best_subset(
+            lower, total_lower, target + cost_of_change, rng)
+
+    if lowest_larger is not None and (
+            (best_total != target and best_total < target + cost_of_change)
+            or values[lowest_larger] <= best_total):
+        return [lowest_larger]
+    return sorted(applicable[i] for i in best)
+
+
+def _approximate_best_subset(
+        values: List[int],
+        total_lower: int,
+        target: int,
+        rng: random.Random) -> Tuple[List[int], int]:
+    '''
+    Analog of Bitcoin Core's ApproximateBestSubset. Returns the indices and
+    total of the smallest subset found that reaches the target
+    '''
+    count = len(values)
+    best = list(range(count))
+    best_total = total_lower
+    iterations = min(KNAPSACK_ITERATIONS, max(1, KNAPSACK_WORK // count))
+    for _ in range(iterations):
+        if best_total == target:
+            break
+        # Include a random half, then the rest, in order, skipping any value
+        # that reaches the target. The included values only grow, so a
+        # subset is recorded as a prefix of them and the value that reached
+        included = [False] * count
+        chosen: List[int] = []
+        total = 0
+        reached = False
+        found = None
+        picks = '{:0{}b}'.format(rng.getrandbits(count), count)
+        for first_pass in (True, False):
+            if reached:
+                break
+            for i in range(count):
+                if first_pass:
+                    if picks[i] != '1':
+                        continue
+                elif included[i]:
+                    continue
+                if total + values[i] >= target:
+                    reached = True
+                    if total + values[i] < best_total:
+                        best_total = total + values[i]
+                        found = (len(chosen), i)
+                else:
+                    total += values[i]
+                    included[i] = True
+                    chosen.append(i)
+        if found is not None:
+            best = chosen[:found[0]] + [found[1]]
+    return best, best_total
+
+
+def _make_selection(
+        inputs: List[Utxo],
+        outputs: Sequence[tx.TxOut],
+        estimator: tx_builder.TxSizeEstimator,
+        rate: int,
+        change_script: bytes,
+        min_change: int,
+        strategy: str) -> Selection:
+    '''
+    Finds the exact fee of the tx spending the inputs, and its change.
+    Branch and bound selections never get change
+    '''
+    for u in inputs:
+        estimator.add_input(u.input_type)
+    available = (sum(u.value for u in inputs)
+                 - sum(utils.le2i(o.value) for o in outputs))
+    if strategy == 'bnb':
+        return Selection(inputs, 0, available, strategy)
+
+    estimator.add_output(change_script)
+    change = available - _fee(estimator.weight, rate)
+    if change >= min_change:
+        return Selection(inputs, change, available - change, strategy)
+    return Selection(inputs, 0, available, strategy)
+
+
+def _fee(weight: int, rate: int) -> int:
+    '''The fee for weight at rate satoshi per 1000 vbytes, rounded up'''
+    vsize = -(-weight // tx.WITNESS_SCALE_FACTOR)
+    return -(-vsize * rate // 1000)
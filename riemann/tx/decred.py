@@ -263,8 +263,8 @@ class DecredTx(DecredByteData):
                 'Expect less than 100kB. Got: {} bytes'.format(len(self)))
 
         # TODO: check this
-        self.tx_id_le = self.prefix_hash()
-        self.tx_id = utils.change_endianness(self.tx_id_le)
+        # The prefix hash (tx_id) is computed on first access
+        self._prefix_hash: Optional[bytes] = None
 
         # Ignoring this for now, as it's only used for in-block merkle trees
         # self.tx_id_full_le = utils.blake256(self.tx_id_le
@@ -277,11 +277,20 @@ class DecredTx(DecredByteData):
     def from_bytes(DecredTx, byte_string: bytes) -> 'DecredTx':
         raise NotImplementedError('TODO')
 
+    @property
+    def tx_id_le(self) -> bytes:
+        return self.prefix_hash()
+
+    @property
+    def tx_id(self) -> bytes:
+        return utils.change_endianness(self.prefix_hash())
+
     def prefix_hash(self) -> bytes:
-        try:
-            return self.tx_id_le  # Prevent redundant hashing
-        except AttributeError:
-            return utils.blake256(self.prefix())
+        if self._prefix_hash is None:
+            # The tx is immutable, so the hash is never stale
+            object.__setattr__(
+                self, '_prefix_hash', utils.blake256(self.prefix()))
+        return self._prefix_hash
 
     def witness_hash(self) -> bytes:
         return utils.blake256(self.witness())
@@ -252,8 +252,6 @@ class SaplingTx(z.ZcashByteData):
     binding_sig: Optional[bytes]
     hsigs: Tuple[bytes, ...]
     primary_inputs: Tuple[bytes, ...]
-    tx_id_le: bytes
-    tx_id: bytes
 
     def __init__(self,
                  tx_ins: Sequence[TxIn],
@@ -405,8 +403,8 @@ class SaplingTx(z.ZcashByteData):
             self.hsigs = tuple()
             self.primary_inputs = tuple()
 
-        self.tx_id_le = utils.hash256(self.to_bytes())
-        self.tx_id = self.tx_id_le[::-1]
+        # The tx_id is computed on first access. See tx_id_le
+        self._tx_id_le: Optional[bytes] = None
 
         self._make_immutable()
 
@@ -415,6 +413,24 @@ class SaplingTx(z.ZcashByteData):
                 'Tx is too large. '
                 'Expect less than 100kB. Got: {} bytes'.format(len(self)))
 
+    @property
+    def tx_id_le(self) -> bytes:
+        '''
+        The LE (in-protocol) tx_id. Computed on first access
+        '''
+        if self._tx_id_le is None:
+            # The tx is immutable, so the hash is never stale
+            object.__setattr__(
+                self, '_tx_id_le', utils.hash256(self.to_bytes()))
+        return self._tx_id_le
+
+    @property
+    def tx_id(self) -> bytes:
+        '''
+        The BE (block explorer or human-facing) tx_id
+        '''
+        return utils.change_endianness(self.tx_id_le)
+
     def calculate_fee(self, input_values: Sequence[int]) -> int:
         '''
         SaplingTx, list(int) -> int
@@ -1,7 +1,7 @@
 import riemann
 from riemann import utils
 
-from typing import Any, Optional, Union
+from typing import Any, Optional, Tuple, Union
 Byteslike = Union[bytes, bytearray, 'ByteData']
 
 SIGHASH_ALL = 0x01
@@ -11,6 +11,25 @@ SIGHASH_FORKID = 0x40
 SIGHASH_ANYONECANPAY = 0x80
 
 
+class TruncatedDataError(IndexError, ValueError):
+    '''
+    Raised when parsing runs past the end of the data. Also a ValueError,
+    as truncated data was reported that way before.
+    '''
+
+
+def read_bytes(view: memoryview, start: int, end: int) -> bytes:
+    '''
+    Copies view[start:end]. Raises TruncatedDataError if the view ends before
+    end, instead of returning fewer bytes.
+    '''
+    if end > len(view):
+        raise TruncatedDataError(
+            'Expected {} bytes at offset {}. Got {}.'
+            .format(end - start, start, max(len(view) - start, 0)))
+    return bytes(view[start:end])
+
+
 class ByteData():
     '''
     Wrapper class for byte-like data
@@ -21,7 +40,7 @@ class ByteData():
     Should be mostly transparent to the user
     Can be treated like bytes or a bytearray in most cases
     '''
-    __immutable = False
+    __slots__ = ('_bytes',)
 
     def __init__(self):
         self._bytes = bytearray()
@@ -76,7 +95,8 @@ class ByteData():
         return len(self._bytes)
 
     def __setattr__(self, key: str, value):
-        if self.__immutable:
+        # Immutable once _bytes has been frozen to a bytes object
+        if type(getattr(self, '_bytes', None)) is bytes:
             raise TypeError("%r cannot be written to." % self)
         object.__setattr__(self, key, value)
 
@@ -114,7 +134,30 @@ class ByteData():
         Prevents any future changes to the object
         '''
         self._bytes = bytes(self._bytes)
-        self.__immutable = True
+
+    def _freeze(self, *parts: Byteslike, **attributes: Any) -> None:
+        '''
+        Sets the object's attributes, then sets its bytes to the concatenation
+        of parts, making it immutable. This bypasses __setattr__ and __iadd__,
+        so it may be called instead of ByteData.__init__, repeated += and
+        _make_immutable. Callers are responsible for validation.
+        '''
+        for key, value in attributes.items():
+            object.__setattr__(self, key, value)
+        object.__setattr__(self, '_bytes', b''.join(
+            [p._bytes if isinstance(p, ByteData) else p for p in parts]))
+
+    @classmethod
+    def _from_parts(C, *parts: Byteslike, **attributes: Any):
+        '''
+        Makes an immutable instance from its serialized parts without calling
+        __init__. Nothing is validated, so this is only for callers that
+        already know the parts are well-formed, e.g. slices of another
+        instance.
+        '''
+        obj = C.__new__(C)
+        obj._freeze(*parts, **attributes)
+        return obj
 
     def find(self, substring: Byteslike) -> int:
         '''
@@ -163,35 +206,36 @@ class VarInt(ByteData):
     '''
     NB: number must be integer
     '''
+    __slots__ = ('number',)
+
     def __init__(self, number: int, length: Optional[int] = None):
-        super().__init__()
+        encoded = VarInt.encode(number)
+        if length in (3, 5, 9) and length > len(encoded):
+            # Non-compact encoding, e.g. parsed from a non-compact VarInt
+            prefix = {3: b'\xfd', 5: b'\xfe', 9: b'\xff'}[length]
+            encoded = prefix + utils.i2le_padded(number, length - 1)
+        self._freeze(encoded, number=number)
+
+    @staticmethod
+    def encode(number: int) -> bytes:
+        '''
+        int -> bytes
+        Serializes a number as a compact VarInt, without making a VarInt
+        '''
         if number < 0x0:
             raise ValueError('VarInt cannot be less than 0. '
                              'Got: {}'.format(number))
-        if number > 0xffffffffffffffff:
-            raise ValueError('VarInt cannot be greater than (2 ** 64) - 1. '
-                             'Got: {}'
-                             .format(number))
         if number <= 0xfc:
-            pass  # No prefix
-        elif number <= 0xffff or length == 3:
-            self += bytes([0xfd])
-            length = 3
-        elif number <= 0xffffffff or length == 5:
-            self += bytes([0xfe])
-            length = 5
-        elif number <= 0xffffffffffffffff or length == 9:
-            self += bytes([0xff])
-            length = 9
-        self += utils.i2le(number)
-
-        if length is not None:
-            while len(self) < length:
-                self += b'\x00'
-
-        self.number = number
-
-        self._make_immutable()
+            return bytes((number,))  # No prefix
+        if number <= 0xffff:
+            return b'\xfd' + number.to_bytes(2, 'little')
+        if number <= 0xffffffff:
+            return b'\xfe' + number.to_bytes(4, 'little')
+        if number <= 0xffffffffffffffff:
+            return b'\xff' + number.to_bytes(8, 'little')
+        raise ValueError('VarInt cannot be greater than (2 ** 64) - 1. '
+                         'Got: {}'
+                         .format(number))
 
     def copy(self) -> 'VarInt':
         return VarInt(self.number)
@@ -202,31 +246,40 @@ class VarInt(ByteData):
         byte-like -> VarInt
         accepts arbitrary length input, gets a VarInt off the front
         '''
-        num = byte_string
-        if num[0] <= 0xfc:
-            num = num[0:1]
-            non_compact = False
-        elif num[0] == 0xfd:
-            num = num[1:3]
-            non_compact = (num[-1:] == b'\x00')
-        elif num[0] == 0xfe:
-            num = num[1:5]
-            non_compact = (num[-2:] == b'\x00\x00')
-        elif num[0] == 0xff:
-            num = num[1:9]
-            non_compact = (num[-4:] == b'\x00\x00\x00\x00')
-        if len(num) not in [1, 2, 4, 8]:
-            raise ValueError('Malformed VarInt. Got: {}'
-                             .format(byte_string.hex()))
-
-        if (non_compact
-            and ('overwinter' in riemann.get_current_network_name()
-                 or 'sapling' in riemann.get_current_network_name())):
-            raise ValueError('VarInt must be compact. Got: {}'
-                             .format(byte_string.hex()))
+        number, end = VarInt.read(memoryview(byte_string))
+        return VarInt(number, length=end)
+
+    @staticmethod
+    def read(view: memoryview, offset: int = 0) -> Tuple[int, int]:
+        '''
+        memoryview, int -> (int, int)
+        Reads a VarInt at offset without copying the underlying buffer.
+
+        Args:
+            view: a memoryview of the serialized data
+            offset: the index of the VarInt's first byte
+        Returns:
+            the number, and the offset of the first byte after the VarInt
+        '''
+        prefix = view[offset]
+        if prefix <= 0xfc:
+            return prefix, offset + 1
+
+        if prefix == 0xfd:
+            width, minimum = 2, 0xfd
+        elif prefix == 0xfe:
+            width, minimum = 4, 0x10000
+        else:
+            width, minimum = 8, 0x100000000
 
-        ret = VarInt(
-            utils.le2i(num),
-            length=len(num) + 1 if non_compact else 0)
+        end = offset + 1 + width
+        if end > len(view):
+            raise TruncatedDataError('Malformed VarInt. Got: {}'
+                                     .format(view[offset:end].hex()))
 
-        return ret
+        number = utils.le2i(view[offset + 1:end])
+        if number < minimum and riemann.get_current_network().COMPACT_VAR_INTS:
+            raise ValueError('VarInt must be compact. Got: {}'
+                             .format(view[offset:end].hex()))
+
+        return number, end
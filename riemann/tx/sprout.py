@@ -18,8 +18,6 @@ class SproutTx(z.ZcashByteData):
     version: bytes
     hsigs: Tuple[bytes, ...]
     primary_inputs: Tuple[bytes, ...]
-    tx_id_le: bytes
-    tx_id: bytes
 
     def __init__(self,
                  version: bytes,
@@ -113,8 +111,8 @@ class SproutTx(z.ZcashByteData):
             self.hsigs = tuple()
             self.primary_inputs = tuple()
 
-        self.tx_id_le = utils.hash256(self.to_bytes())
-        self.tx_id = utils.hash256(self.to_bytes())[::-1]
+        # The tx_id is computed on first access. See tx_id_le
+        self._tx_id_le: Optional[bytes] = None
 
         self._make_immutable()
 
@@ -205,6 +203,24 @@ class SproutTx(z.ZcashByteData):
             joinsplit_pubkey=joinsplit_pubkey,
             joinsplit_sig=joinsplit_sig)
 
+    @property
+    def tx_id_le(self) -> bytes:
+        '''
+        The LE (in-protocol) tx_id. Computed on first access
+        '''
+        if self._tx_id_le is None:
+            # The tx is immutable, so the hash is never stale
+            object.__setattr__(
+                self, '_tx_id_le', utils.hash256(self.to_bytes()))
+        return self._tx_id_le
+
+    @property
+    def tx_id(self) -> bytes:
+        '''
+        The BE (block explorer or human-facing) tx_id
+        '''
+        return utils.change_endianness(self.tx_id_le)
+
     def calculate_fee(self, input_values: Sequence[int]) -> int:
         '''
         Tx, list(int) -> int
@@ -1,11 +1,25 @@
 import riemann
 from riemann import utils
 from riemann.tx import shared
-from riemann.script import serialization
-from riemann.tx.shared import ByteData, VarInt
+from riemann.script import serialization, sigops
+from riemann.tx.shared import ByteData, VarInt, read_bytes
 
 from typing import List, Optional, overload, Sequence, Tuple
 
+# Bytes outside of witnesses count 4 times towards a transaction's weight
+WITNESS_SCALE_FACTOR = 4
+
+
+def _var_int_end(data: bytes, offset: int) -> int:
+    '''
+    Returns the index of the first byte after the VarInt at offset. The VarInt
+    is assumed to be well-formed, e.g. because we serialized it ourselves.
+    '''
+    prefix = data[offset]
+    if prefix < 0xfd:
+        return offset + 1
+    return offset + 1 + (2, 4, 8)[prefix - 0xfd]
+
 
 class Outpoint(ByteData):
     '''
@@ -24,22 +38,21 @@ class Outpoint(ByteData):
         index: the 4-byte LE encoded index of the prevout in its transaction
     '''
 
-    tx_id: bytes
-    index: bytes
+    __slots__ = ()
 
     def __init__(self, tx_id: bytes, index: bytes):
-        super().__init__()
-
         self.validate_bytes(tx_id, 32)
         self.validate_bytes(index, 4)
 
-        self += tx_id
-        self += index
+        self._freeze(tx_id, index)
 
-        self.tx_id = tx_id
-        self.index = index
+    @property
+    def tx_id(self) -> bytes:
+        return self._bytes[:32]
 
-        self._make_immutable()
+    @property
+    def index(self) -> bytes:
+        return self._bytes[32:36]
 
     def copy(self,
              tx_id: Optional[bytes] = None,
@@ -61,9 +74,20 @@ class Outpoint(ByteData):
         '''
         Parse an Outpoint from a bytestring. Also available as from_hex
         '''
-        return Outpoint(
-            tx_id=byte_string[:32],
-            index=byte_string[32:36])
+        return Outpoint.from_view(memoryview(byte_string))[0]
+
+    @classmethod
+    def from_view(Outpoint,
+                  view: memoryview,
+                  offset: int = 0) -> Tuple['Outpoint', int]:
+        '''
+        Parse an Outpoint starting at offset in a memoryview. Returns the
+        Outpoint and the offset of the first byte after it.
+        '''
+        outpoint = Outpoint(
+            tx_id=read_bytes(view, offset, offset + 32),
+            index=read_bytes(view, offset + 32, offset + 36))
+        return outpoint, offset + 36
 
 
 class TxIn(ByteData):
@@ -104,41 +128,48 @@ class TxIn(ByteData):
                   used to set relative timelocks.
     '''
 
-    outpoint: Outpoint
-    stack_script: bytes
-    redeem_script: bytes
-    sequence: bytes
+    __slots__ = ('_redeem_start',)
 
     def __init__(self,
                  outpoint: Outpoint,
                  stack_script: bytes,
                  redeem_script: bytes,
                  sequence: bytes):
-        super().__init__()
-
         self.validate_bytes(outpoint, 36)
         self.validate_bytes(stack_script, None)
         self.validate_bytes(redeem_script, None)
         self.validate_bytes(sequence, 4)
 
-        if len(stack_script) + len(redeem_script) > 1650:
+        script_len = len(stack_script) + len(redeem_script)
+        if script_len > 1650:
             raise ValueError('Input script_sig is too long. '
                              'Expected <= 1650 bytes. Got {} bytes.'
-                             .format(len(stack_script) + len(redeem_script)))
+                             .format(script_len))
+
+        script_len_bytes = VarInt.encode(script_len)
+        self._freeze(
+            outpoint, script_len_bytes, stack_script, redeem_script, sequence,
+            _redeem_start=36 + len(script_len_bytes) + len(stack_script))
+
+    @property
+    def outpoint(self) -> Outpoint:
+        return Outpoint._from_parts(self._bytes[:36])
 
-        self += outpoint
-        self += VarInt(len(stack_script) + len(redeem_script))
-        self += stack_script
-        self += redeem_script
-        self += sequence
+    @property
+    def stack_script(self) -> bytes:
+        return self._bytes[_var_int_end(self._bytes, 36):self._redeem_start]
 
-        self.outpoint = outpoint
-        self.stack_script = stack_script
-        self.redeem_script = redeem_script
-        self.script_sig = self.stack_script + self.redeem_script
-        self.sequence = sequence
+    @property
+    def redeem_script(self) -> bytes:
+        return self._bytes[self._redeem_start:-4]
 
-        self._make_immutable()
+    @property
+    def script_sig(self) -> bytes:
+        return self._bytes[_var_int_end(self._bytes, 36):-4]
+
+    @property
+    def sequence(self) -> bytes:
+        return self._bytes[-4:]
 
     def copy(self,
              outpoint: Optional[Outpoint] = None,
@@ -190,17 +221,24 @@ class TxIn(ByteData):
         '''
         Parse a TxIn from a bytestring. Also available as from_hex
         '''
-        outpoint = Outpoint.from_bytes(byte_string[:36])
+        return TxIn.from_view(memoryview(byte_string))[0]
 
-        # Extract the script sig length
-        script_sig_len = VarInt.from_bytes(byte_string[36:45])
+    @classmethod
+    def from_view(TxIn,
+                  view: memoryview,
+                  offset: int = 0) -> Tuple['TxIn', int]:
+        '''
+        Parse a TxIn starting at offset in a memoryview. Returns the TxIn and
+        the offset of the first byte after it.
+        '''
+        outpoint, current = Outpoint.from_view(view, offset)
 
         # Extract the script sig
-        script_start = 36 + len(script_sig_len)
-        script_end = script_start + script_sig_len.number
-        script_sig = byte_string[script_start:script_end]
+        script_sig_len, script_start = VarInt.read(view, current)
+        script_end = script_start + script_sig_len
+        script_sig = read_bytes(view, script_start, script_end)
 
-        sequence = byte_string[script_end:script_end + 4]
+        sequence = read_bytes(view, script_end, script_end + 4)
 
         # If the script-sig is blank, both stack and redeem are blank
         if script_sig == b'':
@@ -213,11 +251,12 @@ class TxIn(ByteData):
         # Parse the script sig into stack and redeem
         else:
             stack_script, redeem_script = TxIn._parse_script_sig(script_sig)
-        return TxIn(
+        tx_in = TxIn(
             outpoint=outpoint,
             stack_script=stack_script,
             redeem_script=redeem_script,
             sequence=sequence)
+        return tx_in, script_end + 4
 
 
 class TxOut(ByteData):
@@ -239,23 +278,21 @@ class TxOut(ByteData):
         output_script: the non-length-prepended output script as a bytestring
     '''
 
-    value: bytes
-    output_script: bytes
+    __slots__ = ()
 
     def __init__(self, value: bytes, output_script: bytes):
-        super().__init__()
-
         self.validate_bytes(value, 8)
         self.validate_bytes(output_script, None)
 
-        self += value
-        self += VarInt(len(output_script))
-        self += output_script
+        self._freeze(value, VarInt.encode(len(output_script)), output_script)
 
-        self.value = value
-        self.output_script = output_script
+    @property
+    def value(self) -> bytes:
+        return self._bytes[:8]
 
-        self._make_immutable()
+    @property
+    def output_script(self) -> bytes:
+        return self._bytes[_var_int_end(self._bytes, 8):]
 
     def copy(self,
              value: Optional[bytes] = None,
@@ -273,16 +310,25 @@ class TxOut(ByteData):
         '''
         Parse a TxOut from a bytestring. Also available as from_hex
         '''
-        n = VarInt.from_bytes(byte_string[8:])
-        script_start = 8 + len(n)
-        script_end = script_start + n.number
-        if n.number < 0xfc:
-            return TxOut(
-                value=byte_string[:8],
-                output_script=byte_string[script_start:script_end])
-        else:
+        return TxOut.from_view(memoryview(byte_string))[0]
+
+    @classmethod
+    def from_view(TxOut,
+                  view: memoryview,
+                  offset: int = 0) -> Tuple['TxOut', int]:
+        '''
+        Parse a TxOut starting at offset in a memoryview. Returns the TxOut
+        and the offset of the first byte after it.
+        '''
+        if view[offset + 8] >= 0xfc:
             raise NotImplementedError(
                 'No support for abnormally long pk_scripts.')
+        script_len, script_start = VarInt.read(view, offset + 8)
+        script_end = script_start + script_len
+        tx_out = TxOut(
+            value=read_bytes(view, offset, offset + 8),
+            output_script=read_bytes(view, script_start, script_end))
+        return tx_out, script_end
 
 
 class WitnessStackItem(ByteData):
@@ -297,27 +343,36 @@ class WitnessStackItem(ByteData):
     Attributes:
         item: the raw data to be placed on the stack
     '''
-    def __init__(self, item: bytes):
-        super().__init__()
+    __slots__ = ()
 
+    def __init__(self, item: bytes):
         self.validate_bytes(item, None)
 
-        self += VarInt(len(item))
-        self += item
+        self._freeze(VarInt.encode(len(item)), item)
 
-        self.item = item
-
-        self._make_immutable()
+    @property
+    def item(self) -> bytes:
+        return self._bytes[_var_int_end(self._bytes, 0):]
 
     @classmethod
     def from_bytes(WitnessStackItem, byte_string: bytes) -> 'WitnessStackItem':
         '''
         Parse a WitnessStackItem from a bytestring. Also available as from_hex
         '''
-        n = VarInt.from_bytes(byte_string)
-        item_start = len(n)
-        item_end = item_start + n.number
-        return WitnessStackItem(byte_string[item_start:item_end])
+        return WitnessStackItem.from_view(memoryview(byte_string))[0]
+
+    @classmethod
+    def from_view(WitnessStackItem,
+                  view: memoryview,
+                  offset: int = 0) -> Tuple['WitnessStackItem', int]:
+        '''
+        Parse a WitnessStackItem starting at offset in a memoryview. Returns
+        the WitnessStackItem and the offset of the first byte after it.
+        '''
+        item_len, item_start = VarInt.read(view, offset)
+        item_end = item_start + item_len
+        item = WitnessStackItem(read_bytes(view, item_start, item_end))
+        return item, item_end
 
 
 class InputWitness(ByteData):
@@ -332,13 +387,14 @@ class InputWitness(ByteData):
     Attributes:
         stack: the ordered sequence of WitnessStackItems
     '''
+    __slots__ = ('stack',)
+
     stack: Tuple[WitnessStackItem, ...]
 
     def __init__(self, stack: Sequence[WitnessStackItem]):
         '''
         list(WitnessStackItem) -> InputWitness
         '''
-        super().__init__()
         for item in stack:
             if not isinstance(item, WitnessStackItem):
                 raise ValueError(
@@ -346,27 +402,29 @@ class InputWitness(ByteData):
                     'Expected WitnessStackItem. Got {}'
                     .format(item))
 
-        self += VarInt(len(stack))
-        for item in stack:
-            self += item
-
-        self.stack = tuple(item for item in stack)
-
-        self._make_immutable()
+        self._freeze(VarInt.encode(len(stack)), *stack, stack=tuple(stack))
 
     @classmethod
     def from_bytes(InputWitness, byte_string: bytes) -> 'InputWitness':
         '''
         Parse an InputWitness from a bytestring. Also available as from_hex
         '''
-        stack_items = VarInt.from_bytes(byte_string)
-        item_start = len(stack_items)
+        return InputWitness.from_view(memoryview(byte_string))[0]
+
+    @classmethod
+    def from_view(InputWitness,
+                  view: memoryview,
+                  offset: int = 0) -> Tuple['InputWitness', int]:
+        '''
+        Parse an InputWitness starting at offset in a memoryview. Returns the
+        InputWitness and the offset of the first byte after it.
+        '''
+        num_items, current = VarInt.read(view, offset)
         items: List[WitnessStackItem] = []
-        while len(items) < stack_items.number:
-            item = WitnessStackItem.from_bytes(byte_string[item_start:])
-            item_start += len(item)
+        for _ in range(num_items):
+            item, current = WitnessStackItem.from_view(view, current)
             items.append(item)
-        return InputWitness(items)
+        return InputWitness(items), current
 
     def copy(self,
              stack: Optional[List[WitnessStackItem]] = None) -> 'InputWitness':
@@ -377,6 +435,37 @@ class InputWitness(ByteData):
             stack=stack if stack is not None else self.stack)
 
 
+class SighashCache():
+    '''
+    The BIP143 digests that are shared by every input of a transaction. They
+    depend only on the transaction, so computing them once makes signing all
+    inputs linear in the number of inputs rather than quadratic.
+
+    Prefer calling `Tx.precompute_sighash_cache`, which memoizes the cache on
+    the (immutable) transaction.
+
+    Args:
+        tx: the transaction being signed
+
+    Attributes:
+        hash_prevouts: the double SHA256 of all outpoints
+        hash_sequence: the double SHA256 of all input sequence numbers
+        hash_outputs: the double SHA256 of all outputs
+    '''
+
+    hash_prevouts: bytes
+    hash_sequence: bytes
+    hash_outputs: bytes
+
+    def __init__(self, tx: 'Tx'):
+        self.hash_prevouts = utils.hash256(
+            b''.join(tx_in[:36] for tx_in in tx.tx_ins))
+        self.hash_sequence = utils.hash256(
+            b''.join(tx_in.sequence for tx_in in tx.tx_ins))
+        self.hash_outputs = utils.hash256(
+            b''.join(tx_out.to_bytes() for tx_out in tx.tx_outs))
+
+
 class Tx(ByteData):
     '''
     A complete transaction. It consists of a version, a flag that indicates the
@@ -407,7 +496,9 @@ class Tx(ByteData):
         tx_witnesses: the ordered sequence of InputWitness objects associated
                       with this transaction. Always empty in Legacy
                       transactions. In Compatibility and Segwit transactions
-                      there must be one witness per input.
+                      there must be one witness per input. A flagged tx may
+                      be made without witnesses, e.g. to compute sighashes,
+                      but its serialization can't be parsed.
         lock_time: the 4-byte LE locktime number. Setting this invokes the
                    absolute time lock system. If it is below 500,000,000 it is
                    interpreted as a blockheight before which the transaction is
@@ -444,16 +535,14 @@ class Tx(ByteData):
 
     '''
 
-    version: bytes
+    __slots__ = ('flag', 'tx_ins', 'tx_outs', 'tx_witnesses',
+                 '_tx_id_le', '_wtx_id_le', '_sighash_cache', '_weight',
+                 '_legacy_sigops')
+
     flag: Optional[bytes]
     tx_ins: Tuple[TxIn, ...]
     tx_outs: Tuple[TxOut, ...]
     tx_witnesses: Optional[Tuple[InputWitness, ...]]
-    lock_time: bytes
-    tx_id_le: bytes
-    wtx_id_le: Optional[bytes]
-    tx_id: bytes
-    wtx_id: Optional[bytes]
 
     def __init__(self,
                  version: bytes,
@@ -463,16 +552,15 @@ class Tx(ByteData):
                  tx_witnesses: Optional[Sequence[InputWitness]],
                  lock_time: bytes):
 
-        super().__init__()
-
         self.validate_bytes(version, 4)
         self.validate_bytes(lock_time, 4)
 
         if flag is not None:
-            if flag != riemann.network.SEGWIT_TX_FLAG:
+            network = riemann.get_current_network()
+            if flag != network.SEGWIT_TX_FLAG:
                 raise ValueError(
                     'Invald segwit flag. Expected None or '
-                    f'{riemann.network.SEGWIT_TX_FLAG.hex()}. '
+                    f'{network.SEGWIT_TX_FLAG.hex()}. '
                     f'Got: {flag.hex()}')
 
         if tx_witnesses is not None and len(tx_witnesses) != 0:
@@ -507,42 +595,26 @@ class Tx(ByteData):
                     'Expected instance of TxOut. Got {}'
                     .format(type(tx_out).__name__))
 
-        self += version
-        if flag is not None:
-            self += flag
-        self += VarInt(len(tx_ins))
-        for tx_in in tx_ins:
-            self += tx_in
-        self += VarInt(len(tx_outs))
-        for tx_out in tx_outs:
-            self += tx_out
-        if tx_witnesses is not None:
-            for witness in tx_witnesses:
-                self += witness
-        self += lock_time
-
-        self.version = version
-        self.flag = flag
-        self.tx_ins = tuple(tx_in for tx_in in tx_ins)
-        self.tx_outs = tuple(tx_out for tx_out in tx_outs)
-        self.tx_witnesses = \
-            tuple(wit for wit in tx_witnesses) if tx_witnesses is not None \
-            else None
-        self.lock_time = lock_time
-
-        if flag is not None:
-            self.tx_id_le = utils.hash256(self.no_witness())
-            self.wtx_id_le = utils.hash256(self.to_bytes())
-            self.tx_id = utils.change_endianness(self.tx_id_le)
-            self.wtx_id = utils.change_endianness(self.wtx_id_le)
-
-        else:
-            self.tx_id_le = utils.hash256(self.to_bytes())
-            self.tx_id = utils.change_endianness(self.tx_id_le)
-            self.wtx_id = None
-            self.wtx_le = None
-
-        self._make_immutable()
+        self._freeze(
+            version,
+            flag if flag is not None else b'',
+            VarInt.encode(len(tx_ins)),
+            *tx_ins,
+            VarInt.encode(len(tx_outs)),
+            *tx_outs,
+            *(tx_witnesses if tx_witnesses is not None else ()),
+            lock_time,
+            flag=flag,
+            tx_ins=tuple(tx_ins),
+            tx_outs=tuple(tx_outs),
+            tx_witnesses=(tuple(tx_witnesses) if tx_witnesses is not None
+                          else None),
+            # Hashes are computed on first access. See tx_id_le and wtx_id_le
+            _tx_id_le=None,
+            _wtx_id_le=None,
+            _sighash_cache=None,
+            _weight=None,
+            _legacy_sigops=None)
 
     @classmethod
     def from_hex(Tx, hex_string: str) -> 'Tx':
@@ -552,60 +624,114 @@ class Tx(ByteData):
     @classmethod
     def from_bytes(Tx, byte_string: bytes) -> 'Tx':
         '''Instantiate a Tx object from a bytestring'''
+        return Tx.from_view(memoryview(byte_string))[0]
 
+    @classmethod
+    def from_view(Tx,
+                  view: memoryview,
+                  offset: int = 0) -> Tuple['Tx', int]:
+        '''
+        Parse a Tx starting at offset in a memoryview. Walks the buffer with a
+        cursor, so no intermediate copies of the remaining data are made.
+        Returns the Tx and the offset of the first byte after it.
+        '''
+        network = riemann.get_current_network()
         # Get the version number
-        version = byte_string[0:4]
+        version = read_bytes(view, offset, offset + 4)
 
         # Check if this is a witness tx
-        if byte_string[4:6] == riemann.network.SEGWIT_TX_FLAG:
-            tx_ins_num_loc = 6
-            flag = riemann.network.SEGWIT_TX_FLAG
+        if view[offset + 4:offset + 6] == network.SEGWIT_TX_FLAG:
+            current = offset + 6
+            flag = network.SEGWIT_TX_FLAG
         else:
-            tx_ins_num_loc = 4
+            current = offset + 4
             flag = None
 
-        # Get the length of the tx_in vector
-        tx_ins = []
-        tx_ins_num = VarInt.from_bytes(byte_string[tx_ins_num_loc:])
-
-        # `current` is the index of next read
-        current = tx_ins_num_loc + len(tx_ins_num)
-
         # Deserialize all tx_ins
-        for _ in range(tx_ins_num.number):
-            tx_in = TxIn.from_bytes(byte_string[current:])
-            current += len(tx_in)
+        tx_ins = []
+        tx_ins_num, current = VarInt.read(view, current)
+        for _ in range(tx_ins_num):
+            tx_in, current = TxIn.from_view(view, current)
             tx_ins.append(tx_in)
 
-        # Get the length of the tx_out vector
-        tx_outs = []
-        tx_outs_num = VarInt.from_bytes(byte_string[current:])
-
         # Deserialize all outputs
-        current += len(tx_outs_num)
-        for _ in range(tx_outs_num.number):
-            tx_out = TxOut.from_bytes(byte_string[current:])
-            current += len(tx_out)
+        tx_outs = []
+        tx_outs_num, current = VarInt.read(view, current)
+        for _ in range(tx_outs_num):
+            tx_out, current = TxOut.from_view(view, current)
             tx_outs.append(tx_out)
 
-        # Deserialize all witnesses if necessary
+        # A flagged tx has one witness per input. Decide by the flag alone,
+        # as the view may continue past the end of the tx
         tx_witnesses: List[InputWitness] = []
-        if flag and len(byte_string[current:]) > 4:
-            tx_witnesses_num = tx_ins_num
-            for _ in range(tx_witnesses_num.number):
-                tx_witness = InputWitness.from_bytes(byte_string[current:])
-                current += len(tx_witness)
+        if flag:
+            for _ in range(tx_ins_num):
+                tx_witness, current = InputWitness.from_view(view, current)
                 tx_witnesses.append(tx_witness)
 
         # Get the lock time and return a complete tx
-        lock_time = byte_string[current:current + 4]
-        return Tx(
+        lock_time = read_bytes(view, current, current + 4)
+        t = Tx(
             version=version,
             flag=flag,
             tx_ins=tx_ins,
             tx_outs=tx_outs,
             tx_witnesses=tx_witnesses,
             lock_time=lock_time)
+        return t, current + 4
+
+    @property
+    def version(self) -> bytes:
+        return self._bytes[:4]
+
+    @property
+    def lock_time(self) -> bytes:
+        return self._bytes[-4:]
+
+    @property
+    def tx_id_le(self) -> bytes:
+        '''
+        The LE (in-protocol) tx_id. Computed on first access
+        '''
+        if self._tx_id_le is None:
+            if self.flag is not None:
+                tx_id_le = utils.hash256(self.no_witness())
+            else:
+                tx_id_le = utils.hash256(self.to_bytes())
+            # The tx is immutable, so the hash is never stale
+            object.__setattr__(self, '_tx_id_le', tx_id_le)
+        return self._tx_id_le
+
+    @property
+    def tx_id(self) -> bytes:
+        '''
+        The BE (block explorer or human-facing) tx_id
+        '''
+        return utils.change_endianness(self.tx_id_le)
+
+    @property
+    def wtx_id_le(self) -> Optional[bytes]:
+        '''
+        The LE (in-protocol) wtx_id. Computed on first access. None for
+        Legacy transactions
+        '''
+        if self.flag is None:
+            return None
+        if self._wtx_id_le is None:
+            object.__setattr__(
+                self, '_wtx_id_le', utils.hash256(self.to_bytes()))
+        return self._wtx_id_le
+
+    @property
+    def wtx_id(self) -> Optional[bytes]:
+        '''
+        The BE (block explorer or human-facing) wtx_id. None for Legacy
+        transactions
+        '''
+        wtx_id_le = self.wtx_id_le
+        if wtx_id_le is None:
+            return None
+        return utils.change_endianness(wtx_id_le)
 
     def no_witness(self) -> bytes:
         '''
@@ -623,6 +749,68 @@ class Tx(ByteData):
         tx += self.lock_time
         return tx
 
+    @property
+    def weight(self) -> int:
+        '''
+        The BIP141 weight: 3 times the size without witnesses, plus the
+        full size. Computed on first access, without reserializing
+        '''
+        if self._weight is None:
+            no_witness_size = len(self) - len(self.flag or b'') - sum(
+                len(witness) for witness in self.tx_witnesses or ())
+            object.__setattr__(
+                self, '_weight',
+                no_witness_size * (WITNESS_SCALE_FACTOR - 1) + len(self))
+        return self._weight
+
+    @property
+    def vsize(self) -> int:
+        '''The virtual size: the weight divided by 4, rounded up'''
+        return -(-self.weight // WITNESS_SCALE_FACTOR)
+
+    @property
+    def legacy_sigops(self) -> int:
+        '''
+        The sigops in the script sigs and output scripts, counting each
+        multisig as 20, as in Bitcoin's GetLegacySigOpCount. Computed on
+        first access
+        '''
+        if self._legacy_sigops is None:
+            object.__setattr__(
+                self, '_legacy_sigops',
+                sum(sigops.count_sigops(tx_in.script_sig)
+                    for tx_in in self.tx_ins)
+                + sum(sigops.count_sigops(tx_out.output_script)
+                      for tx_out in self.tx_outs))
+        return self._legacy_sigops
+
+    def sigop_cost(self,
+                   prevout_scripts: Optional[Sequence[bytes]] = None) -> int:
+        '''
+        The sigop cost, as in Bitcoin's GetTransactionSigOpCost. Legacy and
+        P2SH sigops cost 4, and witness sigops cost 1. The P2SH and witness
+        sigops can only be counted if the output scripts spent by each input
+        are known.
+
+        Args:
+            prevout_scripts: The output script spent by each input, in order
+        Returns:
+            The sigop cost
+        '''
+        cost = self.legacy_sigops * WITNESS_SCALE_FACTOR
+        if prevout_scripts is None:
+            return cost
+        witnesses = self.tx_witnesses or ()
+        for i, (tx_in, prev_script) in enumerate(
+                zip(self.tx_ins, prevout_scripts)):
+            script_sig = tx_in.script_sig
+            stack = witnesses[i].stack if i < len(witnesses) else ()
+            cost += (sigops.count_p2sh_sigops(script_sig, prev_script)
+                     * WITNESS_SCALE_FACTOR)
+            cost += sigops.count_witness_sigops(
+                script_sig, prev_script, [item.item for item in stack])
+        return cost
+
     def is_witness(self) -> bool:
         '''Return True if the transaction witness flag is set'''
         return self.flag is not None or self.tx_witnesses is not None
@@ -641,6 +829,20 @@ class Tx(ByteData):
             sum(input_values) \
             - sum([utils.le2i(o.value) for o in self.tx_outs])
 
+    def precompute_sighash_cache(self) -> SighashCache:
+        '''
+        Compute the BIP143 hashPrevouts, hashSequence and hashOutputs digests.
+        They are computed once and reused by every subsequent Witness or
+        SIGHASH_FORKID `sighash_all` and `sighash_single` call on this Tx.
+
+        Returns:
+            The SighashCache for this transaction
+        '''
+        if self._sighash_cache is None:
+            # The tx is immutable, so the cache is never stale
+            object.__setattr__(self, '_sighash_cache', SighashCache(self))
+        return self._sighash_cache
+
     def sighash_none(self) -> bytes:
         '''SIGHASH_NONE is a bad idea.'''
         raise NotImplementedError('SIGHASH_NONE is a bad idea.')
@@ -664,26 +866,6 @@ class Tx(ByteData):
                   lock_time=(lock_time if lock_time is not None
                              else self.lock_time))
 
-    def _sighash_prep(self, index: int, script: bytes) -> 'Tx':
-        '''
-        Sighashes suck
-        Performs the sighash setup described here:
-        https://en.bitcoin.it/wiki/OP_CHECKSIG#How_it_works
-        https://bitcoin.stackexchange.com/questions/3374/how-to-redeem-a-basic-tx
-        We save on complexity by refusing to support OP_CODESEPARATOR
-        '''
-        # 0 out scripts in tx_ins
-        copy_tx_ins = [tx_in.copy(stack_script=b'', redeem_script=b'')
-                       for tx_in in self.tx_ins]
-
-        # NB: The script for the current transaction input in txCopy is set to
-        #     subScript (lead in by its length as a var-integer encoded!)
-        to_strip = VarInt.from_bytes(script)
-        copy_tx_ins[index] = \
-            copy_tx_ins[index].copy(redeem_script=script[len(to_strip):])
-
-        return self.copy(tx_ins=copy_tx_ins)
-
     @overload
     def sighash_all(self,
                     index: int,
@@ -771,7 +953,7 @@ class Tx(ByteData):
             The 32-byte digest to be signed.
         '''  # noqa: E501
 
-        if riemann.network.FORKID is not None:
+        if riemann.get_current_network().FORKID is not None:
             return self._sighash_forkid(index=index,
                                         script=script,
                                         prevout_value=prevout_value,
@@ -786,12 +968,11 @@ class Tx(ByteData):
                 sighash_type=shared.SIGHASH_ALL,
                 anyone_can_pay=anyone_can_pay)
 
-        copy_tx = self._sighash_prep(index=index, script=script)
-        if anyone_can_pay:
-            return self._sighash_anyone_can_pay(
-                index=index, copy_tx=copy_tx, sighash_type=shared.SIGHASH_ALL)
-
-        return self._sighash_final_hashing(copy_tx, shared.SIGHASH_ALL)
+        return self._legacy_sighashes(
+            indices=[index],
+            scripts=[script],
+            sighash_type=shared.SIGHASH_ALL,
+            anyone_can_pay=anyone_can_pay)[0]
 
     @overload
     def sighash_single(self,
@@ -903,7 +1084,7 @@ class Tx(ByteData):
             raise NotImplementedError(
                 'I refuse to implement the SIGHASH_SINGLE bug.')
 
-        if riemann.network.FORKID is not None:
+        if riemann.get_current_network().FORKID is not None:
             return self._sighash_forkid(index=index,
                                         script=script,
                                         prevout_value=prevout_value,
@@ -918,29 +1099,193 @@ class Tx(ByteData):
                 sighash_type=shared.SIGHASH_SINGLE,
                 anyone_can_pay=anyone_can_pay)
 
-        copy_tx = self._sighash_prep(index=index, script=script)
+        return self._legacy_sighashes(
+            indices=[index],
+            scripts=[script],
+            sighash_type=shared.SIGHASH_SINGLE,
+            anyone_can_pay=anyone_can_pay)[0]
 
-        # Remove outputs after the one we're signing
-        # Other tx_outs are set to -1 value and null scripts
-        copy_tx_outs = list(copy_tx.tx_outs[:index + 1])
-        copy_tx_outs = [TxOut(value=b'\xff' * 8, output_script=b'')
-                        for _ in copy_tx.tx_ins]  # Null them all
-        copy_tx_outs[index] = copy_tx.tx_outs[index]  # Fix the current one
+    def sighash_all_batch(
+            self,
+            scripts: Sequence[bytes],
+            prevout_values: Optional[Sequence[bytes]] = None,
+            anyone_can_pay: bool = False) -> List[bytes]:
+        '''
+        Calculate the SIGHASH_ALL digest of every input in one pass. This is
+        equivalent to calling `sighash_all` once per input, but shares work
+        between inputs. Legacy digests reuse one serialization of the blanked
+        inputs and of the outputs, swapping in each input's script. Witness
+        and SIGHASH_FORKID digests reuse the BIP143 `SighashCache`.
 
-        # Other tx_ins sequence numbers are set to 0
-        copy_tx_ins = [tx_in.copy(sequence=b'\x00\x00\x00\x00')
-                       for tx_in in copy_tx.tx_ins]  # Set all to 0
-        copy_tx_ins[index] = copy_tx.tx_ins[index]  # Fix the current one
+        Args:
+            scripts: The length-prepended script associated with the TXO
+                     being spent by each input, in input order
+            prevout_values: The 8-byte LE integer-encoded value of each
+                            prevout. Required for Witness and SIGHASH_FORKID
+            anyone_can_pay: True if using the ANYONECANPAY sighash modifier
 
-        copy_tx = copy_tx.copy(
-            tx_ins=copy_tx_ins,
-            tx_outs=copy_tx_outs)
+        Returns:
+            The 32-byte digest to be signed for each input
+        '''
+        return self._sighash_batch(
+            scripts=scripts,
+            prevout_values=prevout_values,
+            sighash_type=shared.SIGHASH_ALL,
+            anyone_can_pay=anyone_can_pay)
 
-        if anyone_can_pay:  # Forward onwards
-            return self._sighash_anyone_can_pay(
-                index, copy_tx, shared.SIGHASH_SINGLE)
+    def sighash_single_batch(
+            self,
+            scripts: Sequence[bytes],
+            prevout_values: Optional[Sequence[bytes]] = None,
+            anyone_can_pay: bool = False) -> List[bytes]:
+        '''
+        Calculate the SIGHASH_SINGLE digest of every input in one pass. This is
+        equivalent to calling `sighash_single` once per input. See
+        `sighash_all_batch`.
 
-        return self._sighash_final_hashing(copy_tx, shared.SIGHASH_SINGLE)
+        Args:
+            scripts: The length-prepended script associated with the TXO
+                     being spent by each input, in input order
+            prevout_values: The 8-byte LE integer-encoded value of each
+                            prevout. Required for Witness and SIGHASH_FORKID
+            anyone_can_pay: True if using the ANYONECANPAY sighash modifier
+
+        Returns:
+            The 32-byte digest to be signed for each input
+        '''
+        if len(self.tx_ins) > len(self.tx_outs):
+            raise NotImplementedError(
+                'I refuse to implement the SIGHASH_SINGLE bug.')
+
+        return self._sighash_batch(
+            scripts=scripts,
+            prevout_values=prevout_values,
+            sighash_type=shared.SIGHASH_SINGLE,
+            anyone_can_pay=anyone_can_pay)
+
+    def _sighash_batch(
+            self,
+            scripts: Sequence[bytes],
+            prevout_values: Optional[Sequence[bytes]],
+            sighash_type: int,
+            anyone_can_pay: bool) -> List[bytes]:
+        '''
+        Selects between Legacy, Witness, and SIGHASH_FORKID batch sighash
+        '''
+        network = riemann.get_current_network()
+        if len(scripts) != len(self.tx_ins):
+            raise ValueError(
+                'Expected one script per input. '
+                'Got {} inputs and {} scripts.'
+                .format(len(self.tx_ins), len(scripts)))
+
+        if network.FORKID is not None or self.is_witness():
+            if prevout_values is None \
+                    or len(prevout_values) != len(self.tx_ins):
+                raise ValueError(
+                    'Expected one prevout value per input. Got {} inputs.'
+                    .format(len(self.tx_ins)))
+            if network.FORKID is not None:
+                sighash = self._sighash_forkid
+            else:
+                sighash = self.segwit_sighash
+            return [sighash(index=i,
+                            script=scripts[i],
+                            prevout_value=prevout_values[i],
+                            sighash_type=sighash_type,
+                            anyone_can_pay=anyone_can_pay)
+                    for i in range(len(self.tx_ins))]
+
+        return self._legacy_sighashes(
+            indices=range(len(self.tx_ins)),
+            scripts=scripts,
+            sighash_type=sighash_type,
+            anyone_can_pay=anyone_can_pay)
+
+    @staticmethod
+    def _sighash_input(tx_in: TxIn, script: bytes) -> bytes:
+        '''
+        TxIn, bytes -> bytes
+        Serializes the signing input of a legacy sighash preimage. Its
+        script_sig is replaced by the length-prepended script.
+        '''
+        # NB: The script for the current transaction input in txCopy is set to
+        #     subScript (lead in by its length as a var-integer encoded!)
+        script = script[len(VarInt.from_bytes(script)):]
+        if len(script) > 1650:
+            raise ValueError('Input script_sig is too long. '
+                             'Expected <= 1650 bytes. Got {} bytes.'
+                             .format(len(script)))
+        return b''.join((
+            tx_in[:36],
+            VarInt(len(script)).to_bytes(),
+            script,
+            tx_in.sequence))
+
+    def _legacy_sighashes(
+            self,
+            indices: Sequence[int],
+            scripts: Sequence[bytes],
+            sighash_type: int,
+            anyone_can_pay: bool) -> List[bytes]:
+        '''
+        Sighashes suck
+        Legacy sighash of the inputs at indices, signing with the matching
+        script. Rather than building a modified copy of the Tx, the preimage
+        is written directly from this Tx's components. The blanked inputs and
+        the outputs are serialized once, and each preimage is assembled from
+        slices of them and the serialized signing input.
+        https://en.bitcoin.it/wiki/OP_CHECKSIG#How_it_works
+        https://en.bitcoin.it/wiki/OP_CHECKSIG#Procedure_for_Hashtype_SIGHASH_ANYONECANPAY
+        We save on complexity by refusing to support OP_CODESEPARATOR
+        '''
+        single = sighash_type == shared.SIGHASH_SINGLE
+        if anyone_can_pay:
+            sighash_type = sighash_type | shared.SIGHASH_ANYONECANPAY
+        hash_type = utils.i2le_padded(sighash_type, 4)
+        num_ins = len(self.tx_ins)
+        ins_count = VarInt(num_ins).to_bytes()
+
+        # Other inputs have empty scripts.
+        # SIGHASH_SINGLE also sets their sequence numbers to 0
+        # ANYONECANPAY drops them entirely
+        blank_len = 41  # outpoint, empty script, sequence
+        if not anyone_can_pay:
+            blank_ins = b''.join(
+                b''.join((tx_in[:36],
+                          b'\x00',
+                          b'\x00' * 4 if single else tx_in.sequence))
+                for tx_in in self.tx_ins)
+
+        # SIGHASH_SINGLE nulls every output except the one being signed
+        # NB: the output vector has one entry per input
+        null_out = b'\xff' * 8 + b'\x00'
+        if not single:
+            outputs = b''.join(
+                [VarInt(len(self.tx_outs)).to_bytes()]
+                + [tx_out.to_bytes() for tx_out in self.tx_outs])
+
+        digests = []
+        for index, script in zip(indices, scripts):
+            signing_in = self._sighash_input(self.tx_ins[index], script)
+            if anyone_can_pay:
+                # The txCopy input vector is resized to a length of one.
+                ins = (b'\x01', signing_in)
+            else:
+                ins = (ins_count,
+                       blank_ins[:index * blank_len],
+                       signing_in,
+                       blank_ins[(index + 1) * blank_len:])
+            if single:
+                outputs = b''.join((
+                    ins_count,
+                    null_out * index,
+                    self.tx_outs[index].to_bytes(),
+                    null_out * (num_ins - index - 1)))
+            preimage = b''.join(
+                (self.version, *ins, outputs, self.lock_time, hash_type))
+            digests.append(utils.hash256(preimage))
+        return digests
 
     def segwit_sighash(self,
                        index: int,
@@ -994,40 +1339,6 @@ class Tx(ByteData):
 
         return utils.hash256(data.to_bytes())
 
-    def _sighash_anyone_can_pay(
-            self,
-            index: int,
-            copy_tx: 'Tx',
-            sighash_type: int) -> bytes:
-        '''
-        int, byte-like, Tx, int -> bytes
-        Applies SIGHASH_ANYONECANPAY procedure.
-        Should be called by another SIGHASH procedure.
-        Not on its own.
-        https://en.bitcoin.it/wiki/OP_CHECKSIG#Procedure_for_Hashtype_SIGHASH_ANYONECANPAY
-        '''
-        # The txCopy input vector is resized to a length of one.
-        copy_tx_ins = [copy_tx.tx_ins[index]]
-        copy_tx = copy_tx.copy(tx_ins=copy_tx_ins)
-
-        return self._sighash_final_hashing(
-            copy_tx, sighash_type | shared.SIGHASH_ANYONECANPAY)
-
-    def _sighash_final_hashing(
-            self,
-            copy_tx: 'Tx',
-            sighash_type: int) -> bytes:
-        '''
-        Tx, int -> bytes
-        Returns the hash that should be signed
-        https://en.bitcoin.it/wiki/OP_CHECKSIG#Procedure_for_Hashtype_SIGHASH_ANYONECANPAY
-        '''
-        sighash = ByteData()
-        sighash += copy_tx.to_bytes()
-        sighash += utils.i2le_padded(sighash_type, 4)
-
-        return utils.hash256(sighash.to_bytes())
-
     def _hash_prevouts(self, anyone_can_pay: bool) -> bytes:
         if anyone_can_pay:
             # If the ANYONECANPAY flag is set,
@@ -1035,10 +1346,7 @@ class Tx(ByteData):
             hash_prevouts = b'\x00' * 32
         else:
             # hashPrevouts is the double SHA256 of all outpoints;
-            outpoints = ByteData()
-            for tx_in in self.tx_ins:
-                outpoints += tx_in.outpoint
-            hash_prevouts = utils.hash256(outpoints.to_bytes())
+            hash_prevouts = self.precompute_sighash_cache().hash_prevouts
         return hash_prevouts
 
     def _hash_sequence(self, sighash_type: int, anyone_can_pay: bool) -> bytes:
@@ -1056,10 +1364,7 @@ class Tx(ByteData):
             return b'\x00' * 32
         else:
             # hashSequence is the double SHA256 of nSequence of all inputs;
-            sequences = ByteData()
-            for tx_in in self.tx_ins:
-                sequences += tx_in.sequence
-            return utils.hash256(sequences.to_bytes())
+            return self.precompute_sighash_cache().hash_sequence
 
     def _hash_outputs(self, index: int, sighash_type: int) -> bytes:
         '''BIP143 hashOutputs implementation
@@ -1074,10 +1379,7 @@ class Tx(ByteData):
             # If the sighash type is ALL,
             # hashOutputs is the double SHA256 of all output amounts
             # paired up with their scriptPubKey;
-            outputs = ByteData()
-            for tx_out in self.tx_outs:
-                outputs += tx_out.to_bytes()
-            return utils.hash256(outputs.to_bytes())
+            return self.precompute_sighash_cache().hash_outputs
         elif (sighash_type == shared.SIGHASH_SINGLE
               and index < len(self.tx_outs)):
             # if sighash type is SINGLE
@@ -1093,7 +1395,7 @@ class Tx(ByteData):
             self, sighash_type: int, anyone_can_pay: bool) -> bytes:
         # The sighash type is altered to include a 24-bit fork id
         # ss << ((GetForkID() << 8) | nHashType)
-        forkid = riemann.network.FORKID << 8
+        forkid = riemann.get_current_network().FORKID << 8
         sighash = forkid | sighash_type | shared.SIGHASH_FORKID
         if anyone_can_pay:
             sighash = sighash | shared.SIGHASH_ANYONECANPAY
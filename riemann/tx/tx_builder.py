@@ -1,12 +1,28 @@
+import contextlib
 import riemann
-from riemann import utils
+from riemann import networks, utils
 from riemann.script import serialization
 from riemann.tx import tx, decred, overwinter, sapling, sprout, zcash_shared
 
-from typing import cast, List, Optional, overload
+from typing import cast, ContextManager, Dict, List, Optional, overload, \
+    Tuple, Type
 
 
-def make_sh_script_pubkey(script_bytes: bytes, witness: bool = False) -> bytes:
+def _network_scope(network: Type[networks.Network]) -> ContextManager:
+    '''
+    The Decred and Zcash classes check the current network when instantiated.
+    Selects network for the duration of the block unless it is already
+    current.
+    '''
+    if network is riemann.get_current_network():
+        return contextlib.nullcontext()
+    return riemann.network_context(network)
+
+
+def make_sh_script_pubkey(
+        script_bytes: bytes,
+        witness: bool = False,
+        network: Optional[Type[networks.Network]] = None) -> bytes:
     '''
     Make a P2SH or P2WSH script pubkey from a serialized script. Does not
     support Compatibility p2wsh-via-p2sh output scripts.
@@ -14,16 +30,18 @@ def make_sh_script_pubkey(script_bytes: bytes, witness: bool = False) -> bytes:
     Args:
         script_bytes: The serialized redeem script or witness script.
         witness: Pass True to make a P2WSH script pubkey.
+        network: The network to use. Default the current network.
     Returns:
         The script pubkey containing the hash of the serialized script.
     '''
+    network = network or riemann.get_current_network()
     output_script = bytearray()
     if witness:
         script_hash = utils.sha256(script_bytes)
-        output_script.extend(riemann.network.P2WSH_PREFIX)
+        output_script.extend(network.P2WSH_PREFIX)
         output_script.extend(script_hash)
     else:
-        script_hash = utils.hash160(script_bytes)
+        script_hash = network.HASH160(script_bytes)
         output_script.extend(b'\xa9\x14')  # OP_HASH160 PUSH0x14
         output_script.extend(script_hash)
         output_script.extend(b'\x87')  # OP_EQUAL
@@ -31,7 +49,10 @@ def make_sh_script_pubkey(script_bytes: bytes, witness: bool = False) -> bytes:
     return bytes(output_script)
 
 
-def make_sh_output_script(script_string: str, witness: bool = False) -> bytes:
+def make_sh_output_script(
+        script_string: str,
+        witness: bool = False,
+        network: Optional[Type[networks.Network]] = None) -> bytes:
     '''
     Make a P2SH or P2WSH script pubkey from a human-readable script. Does not
     support Compatibility p2wsh-via-p2sh output scripts.
@@ -39,19 +60,25 @@ def make_sh_output_script(script_string: str, witness: bool = False) -> bytes:
     Args:
         script_string: The human-readable redeem script or witness script.
         witness: Pass True to make a P2WSH script pubkey.
+        network: The network to use. Default the current network.
     Returns:
         The script pubkey containing the hash of the serialized script.
     '''
-    if witness and not riemann.network.SEGWIT:
+    network = network or riemann.get_current_network()
+    if witness and not network.SEGWIT:
         raise ValueError(
             'Network {} does not support witness scripts.'
-            .format(riemann.get_current_network_name()))
+            .format(riemann.get_network_name(network)))
 
-    script_bytes = serialization.serialize(script_string)
-    return make_sh_script_pubkey(script_bytes=script_bytes, witness=witness)
+    script_bytes = serialization.serialize(script_string, network)
+    return make_sh_script_pubkey(
+        script_bytes=script_bytes, witness=witness, network=network)
 
 
-def make_pkh_output_script(pubkey: bytes, witness: bool = False) -> bytes:
+def make_pkh_output_script(
+        pubkey: bytes,
+        witness: bool = False,
+        network: Optional[Type[networks.Network]] = None) -> bytes:
     '''
     Makes a P2PKH or P2WPKH script pubkey from a raw public key. Does not
     support Compatibility p2wpkh-via-p2sh output scripts.
@@ -59,13 +86,15 @@ def make_pkh_output_script(pubkey: bytes, witness: bool = False) -> bytes:
     Args:
         pubkey: The 33- or 65-byte public key.
         witness: Pass True to make a P2WSH script pubkey.
+        network: The network to use. Default the current network.
     Returns:
         The script pubkey containing the hash of the pubkey.
     '''
-    if witness and not riemann.network.SEGWIT:
+    network = network or riemann.get_current_network()
+    if witness and not network.SEGWIT:
         raise ValueError(
             'Network {} does not support witness scripts.'
-            .format(riemann.get_current_network_name()))
+            .format(riemann.get_network_name(network)))
 
     output_script = bytearray()
 
@@ -73,10 +102,10 @@ def make_pkh_output_script(pubkey: bytes, witness: bool = False) -> bytes:
         raise ValueError('Unknown pubkey format. '
                          'Expected bytes. Got: {}'.format(type(pubkey)))
 
-    pubkey_hash = utils.hash160(pubkey)
+    pubkey_hash = network.HASH160(pubkey)
 
     if witness:
-        output_script.extend(riemann.network.P2WPKH_PREFIX)
+        output_script.extend(network.P2WPKH_PREFIX)
         output_script.extend(pubkey_hash)
     else:
         output_script.extend(b'\x76\xa9\x14')  # OP_DUP OP_HASH160 PUSH14
@@ -85,75 +114,91 @@ def make_pkh_output_script(pubkey: bytes, witness: bool = False) -> bytes:
     return bytes(output_script)
 
 
-def make_p2sh_output_script(script_string: str) -> bytes:
+def make_p2sh_output_script(
+        script_string: str,
+        network: Optional[Type[networks.Network]] = None) -> bytes:
     '''
     Make a P2SH script pubkey from a human-readable Script.
 
     Args:
         script_string: The human-readable redeem script.
+        network: The network to use. Default the current network.
     Returns:
         The P2SH script pubkey containing the hash of the serialized script.
     '''
-    return make_sh_output_script(script_string, witness=False)
+    return make_sh_output_script(script_string, witness=False, network=network)
 
 
-def make_p2pkh_output_script(pubkey: bytes) -> bytes:
+def make_p2pkh_output_script(
+        pubkey: bytes,
+        network: Optional[Type[networks.Network]] = None) -> bytes:
     '''
     Makes a P2PKH script pubkey from a raw public key.
 
     Args:
         pubkey: The 33- or 65-byte public key.
+        network: The network to use. Default the current network.
     Returns:
         The P2PKH script pubkey containing the hash of the pubkey.
     '''
-    return make_pkh_output_script(pubkey, witness=False)
+    return make_pkh_output_script(pubkey, witness=False, network=network)
 
 
-def make_p2wsh_output_script(script_string: str) -> bytes:
+def make_p2wsh_output_script(
+        script_string: str,
+        network: Optional[Type[networks.Network]] = None) -> bytes:
     '''
     Make a P2WSH script pubkey from a human-readable Script. Does not support
     Compatibility p2wsh-via-p2sh output scripts.
 
     Args:
         script_string: The human-readable witness script.
+        network: The network to use. Default the current network.
     Returns:
         The P2WSH script pubkey containing the hash of the serialized script.
     '''
-    return make_sh_output_script(script_string, witness=True)
+    return make_sh_output_script(script_string, witness=True, network=network)
 
 
-def make_p2wpkh_output_script(pubkey: bytes) -> bytes:
+def make_p2wpkh_output_script(
+        pubkey: bytes,
+        network: Optional[Type[networks.Network]] = None) -> bytes:
     '''
     Makes a P2PKH or P2WPKH script pubkey from a raw public key. Does not
     support Compatibility p2wsh-via-p2sh output scripts.
 
     Args:
         pubkey: The 33- or 65-byte public key.
+        network: The network to use. Default the current network.
     Returns:
         The P2WPKH script pubkey containing the hash of the pubkey.
     '''
-    return make_pkh_output_script(pubkey, witness=True)
+    return make_pkh_output_script(pubkey, witness=True, network=network)
 
 
 @overload
 def _make_output(
         value: bytes,
         output_script: bytes,
-        version: bytes) -> decred.DecredTxOut:
+        version: bytes,
+        network: Optional[Type[networks.Network]] = None
+) -> decred.DecredTxOut:
     ...  # pragma: nocover
 
 
 @overload  # noqa: F811
 def _make_output(
         value: bytes,
-        output_script: bytes) -> tx.TxOut:
+        output_script: bytes,
+        network: Optional[Type[networks.Network]] = None) -> tx.TxOut:
     ...  # pragma: nocover
 
 
 def _make_output(  # noqa: F811
         value,
         output_script,
-        version=None):
+        version=None,
+        network=None):
     '''
     Instantiates a TxOut from value and output script.
 
@@ -161,22 +206,26 @@ def _make_output(  # noqa: F811
         value: The 8-byte LE-encoded integer value of the output.
         output_script: The non-length-prepended output script.
         version: Only in Decred transactions, the output version.
+        network: The network to use. Default the current network.
 
     Returns:
         The TxOut object. A DecredTxOut if version was passed in.
     '''
-    if 'decred' in riemann.get_current_network_name():
-        return decred.DecredTxOut(
-            value=value,
-            version=cast(int, version),
-            output_script=output_script)
+    network = network or riemann.get_current_network()
+    if 'decred' in network.NETWORK_NAME:
+        with _network_scope(network):
+            return decred.DecredTxOut(
+                value=value,
+                version=cast(int, version),
+                output_script=output_script)
     return tx.TxOut(value=value, output_script=output_script)
 
 
 def make_sh_output(
         value: int,
         output_script: str,
-        witness: bool = False) -> tx.TxOut:
+        witness: bool = False,
+        network: Optional[Type[networks.Network]] = None) -> tx.TxOut:
     '''
     Instantiates a P2SH or P2WSH TxOut from value and human-readable Script.
 
@@ -184,44 +233,57 @@ def make_sh_output(
         value: The 8-byte LE-encoded integer value of the output.
         output_script: The non-length-prepended human-readable Script.
         witness: Pass True to make a P2WSH script pubkey.
+        network: The network to use. Default the current network.
     Returns:
         A TxOut object
     '''
     return _make_output(
         value=utils.i2le_padded(value, 8),
-        output_script=make_sh_output_script(output_script, witness))
+        output_script=make_sh_output_script(output_script, witness, network),
+        network=network)
 
 
-def make_p2sh_output(value: int, output_script: str) -> tx.TxOut:
+def make_p2sh_output(
+        value: int,
+        output_script: str,
+        network: Optional[Type[networks.Network]] = None) -> tx.TxOut:
     '''
     Instantiates a P2SH TxOut from value and human-readable Script.
 
     Args:
         value: The 8-byte LE-encoded integer value of the output.
         output_script: The non-length-prepended output script.
+        network: The network to use. Default the current network.
     Returns:
         A TxOut object paying a P2SH script pubkey.
     '''
-    return make_sh_output(value, output_script, witness=False)
+    return make_sh_output(value, output_script, witness=False,
+                          network=network)
 
 
-def make_p2wsh_output(value: int, output_script: str) -> tx.TxOut:
+def make_p2wsh_output(
+        value: int,
+        output_script: str,
+        network: Optional[Type[networks.Network]] = None) -> tx.TxOut:
     '''
     Instantiates a P2WSH TxOut from value and human-readable Script.
 
     Args:
         value: The 8-byte LE-encoded integer value of the output.
         output_script: The non-length-prepended output script.
+        network: The network to use. Default the current network.
     Returns:
         A TxOut object paying a P2WSH script pubkey.
     '''
-    return make_sh_output(value, output_script, witness=True)
+    return make_sh_output(value, output_script, witness=True,
+                          network=network)
 
 
 def make_pkh_output(
         value: int,
         pubkey: bytes,
-        witness: bool = False) -> tx.TxOut:
+        witness: bool = False,
+        network: Optional[Type[networks.Network]] = None) -> tx.TxOut:
     '''
     Instantiates a P2PKH or P2WPKH TxOut from value and raw pubkey.
 
@@ -229,41 +291,55 @@ def make_pkh_output(
         value: The 8-byte LE-encoded integer value of the output.
         pubkey: The 33- or 65-byte raw public key.
         witness: Pass True to make a P2WPKH script pubkey.
+        network: The network to use. Default the current network.
     Returns:
         A TxOut object
     '''
     return _make_output(
         value=utils.i2le_padded(value, 8),
-        output_script=make_pkh_output_script(pubkey, witness))
+        output_script=make_pkh_output_script(pubkey, witness, network),
+        network=network)
 
 
-def make_p2pkh_output(value: int, pubkey: bytes) -> tx.TxOut:
+def make_p2pkh_output(
+        value: int,
+        pubkey: bytes,
+        network: Optional[Type[networks.Network]] = None) -> tx.TxOut:
     '''
     Instantiates a P2PKH TxOut from value and raw pubkey.
 
     Args:
         value: The 8-byte LE-encoded integer value of the output.
         pubkey: The 33- or 65-byte raw public key.
+        network: The network to use. Default the current network.
     Returns:
         A TxOut object paying a P2PKH script pubkey
     '''
-    return make_pkh_output(value, pubkey, witness=False)
+    return make_pkh_output(value, pubkey, witness=False,
+                           network=network)
 
 
-def make_p2wpkh_output(value: int, pubkey: bytes) -> tx.TxOut:
+def make_p2wpkh_output(
+        value: int,
+        pubkey: bytes,
+        network: Optional[Type[networks.Network]] = None) -> tx.TxOut:
     '''
     Instantiates a P2WPKH TxOut from value and raw pubkey.
 
     Args:
         value: The 8-byte LE-encoded integer value of the output.
         pubkey: The 33- or 65-byte raw public key.
+        network: The network to use. Default the current network.
     Returns:
         A TxOut object paying a P2WPKH script pubkey
     '''
-    return make_pkh_output(value, pubkey, witness=True)
+    return make_pkh_output(value, pubkey, witness=True,
+                           network=network)
 
 
-def make_op_return_output(data: bytes) -> tx.TxOut:
+def make_op_return_output(
+        data: bytes,
+        network: Optional[Type[networks.Network]] = None) -> tx.TxOut:
     '''
     Generates OP_RETURN output for data of up to 77 bytes. OP_RETURN outputs
     are data carriers with no impact on the UTXO set. They are comonly used to
@@ -273,6 +349,7 @@ def make_op_return_output(data: bytes) -> tx.TxOut:
 
     Args:
         data    (bytes):    data to be included in output
+        network (Network):  the network to use. Default the current network
     Returns:
         (TxOut):            TxOut object with OP_RETURN output
     '''
@@ -288,7 +365,7 @@ def make_op_return_output(data: bytes) -> tx.TxOut:
 
     pk_script.extend([len(data)])  # One byte for length of data
     pk_script.extend(data)         # Data
-    return _make_output(utils.i2le_padded(0, 8), pk_script)
+    return _make_output(utils.i2le_padded(0, 8), pk_script, network=network)
 
 
 def make_empty_witness() -> tx.InputWitness:
@@ -321,30 +398,40 @@ def make_decred_witness(
         height: bytes,
         index: bytes,
         stack_script: bytes,
-        redeem_script: bytes) -> decred.DecredInputWitness:
+        redeem_script: bytes,
+        network: Optional[Type[networks.Network]] = None
+) -> decred.DecredInputWitness:
     '''
     Decred has a unique witness structure.
     '''
-    return decred.DecredInputWitness(
-        value=value,
-        height=height,
-        index=index,
-        stack_script=stack_script,
-        redeem_script=redeem_script)
+    with _network_scope(network or riemann.get_current_network()):
+        return decred.DecredInputWitness(
+            value=value,
+            height=height,
+            index=index,
+            stack_script=stack_script,
+            redeem_script=redeem_script)
 
 
 @overload
 def make_outpoint(
-        tx_id_le: bytes, index: int, tree: int) -> decred.DecredOutpoint:
+        tx_id_le: bytes,
+        index: int,
+        tree: int,
+        network: Optional[Type[networks.Network]] = None
+) -> decred.DecredOutpoint:
     ...  # pragma: nocover
 
 
 @overload  # noqa: F811
-def make_outpoint(tx_id_le: bytes, index: int) -> tx.Outpoint:
+def make_outpoint(
+        tx_id_le: bytes,
+        index: int,
+        network: Optional[Type[networks.Network]] = None) -> tx.Outpoint:
     ...  # pragma: nocover
 
 
-def make_outpoint(tx_id_le, index, tree=None):  # noqa: F811
+def make_outpoint(tx_id_le, index, tree=None, network=None):  # noqa: F811
     '''
     Instantiate an Outpoint object from a transaction id and an index.
 
@@ -354,27 +441,34 @@ def make_outpoint(tx_id_le, index, tree=None):  # noqa: F811
         index: The index of the TxOut that created the prevout in its
                transaction's output vector
         tree: Only in Decred transactions. Specifies the commitment tree.
+        network: The network to use. Default the current network.
     Returns:
         An Outpoint object. If network is set to Decred, a DecredOutpoint
     '''
-    if 'decred' in riemann.get_current_network_name():
+    network = network or riemann.get_current_network()
+    if 'decred' in network.NETWORK_NAME:
         tree_bytes = b'\x00' if tree is None else utils.i2le_padded(tree, 1)
-        return decred.DecredOutpoint(tx_id=tx_id_le,
-                                     index=utils.i2le_padded(index, 4),
-                                     tree=tree_bytes)
+        with _network_scope(network):
+            return decred.DecredOutpoint(tx_id=tx_id_le,
+                                         index=utils.i2le_padded(index, 4),
+                                         tree=tree_bytes)
     return tx.Outpoint(tx_id=tx_id_le,
                        index=utils.i2le_padded(index, 4))
 
 
-def make_script_sig(stack_script: str, redeem_script: str) -> bytes:
+def make_script_sig(
+        stack_script: str,
+        redeem_script: str,
+        network: Optional[Type[networks.Network]] = None) -> bytes:
     '''
     Make a serialized script sig from a human-readable stack script and redeem
     script.
     '''
+    network = network or riemann.get_current_network()
     script_sig = '{} {}'.format(
         stack_script,
-        serialization.hex_serialize(redeem_script))
-    return serialization.serialize(script_sig)
+        serialization.hex_serialize(redeem_script, network))
+    return serialization.serialize(script_sig, network)
 
 
 @overload
@@ -382,7 +476,8 @@ def make_legacy_input(
         outpoint: decred.DecredOutpoint,
         stack_script: bytes,
         redeem_script: bytes,
-        sequence: int) -> decred.DecredTxIn:
+        sequence: int,
+        network: Optional[Type[networks.Network]] = None) -> decred.DecredTxIn:
     ...  # pragma: nocover
 
 
@@ -391,7 +486,8 @@ def make_legacy_input(
         outpoint: tx.Outpoint,
         stack_script: bytes,
         redeem_script: bytes,
-        sequence: int) -> tx.TxIn:
+        sequence: int,
+        network: Optional[Type[networks.Network]] = None) -> tx.TxIn:
     ...  # pragma: nocover
 
 
@@ -399,7 +495,8 @@ def make_legacy_input(  # noqa: F811
         outpoint,
         stack_script,
         redeem_script,
-        sequence):
+        sequence,
+        network=None):
     '''
     Make a legacy input. This supports creating Compatibility inputs by passing
     the witness program to `redeem_script` while passing an empty bytestring
@@ -410,13 +507,16 @@ def make_legacy_input(  # noqa: F811
         stack_script: A serialized Script program that sets the initial stack
         redeem_script: A serialized Script program that is run on the stack
         sequence: The 4-byte LE-encoded sequence number
+        network: The network to use. Default the current network.
     Returns:
         A Legacy TxIn object.
     '''
-    if 'decred' in riemann.get_current_network_name():
-        return decred.DecredTxIn(
-            outpoint=outpoint,
-            sequence=utils.i2le_padded(sequence, 4))
+    network = network or riemann.get_current_network()
+    if 'decred' in network.NETWORK_NAME:
+        with _network_scope(network):
+            return decred.DecredTxIn(
+                outpoint=outpoint,
+                sequence=utils.i2le_padded(sequence, 4))
     return tx.TxIn(outpoint=outpoint,
                    stack_script=stack_script,
                    redeem_script=redeem_script,
@@ -426,18 +526,20 @@ def make_legacy_input(  # noqa: F811
 @overload
 def make_witness_input(
         outpoint: decred.DecredOutpoint,
-        sequence: int) -> decred.DecredTxIn:
+        sequence: int,
+        network: Optional[Type[networks.Network]] = None) -> decred.DecredTxIn:
     ...  # pragma: nocover
 
 
 @overload  # noqa: F811
 def make_witness_input(
         outpoint: tx.Outpoint,
-        sequence: int) -> tx.TxIn:
+        sequence: int,
+        network: Optional[Type[networks.Network]] = None) -> tx.TxIn:
     ...  # pragma: nocover
 
 
-def make_witness_input(outpoint, sequence):  # noqa: F811
+def make_witness_input(outpoint, sequence, network=None):  # noqa: F811
     '''
     Make a Segwit input. This is clearly superior to `make_legacy_input` and
     you should use witness always.
@@ -445,13 +547,16 @@ def make_witness_input(outpoint, sequence):  # noqa: F811
     Args:
         outpoint: The Outpoint object
         sequence: The 4-byte LE-encoded sequence number
+        network: The network to use. Default the current network.
     Returns:
         A Segwit TxIn object.
     '''
-    if 'decred' in riemann.get_current_network_name():
-        return decred.DecredTxIn(
-            outpoint=outpoint,
-            sequence=utils.i2le_padded(sequence, 4))
+    network = network or riemann.get_current_network()
+    if 'decred' in network.NETWORK_NAME:
+        with _network_scope(network):
+            return decred.DecredTxIn(
+                outpoint=outpoint,
+                sequence=utils.i2le_padded(sequence, 4))
     return tx.TxIn(outpoint=outpoint,
                    stack_script=b'',
                    redeem_script=b'',
@@ -460,10 +565,12 @@ def make_witness_input(outpoint, sequence):  # noqa: F811
 
 def make_decred_input(
         outpoint: decred.DecredOutpoint,
-        sequence: int) -> decred.DecredTxIn:
-    return decred.DecredTxIn(
-        outpoint=outpoint,
-        sequence=utils.i2le_padded(sequence, 4))
+        sequence: int,
+        network: Optional[Type[networks.Network]] = None) -> decred.DecredTxIn:
+    with _network_scope(network or riemann.get_current_network()):
+        return decred.DecredTxIn(
+            outpoint=outpoint,
+            sequence=utils.i2le_padded(sequence, 4))
 
 
 @overload
@@ -473,7 +580,8 @@ def make_tx(
         tx_outs: List[decred.DecredTxOut],
         lock_time: int,
         expiry: int,
-        tx_witnesses: List[decred.DecredInputWitness]) -> decred.DecredTx:
+        tx_witnesses: List[decred.DecredInputWitness],
+        network: Optional[Type[networks.Network]] = None) -> decred.DecredTx:
     ...  # pragma: nocover
 
 
@@ -486,7 +594,8 @@ def make_tx(
         tx_joinsplits: List[zcash_shared.SproutJoinsplit],
         joinsplit_pubkey: Optional[bytes],
         joinsplit_sig: Optional[bytes],
-        binding_sig: Optional[bytes]) -> sprout.SproutTx:
+        binding_sig: Optional[bytes],
+        network: Optional[Type[networks.Network]] = None) -> sprout.SproutTx:
     ...  # pragma: nocover
 
 
@@ -499,7 +608,9 @@ def make_tx(
         tx_joinsplits: List[zcash_shared.SproutJoinsplit],
         joinsplit_pubkey: Optional[bytes],
         joinsplit_sig: Optional[bytes],
-        binding_sig: Optional[bytes]) -> overwinter.OverwinterTx:
+        binding_sig: Optional[bytes],
+        network: Optional[Type[networks.Network]] = None
+) -> overwinter.OverwinterTx:
     ...  # pragma: nocover
 
 
@@ -515,7 +626,8 @@ def make_tx(
         tx_joinsplits: List[sapling.SaplingJoinsplit],
         joinsplit_pubkey: Optional[bytes],
         joinsplit_sig: Optional[bytes],
-        binding_sig: Optional[bytes]) -> sapling.SaplingTx:
+        binding_sig: Optional[bytes],
+        network: Optional[Type[networks.Network]] = None) -> sapling.SaplingTx:
     ...  # pragma: nocover
 
 
@@ -525,7 +637,8 @@ def make_tx(
         tx_ins: List[tx.TxIn],
         tx_outs: List[tx.TxOut],
         lock_time: int,
-        tx_witnesses: Optional[List[tx.InputWitness]] = None) -> tx.Tx:
+        tx_witnesses: Optional[List[tx.InputWitness]] = None,
+        network: Optional[Type[networks.Network]] = None) -> tx.Tx:
     ...  # pragma: nocover
 
 
@@ -542,7 +655,8 @@ def make_tx(  # noqa: F811
         tx_joinsplits=None,
         joinsplit_pubkey=None,
         joinsplit_sig=None,
-        binding_sig=None):
+        binding_sig=None,
+        network=None):
     '''
     Instantiate a complete Tx object from its components.
 
@@ -563,63 +677,212 @@ def make_tx(  # noqa: F811
         joinsplit_pubkey: The joinsplit pubkey. See Zcash protocol docs.
         joinsplit_sig: The joinsplit signature. See Zcash protocol docs.
         binding_sig: The binding signature. See Zcash protocol docs.
+        network: The network to use. Default the current network.
 
     Returns:
         A Tx object. DecredTx if network is set to Decred. SproutTx if set to
         Zcash Sprout. OverwinterTx if set to Zcash Overwinter. SaplingTx if set
         to Zcash Sapling.
     '''
-    n = riemann.get_current_network_name()
-    if 'decred' in n:
-        return decred.DecredTx(
-            version=utils.i2le_padded(version, 4),
-            tx_ins=tx_ins,
-            tx_outs=tx_outs,
-            lock_time=utils.i2le_padded(lock_time, 4),
-            expiry=utils.i2le_padded(expiry, 4),
-            tx_witnesses=[tx_witnesses])
-    if 'sprout' in n and tx_joinsplits is not None:
-        return sprout.SproutTx(
-            version=version,
-            tx_ins=tx_ins,
-            tx_outs=tx_outs,
-            lock_time=utils.i2le_padded(lock_time, 4),
-            tx_joinsplits=tx_joinsplits if tx_joinsplits is not None else [],
-            joinsplit_pubkey=joinsplit_pubkey,
-            joinsplit_sig=joinsplit_sig)
-    if 'overwinter' in n:
-        return overwinter.OverwinterTx(
-            tx_ins=tx_ins,
-            tx_outs=tx_outs,
-            lock_time=utils.i2le_padded(lock_time, 4),
-            expiry_height=utils.i2le_padded(expiry, 4),
-            tx_joinsplits=tx_joinsplits if tx_joinsplits is not None else [],
-            joinsplit_pubkey=joinsplit_pubkey,
-            joinsplit_sig=joinsplit_sig)
-    if 'sapling' in n:
-        return sapling.SaplingTx(
-            tx_ins=tx_ins,
-            tx_outs=tx_outs,
-            lock_time=utils.i2le_padded(lock_time, 4),
-            expiry_height=utils.i2le_padded(expiry, 4),
-            value_balance=utils.i2le_padded(value_balance, 8),
-            tx_shielded_spends=tx_shielded_spends,
-            tx_shielded_outputs=tx_shielded_outputs,
-            tx_joinsplits=tx_joinsplits,
-            joinsplit_pubkey=joinsplit_pubkey,
-            joinsplit_sig=joinsplit_sig,
-            binding_sig=binding_sig)
-    flag = riemann.network.SEGWIT_TX_FLAG \
-        if tx_witnesses is not None else None
-    return tx.Tx(version=utils.i2le_padded(version, 4),
-                 flag=flag,
-                 tx_ins=tx_ins,
-                 tx_outs=tx_outs,
-                 tx_witnesses=tx_witnesses,
-                 lock_time=utils.i2le_padded(lock_time, 4))
+    network = network or riemann.get_current_network()
+    with _network_scope(network):
+        n = network.NETWORK_NAME
+        if 'decred' in n:
+            return decred.DecredTx(
+                version=utils.i2le_padded(version, 4),
+                tx_ins=tx_ins,
+                tx_outs=tx_outs,
+                lock_time=utils.i2le_padded(lock_time, 4),
+                expiry=utils.i2le_padded(expiry, 4),
+                tx_witnesses=[tx_witnesses])
+        if 'sprout' in n and tx_joinsplits is not None:
+            return sprout.SproutTx(
+                version=version,
+                tx_ins=tx_ins,
+                tx_outs=tx_outs,
+                lock_time=utils.i2le_padded(lock_time, 4),
+                tx_joinsplits=(tx_joinsplits
+                               if tx_joinsplits is not None else []),
+                joinsplit_pubkey=joinsplit_pubkey,
+                joinsplit_sig=joinsplit_sig)
+        if 'overwinter' in n:
+            return overwinter.OverwinterTx(
+                tx_ins=tx_ins,
+                tx_outs=tx_outs,
+                lock_time=utils.i2le_padded(lock_time, 4),
+                expiry_height=utils.i2le_padded(expiry, 4),
+                tx_joinsplits=(tx_joinsplits
+                               if tx_joinsplits is not None else []),
+                joinsplit_pubkey=joinsplit_pubkey,
+                joinsplit_sig=joinsplit_sig)
+        if 'sapling' in n:
+            return sapling.SaplingTx(
+                tx_ins=tx_ins,
+                tx_outs=tx_outs,
+                lock_time=utils.i2le_padded(lock_time, 4),
+                expiry_height=utils.i2le_padded(expiry, 4),
+                value_balance=utils.i2le_padded(value_balance, 8),
+                tx_shielded_spends=tx_shielded_spends,
+                tx_shielded_outputs=tx_shielded_outputs,
+                tx_joinsplits=tx_joinsplits,
+                joinsplit_pubkey=joinsplit_pubkey,
+                joinsplit_sig=joinsplit_sig,
+                binding_sig=binding_sig)
+        flag = (network.SEGWIT_TX_FLAG
+                if tx_witnesses is not None else None)
+        return tx.Tx(version=utils.i2le_padded(version, 4),
+                     flag=flag,
+                     tx_ins=tx_ins,
+                     tx_outs=tx_outs,
+                     tx_witnesses=tx_witnesses,
+                     lock_time=utils.i2le_padded(lock_time, 4))
 
 
 def length_prepend(byte_string: bytes) -> bytes:
     '''Adds a VarInt length marker to a bytestring'''
     length = tx.VarInt(len(byte_string))
     return length.to_bytes() + byte_string
+
+
+# The size of an input outside of its witness, and the size of its witness,
+# keyed by the type of output it spends. Signatures are assumed to be 72
+# bytes, the longest DER encoding plus a sighash byte, and pubkeys to be
+# compressed
+INPUT_SIZES: Dict[str, Tuple[int, int]] = {
+    # outpoint, PUSH48 {sig} PUSH21 {pubkey}, sequence
+    'p2pkh': (32 + 4 + 1 + 107 + 4, 0),
+    # outpoint, empty script sig, sequence. A witness of {sig} {pubkey}
+    'p2wpkh': (32 + 4 + 1 + 4, 1 + 73 + 34),
+    # outpoint, PUSH16 {witness program}, sequence. A witness of {sig}
+    # {pubkey}
+    'p2sh_p2wpkh': (32 + 4 + 1 + 23 + 4, 1 + 73 + 34),
+}
+
+
+class TxSizeEstimator:
+    '''
+    Tracks the size of a bitcoin-style transaction under construction,
+    without building it. Adding or removing an input or output takes
+    constant time, so many candidate input sets can be compared cheaply.
+
+    Example:
+        estimator = TxSizeEstimator()
+        estimator.add_output(output_script)
+        estimator.add_input('p2wpkh')
+        fee = estimator.vsize * feerate
+    '''
+    __slots__ = ('num_inputs', 'num_outputs', 'num_witness_inputs',
+                 '_size', '_witness_size')
+
+    def __init__(self):
+        self.num_inputs = 0
+        self.num_outputs = 0
+        self.num_witness_inputs = 0
+        # The size of the inputs and outputs, without witnesses
+        self._size = 0
+        # The size of the witnesses of the witness inputs
+        self._witness_size = 0
+
+    def add_input(self, input_type: str) -> None:
+        '''
+        Args:
+            input_type: A key of INPUT_SIZES, e.g. 'p2wpkh'
+        '''
+        self.add_input_size(*INPUT_SIZES[input_type])
+
+    def remove_input(self, input_type: str) -> None:
+        '''
+        Args:
+            input_type: A key of INPUT_SIZES, e.g. 'p2wpkh'
+        '''
+        self.remove_input_size(*INPUT_SIZES[input_type])
+
+    def add_input_size(self, size: int, witness_size: int = 0) -> None:
+        '''
+        Args:
+            size:         The size of the input, without its witness
+            witness_size: The size of its witness, including the stack item
+                          count. 0 for inputs without witnesses
+        '''
+        self.num_inputs += 1
+        self._size += size
+        if witness_size:
+            self.num_witness_inputs += 1
+            self._witness_size += witness_size
+
+    def remove_input_size(self, size: int, witness_size: int = 0) -> None:
+        '''
+        Args:
+            size:         The size of the input, without its witness
+            witness_size: The size of its witness, including the stack item
+                          count. 0 for inputs without witnesses
+        '''
+        self.num_inputs -= 1
+        self._size -= size
+        if witness_size:
+            self.num_witness_inputs -= 1
+            self._witness_size -= witness_size
+
+    def add_output(self, output_script: bytes) -> None:
+        '''
+        Args:
+            output_script: The output's script pubkey
+        '''
+        self.add_output_size(len(output_script))
+
+    def remove_output(self, output_script: bytes) -> None:
+        '''
+        Args:
+            output_script: The output's script pubkey
+        '''
+        self.num_outputs -= 1
+        self._size -= _output_size(len(output_script))
+
+    def add_output_size(self, script_size: int) -> None:
+        '''
+        Args:
+            script_size: The length of the output's script pubkey
+        '''
+        self.num_outputs += 1
+        self._size += _output_size(script_size)
+
+    def copy(self) -> 'TxSizeEstimator':
+        '''Make an independent copy of the estimator'''
+        estimator = TxSizeEstimator()
+        for name in TxSizeEstimator.__slots__:
+            setattr(estimator, name, getattr(self, name))
+        return estimator
+
+    @property
+    def weight(self) -> int:
+        '''The weight of the transaction'''
+        # version, input and output counts, and lock time
+        size = (4 + _var_int_size(self.num_inputs)
+                + _var_int_size(self.num_outputs) + self._size + 4)
+        weight = size * tx.WITNESS_SCALE_FACTOR
+        if self.num_witness_inputs:
+            # marker and flag, and an empty witness for each other input
+            weight += (2 + self._witness_size
+                       + self.num_inputs - self.num_witness_inputs)
+        return weight
+
+    @property
+    def vsize(self) -> int:
+        '''The virtual size of the transaction'''
+        return -(-self.weight // tx.WITNESS_SCALE_FACTOR)
+
+
+def _output_size(script_size: int) -> int:
+    '''The size of an output: value, script length, and script'''
+    return 8 + _var_int_size(script_size) + script_size
+
+
+def _var_int_size(number: int) -> int:
+    '''The length of the VarInt encoding of number'''
+    if number < 0xfd:
+        return 1
+    if number <= 0xffff:
+        return 3
+    if number <= 0xffffffff:
+        return 5
+    return 9
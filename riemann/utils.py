@@ -1,7 +1,16 @@
 import hashlib
+import itertools
+import concurrent.futures
 import riemann
 from riemann import blake256 as b256
 
+from typing import Any, Callable, Iterable, List, Optional, Type, TypeVar
+
+T = TypeVar('T')
+
+# map_chunks splits the items into this many chunks per process
+_CHUNKS_PER_PROCESS = 4
+
 
 def i2le(number: int) -> bytes:
     '''
@@ -125,23 +134,51 @@ def sha256(msg_bytes: bytes) -> bytes:
     return hashlib.sha256(msg_bytes).digest()
 
 
-def hash160(msg_bytes: bytes) -> bytes:
+def hash160(
+        msg_bytes: bytes,
+        network: Optional[Type['riemann.networks.Network']] = None) -> bytes:
+    '''
+    rmd160 of the network's hash of message. sha256 for most networks,
+    blake256 for Decred. Uses the current network if network is None
+    '''
+    return (network or riemann.get_current_network()).HASH160(msg_bytes)
+
+
+def hash256(
+        msg_bytes: bytes,
+        network: Optional[Type['riemann.networks.Network']] = None) -> bytes:
+    '''
+    The network's double hash of message. sha256 of sha256 for most
+    networks, blake256 of blake256 for Decred. Uses the current network if
+    network is None
+    '''
+    return (network or riemann.get_current_network()).HASH256(msg_bytes)
+
+
+def sha256_hash160(msg_bytes: bytes) -> bytes:
     '''rmd160 of sha256 of message'''
     h = hashlib.new('ripemd160')
-    if 'decred' in riemann.get_current_network_name():
-        h.update(blake256(msg_bytes))
-        return h.digest()
-    h.update(sha256(msg_bytes))
+    h.update(hashlib.sha256(msg_bytes).digest())
     return h.digest()
 
 
-def hash256(msg_bytes: bytes) -> bytes:
+def blake256_hash160(msg_bytes: bytes) -> bytes:
+    '''rmd160 of blake256 of message'''
+    h = hashlib.new('ripemd160')
+    h.update(b256.blake_hash(msg_bytes))
+    return h.digest()
+
+
+def double_sha256(msg_bytes: bytes) -> bytes:
     '''sha256 of sha256 of message'''
-    if 'decred' in riemann.get_current_network_name():
-        return blake256(blake256(msg_bytes))
     return hashlib.sha256(hashlib.sha256(msg_bytes).digest()).digest()
 
 
+def double_blake256(msg_bytes: bytes) -> bytes:
+    '''blake256 of blake256 of message'''
+    return b256.blake_hash(b256.blake_hash(msg_bytes))
+
+
 def blake256(msg_bytes: bytes) -> bytes:
     '''blake256 digest of a message'''
     return b256.blake_hash(msg_bytes)
@@ -159,3 +196,37 @@ def blake2s(data: bytes = b'', **kwargs) -> bytes:
     b2 = hashlib.blake2s(**kwargs)
     b2.update(data)
     return b2.digest()
+
+
+def map_chunks(
+        function: Callable[..., List[T]],
+        items: Iterable[Any],
+        *args: Any,
+        processes: Optional[int] = None) -> List[T]:
+    '''
+    Calls function(chunk, *args) on chunks of items, and joins the lists it
+    returns, in order. Without processes, function is called once with all
+    the items, in the calling process. Otherwise the chunks are spread over
+    a process pool, so function must be module-level, and the items and
+    args picklable
+
+    Args:
+        function:  Takes a list of items and the args. Returns a list
+        items:     The items to split into chunks
+        args:      Passed to every call of function
+        processes: The number of worker processes. Default None
+    Returns:
+        The joined results of function
+    '''
+    if processes is None:
+        return function(items, *args)
+
+    items = list(items)
+    size = -(-len(items) // (processes * _CHUNKS_PER_PROCESS)) or 1
+    chunks = [items[i:i + size] for i in range(0, len(items), size)]
+    results: List[T] = []
+    with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+        for chunk in executor.map(
+                function, chunks, *map(itertools.repeat, args)):
+            results.extend(chunk)
+    return results
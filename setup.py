@@ -1,6 +1,13 @@
 # flake8: noqa
 
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
+
+# Optional native BLAKE-256. If it fails to build, riemann.blake256 uses its
+# pure-Python implementation instead.
+blake256_extension = Extension(
+    'riemann._blake256',
+    sources=['riemann/_blake256.c'],
+    optional=True)
 
 setup(
     name='riemann-tx',
@@ -13,8 +20,9 @@ setup(
     packages=find_packages(),
     package_dir={'riemann': 'riemann'},
     package_data={'riemann': ['py.typed']},
+    ext_modules=[blake256_extension],
     keywords = 'bitcoin litecoin cryptocurrency decred blockchain development',
-    python_requires='>=3.6',
+    python_requires='>=3.7',
     classifiers = [
         'Programming Language :: Python',
         'Programming Language :: Python :: 3 :: Only',
@@ -0,0 +1,123 @@
+'''
+Generates the unrolled BLAKE-256 compression function, _compress256, in
+riemann/blake256.py. Rerun after changing the generator, and commit the
+result.
+
+Run with:
+    python tools/gen_blake256.py [--check]
+'''
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from riemann import blake256  # noqa: E402
+
+PATH = os.path.join(os.path.dirname(__file__), '..', 'riemann', 'blake256.py')
+BEGIN = '# BEGIN GENERATED _compress256\n'
+END = '# END GENERATED _compress256\n'
+
+MASK32 = blake256._MASK32
+lanes = blake256._lanes
+
+# Masks the low 32 bits of every lane, and of the lowest 1, 2 and 3 lanes
+LANE_MASK = lanes([MASK32] * 4)
+LOW_LANES = [lanes([MASK32] * n) for n in range(4)]
+
+
+def message_lanes(words, const):
+    """ source packing message words into lanes, XORed with the constants
+        their G calls pair them with
+    """
+    terms = ['m%d' % w if lane == 0 else 'm%d_%d' % (w, lane)
+             for lane, w in enumerate(words)]
+    return '(({}) ^ 0x{:X})'.format(' | '.join(terms), lanes(const))
+
+
+def compress256_source():
+    """ source of _compress256(h, block, offset, t), which compresses the
+        64-byte block at offset with packed chain value h (the top two rows
+        of the state) and bit counter t, and returns the new chain value
+    """
+    C = blake256.BLAKE.C32
+    M = '0x%X' % LANE_MASK
+    lines = [
+        'def _compress256(h, block, offset, t, unpack=_unpack_block):',
+        '    """ compresses the 64-byte block at offset with packed chain',
+        '        value h (the top two rows of the state) and bit counter t,',
+        '        and returns the new chain value',
+        '    """',
+        '    {} = unpack(block, offset)'.format(
+            ', '.join('m%d' % i for i in range(16))),
+    ]
+    # Pre-shift each message word into the lanes it is used in
+    for w in range(16):
+        for lane in range(1, 4):
+            lines.append(
+                '    m{0}_{1} = m{0} << {2}'.format(w, lane, 64 * lane))
+    lines += [
+        '    hA, hB = h',
+        '    A = hA',
+        '    B = hB',
+        '    C = 0x%X' % lanes(C[0:4]),
+        '    lo = t & 0x%X' % MASK32,
+        '    hi = t >> 32',
+        '    D = 0x%X ^ (lo | lo << 64 | hi << 128 | hi << 192)'
+        % lanes(C[4:8]),
+    ]
+
+    def g_step(sigma, first):
+        # G's message words for the 4 columns (or diagonals), in lane order
+        xs = [sigma[2 * i] for i in first]
+        ys = [sigma[2 * i + 1] for i in first]
+        out = []
+        for words, consts, rot1, rot2 in [(xs, ys, 16, 12), (ys, xs, 8, 7)]:
+            out += [
+                '    A = (A + B + {}) & {}'.format(
+                    message_lanes(words, [C[k] for k in consts]), M),
+                '    D ^= A',
+                '    D = ((D >> {}) | (D << {})) & {}'.format(
+                    rot1, 32 - rot1, M),
+                '    C = (C + D) & {}'.format(M),
+                '    B ^= C',
+                '    B = ((B >> {}) | (B << {})) & {}'.format(
+                    rot2, 32 - rot2, M),
+            ]
+        return out
+
+    def rotate_lanes(row, n):
+        # Moves lane i to lane i - n (mod 4)
+        return '    {0} = ({0} >> {1}) | (({0} & 0x{2:X}) << {3})'.format(
+            row, 64 * n, LOW_LANES[n], 64 * (4 - n))
+
+    for r in range(14):
+        sigma = blake256.BLAKE.SIGMA[r]
+        # Columns: G calls 0-3 on lanes 0-3
+        lines += g_step(sigma, [0, 1, 2, 3])
+        # Diagonals: line v0, v5, v10, v15 (and so on) up in each lane
+        lines += [rotate_lanes('B', 1), rotate_lanes('C', 2),
+                  rotate_lanes('D', 3)]
+        lines += g_step(sigma, [4, 5, 6, 7])
+        lines += [rotate_lanes('B', 3), rotate_lanes('C', 2),
+                  rotate_lanes('D', 1)]
+
+    lines.append('    return hA ^ A ^ C, hB ^ B ^ D')
+    return '\n'.join(lines) + '\n'
+
+
+def main(argv):
+    with open(PATH) as f:
+        source = f.read()
+    start = source.index(BEGIN) + len(BEGIN)
+    end = source.index(END)
+    generated = source[:start] + compress256_source() + source[end:]
+    if '--check' in argv:
+        if generated != source:
+            sys.exit('{} is out of date. Rerun {}'.format(PATH, __file__))
+        return
+    with open(PATH, 'w') as f:
+        f.write(generated)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])